@@ -163,6 +163,22 @@ class Tracker(ParticleTracker):
         * ``"volume averaged"``:
             The fields experienced by a particle are a volume-average of the
             eight grid points surrounding them.
+        * ``"trilinear"``:
+            The same fields as ``"volume averaged"``, found from the
+            coefficients of the linear polynomial within the cell
+            containing each particle, which are computed from the values
+            at its eight vertices on every push. Nothing is cached.
+        * ``"tricubic"``:
+            The fields are interpolated by a piecewise cubic polynomial
+            which is continuous along with its first derivatives, giving
+            smoother deflections than ``"volume averaged"``. Each field
+            and seven of its derivatives are computed once at every grid
+            vertex and cached on the grid (8 values per vertex), and the
+            64 coefficients of the cell containing each particle are
+            computed from them on every push.
+
+        The ``"trilinear"`` and ``"tricubic"`` options are only supported
+        by uniform grids.
 
     detector_hdir : `numpy.ndarray`, shape (3), optional
         A unit vector (in Cartesian coordinates) defining the horizontal
@@ -198,7 +214,7 @@ def __init__(
         dt=None,
         dt_range=None,
         field_weighting: Literal[
-            "volume averaged", "nearest neighbor"
+            "volume averaged", "nearest neighbor", "trilinear", "tricubic"
         ] = "volume averaged",
         detector_hdir=None,
         output_file: Path | None = None,
@@ -308,13 +324,17 @@ def _max_theta_hit_grid(self):
         """
         theta = np.zeros([8, self.num_grids])
 
-        for i, _grid in enumerate(self.grids):
+        for i, grid in enumerate(self.grids):
+            # Lower and upper bounds of the grid along each axis, so that
+            # the full array of grid positions is never built
+            bounds = np.stack(grid._bounds_si)  # noqa: SLF001
             ind = 0
             for x in (0, -1):
                 for y in (0, -1):
                     for z in (0, -1):
                         # Source to grid corner vector
-                        vec = self.grids_arr[i][x, y, z, :] - self.source
+                        corner = np.array([bounds[x, 0], bounds[y, 1], bounds[z, 2]])
+                        vec = corner - self.source
 
                         # Calculate angle between vec and the source-to-detector
                         # axis, which is the central axis of the particle beam
@@ -332,6 +352,14 @@ def _log(self, msg) -> None:
             # We'll need to switch from print() to using logging library
             print(msg)  # noqa: T201
 
+    def _per_particle_attributes(self) -> list[str]:
+        attributes = super()._per_particle_attributes()
+        for name in ("theta", "v_init", "x0", "coasted_particles"):
+            value = getattr(self, name, None)
+            if isinstance(value, np.ndarray) and value.ndim > 0:
+                attributes.append(name)
+        return attributes
+
     # Define some constants so they don't get constantly re-evaluated
     _c = const.c.si.value
 
@@ -754,6 +782,25 @@ def load_particles(
     # Run/push loop methods
     # *************************************************************************
 
+    def _distance_to_grid(self, grid: AbstractGrid) -> float:
+        r"""
+        The distance from the source to the nearest point of ``grid``.
+        """
+        if grid.is_uniform:
+            # The points of a uniform grid are every combination of its
+            # axes, so the nearest point is the nearest along each axis
+            axes = (grid.ax0.si.value, grid.ax1.si.value, grid.ax2.si.value)
+            offsets = [
+                np.min(np.abs(ax - source))
+                for ax, source in zip(axes, self.source, strict=True)
+            ]
+            return float(np.linalg.norm(offsets))
+
+        pts = np.stack(
+            (grid.pts0.si.value, grid.pts1.si.value, grid.pts2.si.value), axis=-1
+        )
+        return float(np.min(np.linalg.norm(pts - self.source, axis=-1)))
+
     def _coast_to_grid(self) -> None:
         r"""
         Coasts all particles to the timestep when the first particle should
@@ -761,9 +808,7 @@ def _coast_to_grid(self) -> None:
         the particles through zero fields) saves computation time.
         """
         # Distance from the source to the nearest point on any grid
-        dist = min(
-            np.min(np.linalg.norm(arr - self.source, axis=3)) for arr in self.grids_arr
-        )
+        dist = min(self._distance_to_grid(grid) for grid in self.grids)
 
         tracked_mask = self._tracked_particle_mask
 
@@ -875,7 +920,7 @@ def _remove_deflected_particles(self) -> None:
                 RuntimeWarning,
             )
 
-    def run(self) -> None:
+    def run(self, n_processes: int = 1) -> None:
         r"""
         Runs a particle-tracing simulation.
 
@@ -886,6 +931,14 @@ def run(self) -> None:
         detector plane where they can be used to construct a synthetic
         diagnostic image.
 
+        Parameters
+        ----------
+        n_processes : int, optional
+            The number of processes the particles are pushed through the
+            grids on. See
+            `~plasmapy.simulation.particle_tracker.particle_tracker.ParticleTracker.run`.
+            The default is one.
+
         Returns
         -------
         None
@@ -926,7 +979,7 @@ def run(self) -> None:
         self._coast_to_grid()
         self.coasted_particles = np.copy(self.x)
 
-        super().run()
+        super().run(n_processes=n_processes)
 
         if self.num_entered < 0.1 * self.nparticles:
             warnings.warn(
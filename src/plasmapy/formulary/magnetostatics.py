@@ -34,7 +34,8 @@ def magnetic_field(self, p: u.Quantity[u.m]) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `~astropy.units.Quantity`
-            Three-dimensional position vector.
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         Returns
         -------
@@ -78,7 +79,8 @@ def magnetic_field(self, p: u.Quantity[u.m]) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `~astropy.units.Quantity`
-            Three-dimensional position vector.
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         Returns
         -------
@@ -113,13 +115,14 @@ def magnetic_field(self, p: u.Quantity[u.m]) -> u.Quantity[u.T]:
         """
         r = p - self.p0
         m = self.moment
+        r_norm = np.linalg.norm(r, axis=-1, keepdims=True)
         B = (
             const.mu0.value
             / 4
             / np.pi
             * (
-                3 * r * np.dot(m, r) / np.linalg.norm(r) ** 5
-                - m / np.linalg.norm(r) ** 3
+                3 * r * np.sum(m * r, axis=-1, keepdims=True) / r_norm**5
+                - m / r_norm**3
             )
         )
         return B * u.T
@@ -181,7 +184,8 @@ def magnetic_field(self, p: u.Quantity[u.m], n: int = 1000) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `~astropy.units.Quantity`
-            Three-dimensional position vector.
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         n : `int`, optional
             Number of segments for Wire calculation (defaults to 1000).
@@ -242,7 +246,7 @@ def magnetic_field(self, p: u.Quantity[u.m], n: int = 1000) -> u.Quantity[u.T]:
             dl = p2 - p1
             p1 = p2
             R = p - (p2 + p1) / 2
-            B += np.cross(dl, R) / np.linalg.norm(R) ** 3
+            B += np.cross(dl, R) / np.linalg.norm(R, axis=-1, keepdims=True) ** 3
         B = B * const.mu0.value / 4 / np.pi * self.current
         return B * u.T
 
@@ -295,7 +299,8 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            Three-dimensional position vector
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         Returns
         -------
@@ -359,23 +364,27 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
         # foot of perpendicular
         p1, p2 = self.p1, self.p2
         p2_p1 = p2 - p1
-        ratio = np.dot(p - p1, p2_p1) / np.dot(p2_p1, p2_p1)
+        ratio = np.dot(p - p1, p2_p1)[..., np.newaxis] / np.dot(p2_p1, p2_p1)
         pf = p1 + p2_p1 * ratio
 
         # angles: theta_1 = <p - p1, p2 - p1>, theta_2 = <p - p2, p2 - p1>
         cos_theta_1 = (
-            np.dot(p - p1, p2_p1) / np.linalg.norm(p - p1) / np.linalg.norm(p2_p1)
-        )
+            np.dot(p - p1, p2_p1)
+            / np.linalg.norm(p - p1, axis=-1)
+            / np.linalg.norm(p2_p1)
+        )[..., np.newaxis]
         cos_theta_2 = (
-            np.dot(p - p2, p2_p1) / np.linalg.norm(p - p2) / np.linalg.norm(p2_p1)
-        )
+            np.dot(p - p2, p2_p1)
+            / np.linalg.norm(p - p2, axis=-1)
+            / np.linalg.norm(p2_p1)
+        )[..., np.newaxis]
 
         B_unit = np.cross(p2_p1, p - pf)
-        B_unit = B_unit / np.linalg.norm(B_unit)
+        B_unit = B_unit / np.linalg.norm(B_unit, axis=-1, keepdims=True)
 
         B = (
             B_unit
-            / np.linalg.norm(p - pf)
+            / np.linalg.norm(p - pf, axis=-1, keepdims=True)
             * (cos_theta_1 - cos_theta_2)
             * const.mu0.value
             / 4
@@ -437,7 +446,8 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `astropy.units.Quantity`
-            Three-dimensional position vector.
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         Returns
         -------
@@ -473,8 +483,8 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
         at point :math:`p`.
         """
         r = np.cross(self.direction, p - self.p0)
-        B_unit = r / np.linalg.norm(r)
-        r = np.linalg.norm(r)
+        B_unit = r / np.linalg.norm(r, axis=-1, keepdims=True)
+        r = np.linalg.norm(r, axis=-1, keepdims=True)
 
         return B_unit / r * const.mu0.value / 2 / np.pi * self.current * u.T
 
@@ -548,24 +558,27 @@ def __init__(
         self.axis_x = axis_x
         self.axis_y = axis_y
 
-        def curve(t):
-            if not isinstance(t, np.ndarray):
-                return (
-                    self.radius * (np.cos(t) * axis_x + np.sin(t) * axis_y)
-                    + self.center
-                )
-            t = np.expand_dims(t, 0)
-            axis_x_mat = np.expand_dims(axis_x, 1)
-            axis_y_mat = np.expand_dims(axis_y, 1)
-            return self.radius * (
-                np.matmul(axis_x_mat, np.cos(t)) + np.matmul(axis_y_mat, np.sin(t))
-            ) + np.expand_dims(self.center, 1)
-
-        self.curve = curve
-
         self.roots_legendre = scipy.special.roots_legendre(n)
         self.n = n
 
+    def curve(self, t):
+        """
+        The parametric vector equation of the wire. If ``t`` is an
+        array, the points are the columns of the returned array.
+        """
+        # This is a method rather than a closure so that wires can be pickled
+        if not isinstance(t, np.ndarray):
+            return (
+                self.radius * (np.cos(t) * self.axis_x + np.sin(t) * self.axis_y)
+                + self.center
+            )
+        t = np.expand_dims(t, 0)
+        axis_x_mat = np.expand_dims(self.axis_x, 1)
+        axis_y_mat = np.expand_dims(self.axis_y, 1)
+        return self.radius * (
+            np.matmul(axis_x_mat, np.cos(t)) + np.matmul(axis_y_mat, np.sin(t))
+        ) + np.expand_dims(self.center, 1)
+
     def magnetic_field(self, p) -> u.Quantity[u.T]:
         r"""
         Calculate magnetic field generated by this wire at position ``p``.
@@ -573,7 +586,8 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
         Parameters
         ----------
         p : `~astropy.units.Quantity`
-            Three-dimensional position vector.
+            Three-dimensional position vector, or an array of position
+            vectors with shape ``(N, 3)``.
 
         Returns
         -------
@@ -629,13 +643,13 @@ def magnetic_field(self, p) -> u.Quantity[u.T]:
             + np.matmul(np.expand_dims(self.axis_y, 1), np.expand_dims(np.cos(t), 0))
         )  # (3, n)
 
-        r = np.expand_dims(p, 1) - pt  # (3, n)
-        r_norm_3 = np.linalg.norm(r, axis=0) ** 3
-        ft = np.cross(dl, r, axisa=0, axisb=0) / np.expand_dims(r_norm_3, 1)  # (n, 3)
+        r = np.expand_dims(p, -2) - pt.T  # (..., n, 3)
+        r_norm_3 = np.linalg.norm(r, axis=-1, keepdims=True) ** 3
+        ft = np.cross(dl.T, r) / r_norm_3  # (..., n, 3)
 
         return (
             np.pi
-            * np.matmul(np.expand_dims(w, 0), ft).squeeze(0)
+            * np.einsum("i,...ij->...j", w, ft)
             * const.mu0.value
             / 4
             / np.pi
@@ -1140,6 +1140,27 @@ def _is_electron(arg: Any) -> bool:
     )
 
 
+class _StoppingPowerInterpolator:
+    """
+    Interpolator of a stopping power, returned by `stopping_power` when
+    ``return_interpolator`` is `True`.
+
+    Wraps a cubic spline of the logarithm of the stopping power in units
+    of MeV cm²/g against the logarithm of the energy in MeV.
+    """
+
+    def __init__(self, spline: CubicSpline) -> None:
+        self._spline = spline
+
+    def __call__(self, energies: u.Quantity[u.J]) -> u.Quantity[u.MeV * u.cm**2 / u.g]:
+        return (
+            np.exp(self._spline(np.log(energies.to(u.MeV).value)))
+            * u.MeV
+            * u.cm**2
+            / u.g
+        )
+
+
 @particle_input
 @validate_quantities(energies=u.MeV)
 def stopping_power(
@@ -1250,12 +1271,11 @@ def stopping_power(
             x=np.log(baseline_energies_data), y=np.log(relevant_stopping_data)
         )
 
-        # If it has been indicated that the user wants the interpolator, construct
-        # an anonymous function to handle units and sanitize IO
+        # If it has been indicated that the user wants the interpolator, wrap
+        # the spline to handle units and sanitize IO. A class is used (rather
+        # than a closure) so that the interpolator can be pickled.
         if return_interpolator:
-            return (
-                lambda x: np.exp(cs(np.log(x.to(u.MeV).value))) * u.MeV * u.cm**2 / u.g
-            )
+            return _StoppingPowerInterpolator(cs)
 
         return (
             energies,
@@ -7,26 +7,55 @@
 __all__ = [
     "AbstractGrid",
     "CartesianGrid",
+    "GridCollection",
+    "GridInterpolator",
     "NonUniformCartesianGrid",
 ]
 
 import contextlib
+import mmap
+import threading
 import warnings
 from abc import ABC, abstractmethod
-from collections import namedtuple
-from collections.abc import Iterable
+from collections import OrderedDict, namedtuple
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from functools import cached_property
+from multiprocessing import shared_memory
+from pathlib import Path
 from typing import ClassVar
 
 import astropy.units as u
+import h5py
 import numpy as np
 import pandas as pd
-import scipy.interpolate as interp
 import xarray as xr
-from scipy.spatial import distance
+from scipy.spatial import cKDTree
 
 from plasmapy.utils.decorators.helpers import modify_docstring
 
+# Shared memory blocks attached to by this process, which are kept open for
+# the lifetime of the process since arrays of the quantities of unpickled
+# grids refer to them
+_attached_shared_memory: dict[str, shared_memory.SharedMemory] = {}
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to the shared memory block with the given name."""
+    shm = _attached_shared_memory.get(name)
+    if shm is None:
+        shm = _attached_shared_memory[name] = shared_memory.SharedMemory(name=name)
+    return shm
+
+
+def _grid_subclasses(grid_class: type) -> list[type]:
+    """Return all of the subclasses of a grid class, including itself."""
+    subclasses = [grid_class]
+    subclass: type
+    for subclass in grid_class.__subclasses__():
+        subclasses.extend(_grid_subclasses(subclass))
+    return subclasses
+
 
 def _detect_is_uniform_grid(pts0, pts1, pts2, tol: float = 1e-6):
     r"""
@@ -44,6 +73,179 @@ def _detect_is_uniform_grid(pts0, pts1, pts2, tol: float = 1e-6):
     return np.allclose(variance, 0.0, atol=tol)
 
 
+class _LazyQuantity:
+    r"""
+    A quantity defined on a grid whose values remain on disk until they
+    are needed.
+
+    Values are read one chunk at a time, and the most recently used
+    chunks are kept in memory so that repeated interpolations in the same
+    region of the grid do not re-read them.
+
+    Parameters
+    ----------
+    dataset : array-like
+        An array-like object supporting `numpy`-style slicing, such as an
+        `h5py.Dataset`, a ``zarr`` array, a ``netCDF4`` variable, or a
+        `numpy.memmap`. Memory-mapped arrays are indexed directly and
+        paged in by the operating system.
+
+    unit : `~astropy.units.UnitBase`
+        The unit of the values stored in ``dataset``.
+
+    cache_size : `int`
+        The maximum number of bytes of chunks kept in memory.
+    """
+
+    # Number of elements in the chunks used for datasets that are not
+    # stored in chunks (32**3 elements for a 3D dataset)
+    _default_chunk_elements = 32**3
+
+    def __init__(self, dataset, unit, cache_size: int) -> None:
+        self.dataset = dataset
+        self.unit = unit
+        self.shape = tuple(dataset.shape)
+        self.dtype = np.dtype(dataset.dtype)
+        self.size = int(np.prod(self.shape))
+        self.cache_size = cache_size
+
+        self._chunks = self._detect_chunks(dataset)
+        self._nchunks = tuple(
+            -(-n // c) for n, c in zip(self.shape, self._chunks, strict=True)
+        )
+        self._cache: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._cache_nbytes = 0
+        # Chunks may be requested by several interpolation threads at once
+        self._cache_lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_cache_lock"]
+        state["_cache"] = OrderedDict()
+        state["_cache_nbytes"] = 0
+
+        # Memory-mapped files are reopened rather than copied
+        dataset = self.dataset
+        if (
+            isinstance(dataset, np.memmap)
+            and isinstance(dataset.base, mmap.mmap)
+            and dataset.filename is not None
+        ):
+            state["dataset"] = None
+            state["_memmap"] = (
+                dataset.filename,
+                dataset.dtype.str,
+                dataset.offset,
+                dataset.shape,
+                "r" if dataset.mode == "r" else "r+",
+            )
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        memmap_args = state.pop("_memmap", None)
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+
+        if memmap_args is not None:
+            filename, dtype, offset, shape, mode = memmap_args
+            self.dataset = np.memmap(
+                filename, dtype=dtype, mode=mode, offset=offset, shape=shape
+            )
+
+    def _detect_chunks(self, dataset) -> tuple[int, ...]:
+        """Determine the shape of the blocks in which to read the dataset."""
+        # h5py and zarr
+        chunks = getattr(dataset, "chunks", None)
+        # netCDF4 returns a list of chunk sizes, or "contiguous"
+        if chunks is None and hasattr(dataset, "chunking"):
+            chunks = dataset.chunking()
+            if isinstance(chunks, str):
+                chunks = None
+
+        if chunks is None:
+            edge = max(1, round(self._default_chunk_elements ** (1 / len(self.shape))))
+            chunks = tuple(min(n, edge) for n in self.shape)
+
+        return tuple(int(c) for c in chunks)
+
+    @property
+    def is_memory_mapped(self) -> bool:
+        """`True` if the dataset is a `numpy` array, such as a `numpy.memmap`."""
+        return isinstance(self.dataset, np.ndarray)
+
+    def read(self) -> np.ndarray:
+        """Read the entire dataset into memory."""
+        return np.asarray(self.dataset[...])
+
+    def _read_chunk(self, chunk_id: int) -> np.ndarray:
+        """Return a chunk of the dataset, reading it from disk if needed."""
+        with self._cache_lock:
+            chunk = self._cache.get(chunk_id)
+            if chunk is not None:
+                self._cache.move_to_end(chunk_id)
+                return chunk
+
+            chunk_index = np.unravel_index(chunk_id, self._nchunks)
+            slices = tuple(
+                slice(i * c, (i + 1) * c)
+                for i, c in zip(chunk_index, self._chunks, strict=True)
+            )
+            chunk = np.asarray(self.dataset[slices])
+
+            self._cache[chunk_id] = chunk
+            self._cache_nbytes += chunk.nbytes
+            while self._cache_nbytes > self.cache_size and len(self._cache) > 1:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_nbytes -= evicted.nbytes
+
+            return chunk
+
+    def take(self, indices: np.ndarray, out: np.ndarray) -> None:
+        """
+        Gather the values at the flat (C ordered) ``indices`` into ``out``,
+        reading only the chunks that contain those indices.
+        """
+        if self.is_memory_mapped:
+            out[...] = np.take(self.dataset.reshape(-1), indices)
+            return
+
+        flat_indices = indices.reshape(-1)
+        values = np.empty(flat_indices.shape, dtype=out.dtype)
+
+        multi_index = np.unravel_index(flat_indices, self.shape)
+        chunk_ids = np.ravel_multi_index(
+            tuple(i // c for i, c in zip(multi_index, self._chunks, strict=True)),
+            self._nchunks,
+        )
+
+        # Group the indices by the chunk they fall in
+        order = np.argsort(chunk_ids, kind="stable")
+        unique_ids, starts = np.unique(chunk_ids[order], return_index=True)
+        stops = np.append(starts[1:], order.size)
+
+        for chunk_id, start, stop in zip(unique_ids, starts, stops, strict=True):
+            chunk = self._read_chunk(int(chunk_id))
+            members = order[start:stop]
+            local_index = tuple(
+                i[members] % c for i, c in zip(multi_index, self._chunks, strict=True)
+            )
+            values[members] = chunk[local_index]
+
+        out[...] = values.reshape(out.shape)
+
+    def iter_blocks(self) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Iterate over the flattened dataset in blocks of whole chunks along
+        the first axis, yielding the flat index of the start of each block
+        and the values in that block.
+        """
+        step = self._chunks[0]
+        block_size = self.size // self.shape[0]
+        for i in range(0, self.shape[0], step):
+            block = np.asarray(self.dataset[i : i + step]).reshape(-1)
+            yield i * block_size, block
+
+
 class AbstractGrid(ABC):
     r"""
     Abstract grid represents a 3D grid of positions. The grid is stored
@@ -77,12 +279,29 @@ class AbstractGrid(ABC):
        In this case, any additional keyword arguments ``**kwargs`` provided
        will be passed directly to `~numpy.linspace`.
 
+    The quantities defined on the grid are stored together in a single
+    C-contiguous array owned by the grid, with one block per quantity.
+    The `~xarray.Dataset` attribute ``ds`` holds views into this array
+    rather than copies. The floating point precision of the stored
+    quantities is set by the keyword ``storage_dtype``, which may be
+    either `numpy.float64` (the default) or `numpy.float32`. Storing
+    quantities in single precision halves the memory used by the grid
+    and the memory bandwidth used by the interpolators, while results of
+    interpolation are always returned in double precision.
+
+    Quantities that are too large to hold in memory can instead be
+    added with `add_lazy_quantities`, which reads values from a dataset
+    on disk only in the regions of the grid where they are needed.
     """
 
-    def __init__(self, *seeds: Sequence[u.Quantity], num: int = 100, **kwargs) -> None:
-        # Initialize some variables
-        self._interpolator = None
-        self._is_uniform = None
+    def __init__(
+        self,
+        *seeds: Sequence[u.Quantity],
+        num: int = 100,
+        storage_dtype: np.dtype | type = np.float64,
+        **kwargs,
+    ) -> None:
+        self._init_storage(storage_dtype)
 
         # If three inputs are given, assume it's a user-provided grid
         if len(seeds) == 3:
@@ -100,6 +319,118 @@ def __init__(self, *seeds: Sequence[u.Quantity], num: int = 100, **kwargs) -> No
                 f"positional arguments but {len(seeds)} were given"
             )
 
+    def _init_storage(self, storage_dtype: np.dtype | type) -> None:
+        r"""
+        Initialize the attributes that hold the quantities defined on the
+        grid, before any coordinates or quantities are set.
+        """
+        self._interpolator = None
+        self._is_uniform = None
+
+        self._storage_dtype = np.dtype(storage_dtype)
+        if self._storage_dtype not in (np.dtype(np.float32), np.dtype(np.float64)):
+            raise ValueError(
+                "The storage_dtype of a grid must be either float32 or "
+                f"float64, but {self._storage_dtype} was given."
+            )
+
+        # All quantities added with add_quantities are stored as rows
+        # of this array, and _quantity_rows maps each key to its row
+        self._quantity_buffer = None
+        self._quantity_rows: dict[str, int] = {}
+
+        # Quantities added with add_lazy_quantities
+        self._lazy_quantities: dict[str, _LazyQuantity] = {}
+
+        # Incremented whenever quantities are added or replaced, so that
+        # interpolators know when to refresh their references to them
+        self._quantity_version = 0
+        self._quantity_key_versions: dict[str, int] = {}
+
+        # Guards state cached on the grid for interpolation, which may be
+        # accessed by several threads
+        self._interpolation_lock = threading.RLock()
+
+        # Set while the quantity storage is shared with other processes
+        # (see `_shared_quantities`)
+        self._shared_memory: shared_memory.SharedMemory | None = None
+
+    # Interpolation state cached on the grid, which is rebuilt when needed
+    # rather than pickled
+    _unpickled_caches: ClassVar[tuple[str, ...]] = (
+        "_legacy_interpolators",
+        "_vertex_derivative_cache",
+    )
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_interpolation_lock"]
+        for name in self._unpickled_caches:
+            state.pop(name, None)
+
+        # While the quantity storage is in shared memory, only a reference
+        # to the shared memory is pickled
+        buffer = self._quantity_buffer
+        if self._shared_memory is not None and buffer is not None:
+            state["_quantity_buffer"] = None
+            state["_shared_memory"] = (
+                self._shared_memory.name,
+                buffer.shape,
+                buffer.dtype.str,
+                {key: self.ds[key].attrs for key in self._quantity_rows},
+            )
+            state["ds"] = self.ds.drop_vars(list(self._quantity_rows))
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        shared = state.pop("_shared_memory")
+        self.__dict__.update(state)
+        self._interpolation_lock = threading.RLock()
+        self._shared_memory = None
+
+        if shared is not None:
+            name, shape, dtype, attrs = shared
+            self._quantity_buffer = np.ndarray(
+                shape, dtype=dtype, buffer=_attach_shared_memory(name).buf
+            )
+            dims, coords = self._quantity_dims_and_coords()
+            for key, index in self._quantity_rows.items():
+                self.ds[key] = xr.DataArray(
+                    self._quantity_buffer[index],
+                    dims=dims,
+                    coords=coords,
+                    attrs=attrs[key],
+                )
+
+    @contextlib.contextmanager
+    def _shared_quantities(self) -> Iterator[None]:
+        r"""
+        Context manager that places a copy of the quantity storage of the
+        grid in shared memory.
+
+        Within the context, pickled copies of the grid (such as those sent
+        to worker processes) refer to the shared memory instead of holding
+        their own copy of the quantities, so that the quantities are only
+        stored once however many processes use the grid. The shared memory
+        is released when the context exits.
+        """
+        if self._quantity_buffer is None or self._shared_memory is not None:
+            yield
+            return
+
+        buffer = self._quantity_buffer
+        shm = shared_memory.SharedMemory(create=True, size=max(buffer.nbytes, 1))
+        try:
+            shared = np.ndarray(buffer.shape, dtype=buffer.dtype, buffer=shm.buf)
+            shared[...] = buffer
+            del shared
+            self._shared_memory = shm
+            yield
+        finally:
+            self._shared_memory = None
+            shm.close()
+            shm.unlink()
+
     def _validate(self) -> bool:
         r"""
         Checks to make sure that the grid parameters are
@@ -249,23 +580,28 @@ def __repr__(self) -> str:
             s += "-None-\n"
         else:
             for key in rkeys:
-                unit = self.ds[key].attrs["unit"]
-                dtype = self.ds[key].dtype
-                shape = self.ds[key].shape
-                s += f"\t-> {key} ({unit}) {dtype} {shape} \n"
+                s += self._quantity_summary(key)
 
         s += line_sep + "Unrecognized Quantities:\n"
         if not nrkeys:
             s += "-None-\n"
         else:
             for key in nrkeys:
-                unit = self.ds[key].attrs["unit"]
-                dtype = self.ds[key].dtype
-                shape = self.ds[key].shape
-                s += f"\t-> {key} ({unit}) {dtype} {shape} \n"
+                s += self._quantity_summary(key)
 
         return s
 
+    def _quantity_summary(self, key: str) -> str:
+        """A single line description of a quantity used in ``__repr__``."""
+        if key in self._lazy_quantities:
+            lazy = self._lazy_quantities[key]
+            return f"\t-> {key} ({lazy.unit}) {lazy.dtype} {lazy.shape} (on disk) \n"
+
+        unit = self.ds[key].attrs["unit"]
+        dtype = self.ds[key].dtype
+        shape = self.ds[key].shape
+        return f"\t-> {key} ({unit}) {dtype} {shape} \n"
+
     def __getitem__(self, key):
         """
         Given a key, return the corresponding array as a `~astropy.units.Quantity`.
@@ -273,9 +609,28 @@ def __getitem__(self, key):
         Returning with ``copy=False`` means that the array returned is a direct
         reference to the underlying DataArray, so changes made will be reflected
         in the underlying DataArray.
+
+        Quantities added with `add_lazy_quantities` are read from disk in
+        their entirety, and changes made to the returned array are not
+        reflected in the dataset on disk.
         """
+        if key in self._lazy_quantities:
+            lazy = self._lazy_quantities[key]
+            values = lazy.read()
+            if not self.is_uniform:
+                values = values.reshape(-1)
+            return u.Quantity(values, lazy.unit, copy=False)
+
         return u.Quantity(self.ds[key].data, self.ds[key].attrs["unit"], copy=False)
 
+    @property
+    def storage_dtype(self) -> np.dtype:
+        """
+        The floating point data type in which quantities are stored on
+        the grid.
+        """
+        return self._storage_dtype
+
     @property
     def is_uniform(self) -> bool:
         """
@@ -589,28 +944,48 @@ def _load_grid(
                 f"pts2 = {pts2.shape}."
             )
 
-        self._is_uniform = _detect_is_uniform_grid(pts0, pts1, pts2)
+        if _detect_is_uniform_grid(pts0, pts1, pts2):
+            self._set_coordinates(
+                (pts0[:, 0, 0], pts1[0, :, 0], pts2[0, 0, :]), is_uniform=True
+            )
+        else:
+            self._set_coordinates(
+                (pts0.flatten(), pts1.flatten(), pts2.flatten()), is_uniform=False
+            )
+
+    def _set_coordinates(
+        self, axes: tuple[u.Quantity, u.Quantity, u.Quantity], is_uniform: bool
+    ) -> None:
+        r"""
+        Create the dataset of the grid from its coordinates.
+
+        Parameters
+        ----------
+        axes : tuple of three 1D `~astropy.units.Quantity` arrays
+            If ``is_uniform``, the axes of the grid. Otherwise, the
+            flattened coordinates of every grid point along each axis.
+
+        is_uniform : bool
+            Whether the grid is uniform.
+        """
+        self._is_uniform = is_uniform
 
         # Create dataset
         self.ds = xr.Dataset()
 
-        self.ds.attrs["axis_units"] = [pts0.unit, pts1.unit, pts2.unit]
+        self.ds.attrs["axis_units"] = [ax.unit for ax in axes]
 
         # Store the conversion factors for each axis to SI
-        self._si_factors = [
-            pts0.unit.si.scale,
-            pts1.unit.si.scale,
-            pts2.unit.si.scale,
-        ]
+        self._si_factors = [ax.unit.si.scale for ax in axes]
 
         if self.is_uniform:
-            self.ds.coords["ax0"] = pts0[:, 0, 0]
-            self.ds.coords["ax1"] = pts1[0, :, 0]
-            self.ds.coords["ax2"] = pts2[0, 0, :]
+            self.ds.coords["ax0"] = axes[0]
+            self.ds.coords["ax1"] = axes[1]
+            self.ds.coords["ax2"] = axes[2]
 
         else:
             mdx = pd.MultiIndex.from_arrays(
-                [pts0.flatten(), pts1.flatten(), pts2.flatten()],
+                list(axes),
                 names=["ax0", "ax1", "ax2"],
             )
             self.ds.coords["ax"] = mdx
@@ -628,50 +1003,334 @@ def add_quantities(self, **kwargs: u.Quantity) -> None:
         **kwargs : key, array pairs
             The key will be used as the dataset key, while the array holds the
             quantity.
+
+        Notes
+        -----
+        The values are copied into the contiguous quantity storage of
+        the grid and cast to `storage_dtype`. Adding new quantities
+        reallocates this storage, so it is most efficient to add all of
+        the quantities in a single call. Replacing a quantity that is
+        already defined on the grid is done in place.
         """
 
-        for key, quantity in kwargs.items():
-            # Check key against a list of "known" keys with pre-defined
-            # meanings (eg. E_x, n_e) and raise a warning if a "non-standard"
-            # key is being used so the user is aware.
-            if key in self.recognized_quantities:
-                try:
-                    quantity.to(self.recognized_quantities[key].unit)
-                except u.UnitConversionError as ex:
-                    raise ValueError(
-                        f"Units provided for {key} ({quantity.unit}) "
-                        "are not compatible with the correct units "
-                        f"for that recognized key ({self.recognized_quantities[key]})."
-                    ) from ex
+        dims, coords = self._quantity_dims_and_coords()
+
+        new_quantities = {
+            key: self._validate_quantity(key, quantity)
+            for key, quantity in kwargs.items()
+        }
+
+        # Quantities added here replace any lazy quantities of the same name
+        self._quantity_version += 1
+        self._legacy_interpolators.clear()
+        for key in new_quantities:
+            self._lazy_quantities.pop(key, None)
+            self._quantity_key_versions[key] = self._quantity_version
+
+        # Quantities that already have storage are overwritten in place,
+        # while all new quantities are added with a single reallocation
+        added_keys = [key for key in new_quantities if key not in self._quantity_rows]
+        if added_keys:
+            self._grow_quantity_buffer(added_keys)
+
+        for key, quantity in new_quantities.items():
+            row = self._quantity_buffer[self._quantity_rows[key]]
+            row[...] = quantity.value
+            self.ds[key] = xr.DataArray(
+                row, dims=dims, coords=coords, attrs={"unit": quantity.unit}
+            )
 
-            else:
-                warnings.warn(
-                    f"Warning: {key} is not recognized quantity key", stacklevel=2
+        # Re-point the DataArrays of existing quantities at the new storage
+        if added_keys:
+            for key, index in self._quantity_rows.items():
+                if key not in new_quantities:
+                    self.ds[key] = xr.DataArray(
+                        self._quantity_buffer[index],
+                        dims=dims,
+                        coords=coords,
+                        attrs=self.ds[key].attrs,
+                    )
+
+    def _quantity_dims_and_coords(self) -> tuple[list[str], dict]:
+        r"""The dimensions and coordinates of the quantity DataArrays."""
+        if self.is_uniform:
+            dims = ["ax0", "ax1", "ax2"]
+            coords = {
+                "ax0": self.ds.coords["ax0"],
+                "ax1": self.ds.coords["ax1"],
+                "ax2": self.ds.coords["ax2"],
+            }
+        else:
+            dims = ["ax"]
+            coords = {"ax": self.ds.coords["ax"]}
+        return dims, coords
+
+    def _validate_quantity(self, key: str, quantity: u.Quantity) -> u.Quantity:
+        r"""
+        Check the units and shape of a quantity being added to the grid,
+        returning the quantity with the shape used to store it.
+        """
+        self._validate_unit(key, quantity.unit, stacklevel=4)
+
+        # If grid is non-uniform, flatten quantity
+        if not self.is_uniform:
+            quantity = quantity.flatten()
+
+        if quantity.shape != self.shape:
+            raise ValueError(
+                f"Shape of quantity '{key}' {quantity.shape} "
+                f"does not match the grid shape {self.shape}."
+            )
+
+        return quantity
+
+    def _validate_unit(self, key: str, unit: u.UnitBase, stacklevel: int) -> None:
+        r"""
+        Check the unit of a quantity being added to the grid against the
+        unit of the recognized quantity with the same key.
+        """
+        # Check key against a list of "known" keys with pre-defined
+        # meanings (eg. E_x, n_e) and raise a warning if a "non-standard"
+        # key is being used so the user is aware.
+        if key in self.recognized_quantities:
+            if not unit.is_equivalent(self.recognized_quantities[key].unit):
+                raise ValueError(
+                    f"Units provided for {key} ({unit}) "
+                    "are not compatible with the correct units "
+                    f"for that recognized key ({self.recognized_quantities[key]})."
                 )
 
-            if self.is_uniform:
-                dims = ["ax0", "ax1", "ax2"]
-                coords = {
-                    "ax0": self.ds.coords["ax0"],
-                    "ax1": self.ds.coords["ax1"],
-                    "ax2": self.ds.coords["ax2"],
-                }
-            # If grid is non-uniform, flatten quantity
-            else:
-                quantity = quantity.flatten()  # noqa: PLW2901
-                dims = ["ax"]
-                coords = {"ax": self.ds.coords["ax"]}
+        else:
+            warnings.warn(
+                f"Warning: {key} is not recognized quantity key", stacklevel=stacklevel
+            )
+
+    def _grow_quantity_buffer(self, keys: list[str]) -> None:
+        r"""
+        Reallocate the contiguous quantity storage with room for the
+        quantities in ``keys``, copying over the existing quantities.
+        """
+        nrows = len(self._quantity_rows)
+        buffer = np.empty((nrows + len(keys), *self.shape), dtype=self.storage_dtype)
+
+        # Existing quantities are renumbered in order, which also reclaims
+        # the rows of any quantities that have since been removed
+        rows = {}
+        for i, (key, old_row) in enumerate(self._quantity_rows.items()):
+            buffer[i] = self._quantity_buffer[old_row]
+            rows[key] = i
+
+        for i, key in enumerate(keys):
+            rows[key] = nrows + i
+
+        self._quantity_rows = rows
+        self._quantity_buffer = buffer
+
+    def add_lazy_quantities(
+        self,
+        units: dict[str, u.UnitBase] | None = None,
+        cache_size: int = 2**28,
+        **kwargs,
+    ) -> None:
+        r"""
+        Adds quantities to the grid whose values are read from disk only
+        when they are needed.
+
+        Parameters
+        ----------
+        units : `dict` of `~astropy.units.UnitBase`, optional
+            The units of the quantities, by key. The unit of a quantity
+            not listed here is taken from a ``"unit"`` attribute of the
+            dataset if one exists, or otherwise from the unit of the
+            recognized quantity with the same key.
+
+        cache_size : `int`, default: ``2**28``
+            The maximum number of bytes of each quantity kept in memory
+            between interpolations.
+
+        **kwargs : key, array-like pairs
+            The key will be used as the quantity key, while the value is
+            an array-like object supporting `numpy`-style slicing, such
+            as an `h5py.Dataset`, a ``zarr`` array, a ``netCDF4``
+            variable, or a `numpy.memmap`. A `~astropy.units.Quantity`
+            wrapping a `numpy.memmap` is also accepted. The dataset must
+            have the same number of elements as the grid, and for
+            uniform grids the same shape.
+
+        Raises
+        ------
+        ValueError
+            If the unit of a quantity cannot be determined, is not
+            compatible with the unit of the recognized quantity with the
+            same key, or if the dataset does not match the grid shape.
+
+        Notes
+        -----
+        Interpolating a lazy quantity reads only the chunks of the
+        dataset containing the grid vertices that are required, keeping
+        up to ``cache_size`` bytes of the most recently used chunks in
+        memory. Lazy quantities are never copied into the contiguous
+        quantity storage of the grid, so `storage_dtype` does not apply
+        to them.
+
+        Examples
+        --------
+        >>> import h5py  # doctest: +SKIP
+        >>> f = h5py.File("fields.h5", "r")  # doctest: +SKIP
+        >>> grid.add_lazy_quantities(B_x=f["B_x"], B_y=f["B_y"])  # doctest: +SKIP
+        """
+        units = {} if units is None else units
+
+        for key, value in kwargs.items():
+            unit = units.get(key)
+            dataset = value
+            if isinstance(value, u.Quantity):
+                unit = value.unit if unit is None else unit
+                dataset = value.value
+            if unit is None and "unit" in getattr(dataset, "attrs", {}):
+                unit = dataset.attrs["unit"]
+            if unit is None and key in self.recognized_quantities:
+                unit = self.recognized_quantities[key].unit
+            if unit is None:
+                raise ValueError(
+                    f"The unit of the lazy quantity {key} could not be "
+                    "determined. Specify it using the units keyword."
+                )
+            unit = u.Unit(unit)
 
-            if quantity.shape != self.shape:
+            self._validate_unit(key, unit, stacklevel=3)
+
+            # Check the shape without reading the dataset
+            lazy = _LazyQuantity(dataset, unit, cache_size)
+            if lazy.size != np.prod(self.shape) or (
+                self.is_uniform and lazy.shape != self.shape
+            ):
                 raise ValueError(
-                    f"Shape of quantity '{key}' {quantity.shape} "
+                    f"Shape of quantity '{key}' {lazy.shape} "
                     f"does not match the grid shape {self.shape}."
                 )
 
-            data = xr.DataArray(
-                quantity, dims=dims, coords=coords, attrs={"unit": quantity.unit}
-            )
-            self.ds[key] = data
+            # Replace any in-memory quantity of the same name
+            self._quantity_rows.pop(key, None)
+            if key in self.ds.data_vars:
+                self.ds = self.ds.drop_vars(key)
+
+            self._lazy_quantities[key] = lazy
+            self._quantity_version += 1
+            self._legacy_interpolators.clear()
+            self._quantity_key_versions[key] = self._quantity_version
+
+    def _gather(self, args, indices):
+        r"""
+        Gather the values of several quantities at the grid vertices
+        specified by ``indices``.
+
+        Parameters
+        ----------
+        args : `tuple` of `str`
+            Keys of the quantities to gather.
+
+        indices : `~numpy.ndarray` of `int`
+            Indices into the flattened (C ordered) grid arrays.
+
+        Returns
+        -------
+        `~numpy.ndarray`, shape (len(args), \*indices.shape)
+            Values of each quantity, in the units in which it is stored
+            and with the `storage_dtype` of the grid.
+        """
+        vals = np.empty((len(args), *indices.shape), dtype=self.storage_dtype)
+        for j, arg in enumerate(args):
+            _take(self._flat_source(arg), indices, vals[j])
+        return vals
+
+    def _flat_source(self, key: str):
+        r"""
+        The values of a quantity as a flat (C ordered) array with the
+        `storage_dtype` of the grid, or the `_LazyQuantity` holding them.
+        Quantities in the contiguous storage are returned as views.
+        """
+        if key in self._quantity_rows:
+            row = self._quantity_buffer[self._quantity_rows[key]]
+            # The DataArray may have been replaced by assigning directly to
+            # the dataset, in which case it no longer views the storage
+            if np.may_share_memory(self.ds[key].data, row):
+                return row.reshape(-1)
+        elif key in self._lazy_quantities:
+            return self._lazy_quantities[key]
+
+        # Quantities assigned directly to the dataset
+        return np.asarray(self.ds[key].data, dtype=self.storage_dtype).reshape(-1)
+
+    def _quantity_units(self, args) -> list:
+        r"""The units in which each of the quantities ``args`` are stored."""
+        return [
+            self._lazy_quantities[arg].unit
+            if arg in self._lazy_quantities
+            else self.ds[arg].attrs["unit"]
+            for arg in args
+        ]
+
+    def _quantity_statistics(self, key: str) -> tuple[bool, float, float]:
+        r"""
+        Summary statistics of a quantity, computed without loading lazy
+        quantities into memory all at once.
+
+        Returns
+        -------
+        all_finite : `bool`
+            `True` if every value of the quantity is finite.
+
+        max_abs : `float`
+            The maximum absolute value of the quantity.
+
+        edge_max_abs : `float`
+            The maximum absolute value of the quantity on the boundary
+            of the grid.
+        """
+        if key in self._lazy_quantities:
+            blocks = self._lazy_quantities[key].iter_blocks()
+        else:
+            blocks = iter([(0, np.asarray(self.ds[key].data).reshape(-1))])
+
+        all_finite = True
+        max_abs = 0.0
+        edge_max_abs = 0.0
+        for start, block in blocks:
+            values = np.abs(block)
+            all_finite = all_finite and bool(np.isfinite(values).all())
+            if values.size == 0:
+                continue
+            max_abs = max(max_abs, float(np.max(values)))
+
+            edge = self._boundary_mask(start, start + values.size)
+            if edge.any():
+                edge_max_abs = max(edge_max_abs, float(np.max(values[edge])))
+
+        return all_finite, max_abs, edge_max_abs
+
+    def _boundary_mask(self, start: int, stop: int) -> np.ndarray:
+        r"""
+        A mask that is `True` for each of the flat (C ordered) grid
+        indices from ``start`` to ``stop`` that lie on the boundary of
+        the grid.
+        """
+        flat = np.arange(start, stop)
+        if self.is_uniform:
+            index = np.unravel_index(flat, self.shape)
+            mask = np.zeros(flat.size, dtype=bool)
+            for i, n in zip(index, self.shape, strict=True):
+                mask |= (i == 0) | (i == n - 1)
+            return mask
+
+        # For non-uniform grids, the boundary is the set of points lying
+        # on a face of the bounding box of the grid
+        lower, upper = self._bounds_si
+        mask = np.zeros(flat.size, dtype=bool)
+        for i, unit in enumerate((self.unit0, self.unit1, self.unit2)):
+            block = (self.ds[f"ax{i}"].data[start:stop] * unit).si.value
+            mask |= (block == lower[i]) | (block == upper[i])
+        return mask
 
     @property
     def quantities(self):
@@ -679,7 +1338,152 @@ def quantities(self):
         A list of the keys corresponding to the quantities currently
         defined on the grid.
         """
-        return list(self.ds.data_vars)
+        return list(self.ds.data_vars) + list(self._lazy_quantities)
+
+    # Version of the layout of files written by save
+    _file_format_version: ClassVar[int] = 1
+
+    def save(self, path) -> None:
+        r"""
+        Save the grid, including all of its quantities, to an HDF5 file.
+
+        The file can be reopened with `load`. Quantities are written as
+        contiguous uncompressed datasets so that they can be memory
+        mapped when the grid is loaded.
+
+        Parameters
+        ----------
+        path : str or `~pathlib.Path`
+            Path of the file to write. An existing file is overwritten.
+
+        Raises
+        ------
+        `ValueError`
+            If ``path`` is the file from which quantities of the grid are
+            memory mapped, since overwriting it would invalidate them.
+        """
+        if Path(path).exists():
+            for key, lazy in self._lazy_quantities.items():
+                filename = getattr(lazy.dataset, "filename", None)
+                if filename is not None and Path(path).samefile(filename):
+                    raise ValueError(
+                        f"Cannot save the grid to {path}, from which the "
+                        f"quantity {key} is memory mapped."
+                    )
+
+        with h5py.File(path, "w") as f:
+            f.attrs["grid_class"] = self.__class__.__name__
+            f.attrs["format_version"] = self._file_format_version
+            f.attrs["is_uniform"] = bool(self.is_uniform)
+            f.attrs["storage_dtype"] = self._storage_dtype.name
+
+            axes = f.create_group("axes")
+            for i, unit in enumerate(self.units):
+                dset = axes.create_dataset(f"ax{i}", data=self.ds[f"ax{i}"].data)
+                dset.attrs["unit"] = unit.to_string()
+
+            quantities = f.create_group("quantities")
+            for key in self.quantities:
+                lazy = self._lazy_quantities.get(key)
+                if lazy is None:
+                    values = self.ds[key].data
+                    dset = quantities.create_dataset(key, data=values)
+                    dset.attrs["unit"] = self.ds[key].attrs["unit"].to_string()
+                    continue
+
+                # Copy lazy quantities block by block so they are never
+                # read into memory all at once
+                dset = quantities.create_dataset(
+                    key, shape=lazy.shape, dtype=lazy.dtype
+                )
+                flat_shape = (lazy.shape[0], lazy.size // lazy.shape[0])
+                for start, block in lazy.iter_blocks():
+                    row = start // flat_shape[1]
+                    nrows = block.size // flat_shape[1]
+                    dset[row : row + nrows] = block.reshape((nrows, *lazy.shape[1:]))
+                dset.attrs["unit"] = lazy.unit.to_string()
+
+    @classmethod
+    def load(cls, path, *, memmap: bool = True) -> "AbstractGrid":
+        r"""
+        Load a grid saved with `save`.
+
+        The coordinates saved in the file are used as is, so the checks
+        done when a grid is created from arrays of positions (such as
+        detecting whether the grid is uniform) are skipped.
+
+        Parameters
+        ----------
+        path : str or `~pathlib.Path`
+            Path of the file to read.
+
+        memmap : bool, optional
+            If `True` (the default), quantities are memory mapped from
+            the file as lazy quantities (see `add_lazy_quantities`)
+            rather than copied into memory, so loading takes the same
+            time regardless of the size of the grid and the pages of the
+            file are shared between processes that load it. If `False`,
+            the quantities are read into memory with `add_quantities`.
+
+        Returns
+        -------
+        grid : `AbstractGrid`
+            A grid of the class that was saved, which must be ``cls`` or
+            one of its subclasses.
+        """
+        with h5py.File(path, "r") as f:
+            version = int(f.attrs["format_version"])
+            if version > cls._file_format_version:
+                raise ValueError(
+                    f"The grid file {path} has format version {version}, "
+                    "which is newer than the latest version supported "
+                    f"({cls._file_format_version})."
+                )
+
+            grid_classes = {c.__name__: c for c in _grid_subclasses(AbstractGrid)}
+            grid_class = grid_classes.get(f.attrs["grid_class"])
+            if grid_class is None or not issubclass(grid_class, cls):
+                raise TypeError(
+                    f"The grid file {path} contains a "
+                    f"{f.attrs['grid_class']}, which is not a {cls.__name__}."
+                )
+
+            grid = grid_class.__new__(grid_class)
+            grid._init_storage(np.dtype(f.attrs["storage_dtype"]))  # noqa: SLF001
+            grid._set_coordinates(  # noqa: SLF001
+                tuple(
+                    f["axes"][f"ax{i}"][...] * u.Unit(f["axes"][f"ax{i}"].attrs["unit"])
+                    for i in range(3)
+                ),
+                is_uniform=bool(f.attrs["is_uniform"]),
+            )
+
+            units = {}
+            mapped = {}
+            in_memory = {}
+            for key, dset in f["quantities"].items():
+                units[key] = u.Unit(dset.attrs["unit"])
+                offset = dset.id.get_offset() if memmap else None
+                if offset is None:
+                    # Not memory mapped, or stored in a layout that cannot be
+                    # memory mapped (e.g. chunked by another writer)
+                    in_memory[key] = dset[...] * units[key]
+                else:
+                    mapped[key] = np.memmap(
+                        path,
+                        dtype=dset.dtype,
+                        mode="r",
+                        offset=offset,
+                        shape=dset.shape,
+                    )
+
+        if in_memory:
+            grid.add_quantities(**in_memory)
+        if mapped:
+            grid.add_lazy_quantities(
+                units={key: units[key] for key in mapped}, **mapped
+            )
+        return grid
 
     def _make_grid(  # noqa: C901, PLR0912
         self,
@@ -848,29 +1652,70 @@ def on_grid(self, pos):
         if hasattr(pos, "unit"):
             pos = pos.si.value
 
-        # Find the bounds
-        if self.is_uniform:
-            ax0_min, ax0_max = np.min(self.ax0.si.value), np.max(self.ax0.si.value)
-            ax1_min, ax1_max = np.min(self.ax1.si.value), np.max(self.ax1.si.value)
-            ax2_min, ax2_max = np.min(self.ax2.si.value), np.max(self.ax2.si.value)
+        # Check each point elementwise against the bounds
+        lower, upper = self._bounds_si
+        return np.all((pos >= lower) & (pos <= upper), axis=-1)
 
+    @cached_property
+    def _bounds_si(self) -> tuple[np.ndarray, np.ndarray]:
+        r"""
+        The minimum and maximum of the grid points along each axis, in SI
+        units. These are computed once, since the grid points of a grid
+        never change.
+        """
+        if self.is_uniform:
+            axes = (self.ax0.si.value, self.ax1.si.value, self.ax2.si.value)
         else:
-            pts0, pts1, pts2 = self.grids
-            ax0_min, ax0_max = np.min(self.pts0).si.value, np.max(self.pts0).si.value
-            ax1_min, ax1_max = np.min(self.pts1).si.value, np.max(self.pts1).si.value
-            ax2_min, ax2_max = np.min(self.pts2).si.value, np.max(self.pts2).si.value
+            axes = (self.pts0.si.value, self.pts1.si.value, self.pts2.si.value)
 
-        # Check each point elementwise against the bounds
-        on_grid = (
-            np.greater(ax0_min, pos[:, 0]).astype(np.int8)
-            + np.less(ax0_max, pos[:, 0]).astype(np.int8)
-            + np.greater(ax1_min, pos[:, 1]).astype(np.int8)
-            + np.less(ax1_max, pos[:, 1]).astype(np.int8)
-            + np.greater(ax2_min, pos[:, 2]).astype(np.int8)
-            + np.less(ax2_max, pos[:, 2]).astype(np.int8)
-        )
+        lower = np.array([np.min(ax) for ax in axes])
+        upper = np.array([np.max(ax) for ax in axes])
+        return lower, upper
+
+    def local_resolution(self, pos: np.ndarray | u.Quantity) -> u.Quantity:
+        r"""
+        Estimate the resolution of the grid at each of a set of positions.
+
+        Unlike ``grid_resolution``, which is the finest resolution anywhere
+        on the grid, this is the spacing of the grid points near each
+        position. The resolution at every grid point is computed once and
+        cached.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            An array of positions in space. A `~numpy.ndarray` is assumed
+            to be in meters.
+
+        Returns
+        -------
+        `~astropy.units.Quantity`, shape (n,)
+            The resolution of the grid at each position, in meters.
+        """
+        if hasattr(pos, "unit"):
+            pos = pos.si.value
+        return self._local_resolution_si(np.reshape(pos, (-1, 3))) * u.m
+
+    def _local_resolution_si(self, pos: np.ndarray) -> np.ndarray:
+        r"""
+        The resolution of the grid, in meters, at each of the positions
+        ``pos`` (an array of shape (n, 3) in meters).
+
+        By default the resolution is the same everywhere on the grid.
+        Grids whose resolution varies override this method.
+        """
+        return np.full(pos.shape[0], self._grid_resolution_si)
+
+    @property
+    @abstractmethod
+    def grid_resolution(self) -> u.Quantity:
+        r"""A scalar estimate of the finest resolution of the grid."""
+        ...
 
-        return np.where(on_grid == 0, True, False)  # noqa: FBT003
+    @cached_property
+    def _grid_resolution_si(self) -> float:
+        r"""The ``grid_resolution`` of the grid, in meters."""
+        return float(self.grid_resolution.to(u.m).value)
 
     @abstractmethod
     def vector_intersects(self, p1, p2):
@@ -883,38 +1728,224 @@ def vector_intersects(self, p1, p2):
         """
         ...
 
+    def ray_intersections(
+        self, origins: np.ndarray | u.Quantity, directions: np.ndarray | u.Quantity
+    ) -> tuple[np.ndarray, np.ndarray]:
+        r"""
+        Find where each of many lines enters and exits the bounding box
+        of the grid.
+
+        Each line is parametrized as :math:`\vec{r}(t) = \vec{r}_0 + t
+        \vec{d}`, where :math:`\vec{r}_0` is the origin and :math:`\vec{d}`
+        the direction of the line. The bounding box is the region defined
+        by `on_grid`, which is computed once and cached.
+
+        Parameters
+        ----------
+        origins : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            The origin of each line. A `~numpy.ndarray` is assumed to be
+            in meters.
+
+        directions : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            The direction of each line, which need not be normalized. A
+            `~astropy.units.Quantity` is converted to SI units, so
+            velocities may be given to find entry and exit times.
+
+        Returns
+        -------
+        t_entry, t_exit : `~numpy.ndarray`, shape (n,)
+            The parameter :math:`t` at which each line enters and exits
+            the bounding box, in units of the origins (in meters) divided
+            by the directions. For lines starting inside the box,
+            ``t_entry`` is negative. Lines that do not intersect the box
+            are assigned NaN.
+
+        Examples
+        --------
+        >>> import astropy.units as u
+        >>> import numpy as np
+        >>> from plasmapy.plasma.grids import CartesianGrid
+        >>> grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+        >>> origins = np.array([[-2.0, 0, 0], [-2.0, 5, 0]])
+        >>> directions = np.array([[1.0, 0, 0], [1.0, 0, 0]])
+        >>> grid.ray_intersections(origins, directions)
+        (array([ 1., nan]), array([ 3., nan]))
+        """
+        if isinstance(origins, u.Quantity):
+            origins = origins.to(u.m).value
+        if isinstance(directions, u.Quantity):
+            directions = directions.si.value
+        origins = np.reshape(origins, (-1, 3))
+        directions = np.reshape(directions, (-1, 3))
+
+        lower, upper = self._bounds_si
+
+        # Parameters at which each line crosses the two planes bounding
+        # each axis (the slab method)
+        parallel = directions == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_lower = (lower - origins) / directions
+            t_upper = (upper - origins) / directions
+        t_near = np.minimum(t_lower, t_upper)
+        t_far = np.maximum(t_lower, t_upper)
+
+        # Lines parallel to an axis either lie within the slab for that
+        # axis at all t, or never do
+        in_slab = (origins >= lower) & (origins <= upper)
+        t_near[parallel] = np.where(in_slab[parallel], -np.inf, np.inf)
+        t_far[parallel] = np.where(in_slab[parallel], np.inf, -np.inf)
+
+        t_entry = np.max(t_near, axis=-1)
+        t_exit = np.min(t_far, axis=-1)
+
+        # Negated so that lines with non-finite parameters are also misses
+        miss = ~(t_entry <= t_exit)
+        t_entry[miss] = np.nan
+        t_exit[miss] = np.nan
+        return t_entry, t_exit
+
+    def _segment_intersects(self, p1: u.Quantity, p2: u.Quantity) -> bool:
+        r"""
+        `True` if any part of the line segment from ``p1`` to ``p2``
+        lies within the bounding box of the grid.
+        """
+        p1, p2 = p1.si.value, p2.si.value
+        t_entry, t_exit = self.ray_intersections(p1, p2 - p1)
+        return bool(t_entry[0] <= 1 and t_exit[0] >= 0)
+
     # *************************************************************************
     # Interpolators
     # *************************************************************************
 
-    # This property holds the list of quantity keys currently being interpolated
-    # It's used in the following cached properties
-    _interp_args: ClassVar = []
+    # Interpolation methods supported by make_interpolator, mapped to the
+    # GridInterpolator subclass implementing each of them
+    _interpolator_methods: ClassVar[dict[str, type["GridInterpolator"]]] = {}
 
-    @cached_property
-    def _interp_quantities(self):
-        r"""Create a dimensionless array of quantities to be interpolated."""
-        nargs = len(self._interp_args)
-        # Load the arrays to be interpolated from and their units
-        if self.is_uniform:
-            nx, ny, nz = self.shape
-            _interp_quantities = np.zeros([nx, ny, nz, nargs])
-        else:
-            npoints = self.shape[0]
-            _interp_quantities = np.zeros([npoints, nargs])
+    def make_interpolator(
+        self,
+        quantities: str | Iterable[str],
+        method: str = "nearest neighbor",
+        *,
+        chunk_size: int | None = 2**15,
+        n_threads: int = 1,
+    ) -> "GridInterpolator":
+        r"""
+        Create a reusable interpolator for quantities defined on the grid.
 
-        for j, arg in enumerate(self._interp_args):
-            _interp_quantities[..., j] = self.ds[arg].to_numpy()
+        Parameters
+        ----------
+        quantities : `str` or ``iterable`` of `str`
+            Keys of the quantities to interpolate.
 
-        return _interp_quantities
+        method : `str`, default: ``"nearest neighbor"``
+            The interpolation scheme. Uniform grids support
+            ``"nearest neighbor"``, ``"volume averaged"``, ``"trilinear"``,
+            and ``"tricubic"``, while non-uniform grids support
+            ``"nearest neighbor"``.
+
+        chunk_size : `int` or `None`, default: ``2**15``
+            The number of positions interpolated at a time, which bounds
+            the memory used by temporary arrays. If `None`, all positions
+            are interpolated at once.
+
+        n_threads : `int`, default: 1
+            The number of threads over which chunks of positions are
+            distributed.
+
+        Returns
+        -------
+        `GridInterpolator`
+            A callable that interpolates the quantities at an array of
+            positions, returning plain `~numpy.ndarray` values in SI units.
+
+        Raises
+        ------
+        KeyError
+            If one of the quantities is not defined on the grid.
+
+        ValueError
+            If the interpolation method is not supported by this grid.
+
+        Notes
+        -----
+        The ``"trilinear"`` and ``"tricubic"`` methods compute the
+        coefficients of the polynomial interpolating each quantity within
+        the cell containing each position from the values gathered at
+        the vertices of that cell. The ``"trilinear"`` method gives the
+        same result as ``"volume averaged"``. The ``"tricubic"`` method
+        (with derivatives estimated by finite differences) has a
+        continuous gradient and typically reaches the accuracy of the
+        linear methods on a grid with far fewer cells. It needs 8 values
+        per vertex for each quantity, the quantity and seven of its
+        derivatives, which are cached on the grid until the quantity is
+        replaced with `add_quantities`.
+
+        Examples
+        --------
+        >>> import astropy.units as u
+        >>> import numpy as np
+        >>> from plasmapy.plasma.grids import CartesianGrid
+        >>> grid = CartesianGrid(-1 * u.cm, 1 * u.cm, num=21)
+        >>> grid.add_quantities(B_z=np.ones(grid.shape) * u.T)
+        >>> interpolator = grid.make_interpolator(["B_z"], method="volume averaged")
+        >>> out = np.empty((1, 2))
+        >>> interpolator(np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0]]), out=out)
+        array([[ 1., nan]])
+        """
+        if method not in self._interpolator_methods:
+            raise ValueError(
+                f"Interpolation method '{method}' is not supported by "
+                f"{self.__class__.__name__}. Supported methods are: "
+                f"{list(self._interpolator_methods)}."
+            )
+
+        if isinstance(quantities, str):
+            quantities = (quantities,)
+
+        return self._interpolator_methods[method](
+            self, quantities, chunk_size=chunk_size, n_threads=n_threads
+        )
+
+    def _legacy_interpolate(self, method: str, pos: np.ndarray, args, persistent: bool):
+        r"""
+        Interpolate with a `GridInterpolator`, returning the results as
+        `~astropy.units.Quantity` arrays in the units in which each
+        quantity is stored. Used by the ``*_interpolator`` methods.
+
+        If ``persistent`` is `True`, the interpolator of the last call with
+        the same ``method`` and ``args`` is reused. Otherwise, a new
+        interpolator is created, which reads the current quantities.
+        """
+        if not persistent:
+            interpolator = self._interpolator_methods[method](self, args, to_si=False)
+        else:
+            with self._interpolation_lock:
+                cached_args, interpolator = self._legacy_interpolators.get(
+                    method, (None, None)
+                )
+                if interpolator is None or cached_args != args:
+                    interpolator = self._interpolator_methods[method](
+                        self, args, to_si=False
+                    )
+                    self._legacy_interpolators[method] = (args, interpolator)
+
+        vals = interpolator(pos)
+        output = [
+            u.Quantity(vals[index], unit, copy=False)
+            for index, unit in enumerate(interpolator.units)
+        ]
+        return output[0] if len(output) == 1 else tuple(output)
 
     @cached_property
-    def _interp_units(self):
+    def _legacy_interpolators(
+        self,
+    ) -> dict[str, tuple[tuple[str, ...], "GridInterpolator"]]:
         r"""
-        Create a list of the units corresponding to the last dimension
-        in the `_interp_quantities` array.
+        The quantity keys and interpolator of the last persistent call of
+        each ``*_interpolator`` method, by method. Cleared whenever
+        quantities are added or replaced.
         """
-        return [self.ds[arg].attrs["unit"] for arg in self._interp_args]
+        return {}
 
     @abstractmethod
     def nearest_neighbor_interpolator(
@@ -940,8 +1971,8 @@ def nearest_neighbor_interpolator(
             contents have not changed since the last interpolation. This
             substantially speeds up the interpolation when many
             interpolations are performed on the same grid in a loop.
-            ``persistent`` overrides to `False` if the arguments list
-            has changed since the last call.
+            The interpolator is cached per method and rebuilt when the
+            quantity keys change or quantities are replaced.
         """
         ...
 
@@ -1012,51 +2043,690 @@ def _persistent_interpolator_setup(self, pos, args, persistent):
                     f"Existing keys are: {self.quantities}"
                 )
 
-        # If persistent, double check the arguments list hasn't changed
-        # If they have, run as non-persistent this time
-        if persistent and args != self._interp_args:
-            persistent = False
+        return pos, args, persistent
 
-        # Update _interp_args variable
-        self._interp_args = args
 
-        # If not persistent, clear the cached properties so they are re-created
-        # when called below
-        if not persistent:
-            with contextlib.suppress(AttributeError):
-                del self._interp_quantities
-            with contextlib.suppress(AttributeError):
-                del self._interp_units
+# Offsets (in units of vertices along each axis) of the eight vertices
+# bounding a cell, relative to the lower corner of that cell. The vertex
+# ordering is the one used throughout the volume averaged interpolator:
+# the z index varies fastest, then y, then x.
+_CELL_CORNER_OFFSETS = np.array(
+    [[i, j, k] for i in (0, 1) for j in (0, 1) for k in (0, 1)], dtype=np.intp
+)
 
-        return pos, args, persistent
+
+def _polynomial_interpolation_matrix(order: int) -> np.ndarray:
+    r"""
+    The matrix mapping the values of a quantity at the corners of a cell to
+    the coefficients of the polynomial interpolating it within that cell.
+
+    Within a cell with local coordinates :math:`0 ≤ t_x, t_y, t_z ≤ 1`,
+    the quantity is approximated by
+
+    .. math::
+        f = \sum_{i,j,k=0}^{p-1} a_{ijk} t_x^i t_y^j t_z^k
+
+    where :math:`p` is the ``order``, with the coefficients flattened such
+    that :math:`k` varies fastest. For ``order=2`` (trilinear) the
+    coefficients are determined by the values of :math:`f` at the eight
+    corners. For ``order=4`` (tricubic) they are determined by the values
+    of :math:`f`, :math:`∂_x f`, :math:`∂_y f`, :math:`∂_z f`,
+    :math:`∂_{xy} f`, :math:`∂_{xz} f`, :math:`∂_{yz} f` and
+    :math:`∂_{xyz} f` at the eight corners, following
+    :cite:t:`lekien:2005`. The values are ordered by derivative, then by
+    corner, in the order of ``_CELL_CORNER_OFFSETS``.
+    """
+    derivatives = _CELL_CORNER_OFFSETS if order == 4 else np.zeros((1, 3), np.intp)
+    monomials = [
+        (i, j, k) for i in range(order) for j in range(order) for k in range(order)
+    ]
+
+    def monomial_derivative(power, derivative, t):
+        # Value at t of the first or zeroth derivative of t**power
+        if derivative == 0:
+            return t**power
+        return power * t ** (power - 1) if power > 0 else 0
+
+    constraints = np.array(
+        [
+            [
+                np.prod(
+                    [
+                        monomial_derivative(p, d, c)
+                        for p, d, c in zip(powers, derivative, corner, strict=True)
+                    ]
+                )
+                for powers in monomials
+            ]
+            for derivative in derivatives
+            for corner in _CELL_CORNER_OFFSETS
+        ],
+        dtype=np.float64,
+    )
+    return np.linalg.inv(constraints)
+
+
+_TRILINEAR_MATRIX = _polynomial_interpolation_matrix(2)
+_TRICUBIC_MATRIX = _polynomial_interpolation_matrix(4)
 
 
-def _fast_nearest_neighbor_interpolate(pos, ax):
+def _uniform_vertex_derivatives(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    r"""
+    Estimate the values and derivatives of a quantity at each vertex of a
+    uniform grid that determine its tricubic interpolating polynomials
+    (see `_polynomial_interpolation_matrix`).
+
+    Derivatives are estimated with second order central differences in
+    index space (one-sided on the boundaries), which is the natural scale
+    for the local coordinates of each cell.
+
+    Returns
+    -------
+    `~numpy.ndarray`, shape (nvertices, 8)
+        The value of :math:`f`, :math:`∂_x f`, ..., :math:`∂_{xyz} f` at
+        each vertex, in the order of ``_CELL_CORNER_OFFSETS``, where
+        vertices are ordered as the flattened (C ordered) grid.
     """
-    Find the indices in the axis `ax` that are closest to the
-    values in the array `pos`.
+    values = np.asarray(values, dtype=np.float64)
+    table = np.empty((*values.shape, len(_CELL_CORNER_OFFSETS)), dtype=dtype)
+
+    # Each derivative is written into the table as soon as it is computed,
+    # so that only a few temporary arrays the size of the grid exist at once
+    for d, derivative in enumerate(_CELL_CORNER_OFFSETS):
+        field = values
+        for axis in np.flatnonzero(derivative):
+            field = np.gradient(field, axis=axis)
+        table[..., d] = field
 
-    Assumes the axis `ax` is sorted in ascending order.
+    return table.reshape(-1, len(_CELL_CORNER_OFFSETS))
+
+
+def _take(source, indices: np.ndarray, out: np.ndarray) -> None:
     """
-    # Find the index where each position would be inserted into the axis.
-    # This is equivalent to a nearest neighbor interpolation but always
-    # rounding to the next highest axis point.
-    indices = np.searchsorted(ax, pos)
-
-    # searchsorted can return an out-of-bound index on the top end, so replace
-    # that point with the closest in bound index
-    indices = np.where(indices == ax.size, ax.size - 1, indices)
-
-    # For any points that are closer to the point below than the point above,
-    # correct the index
-    return np.where(
-        np.abs(ax[indices] - pos) > np.abs(ax[indices - 1] - pos), indices - 1, indices
-    )
+    Gather the values of a flat quantity (see `AbstractGrid._flat_source`)
+    at ``indices`` into ``out`` without allocating an intermediate array.
+    """
+    if isinstance(source, _LazyQuantity):
+        source.take(indices, out)
+    else:
+        # The indices are always in bounds, and unlike the default mode
+        # "clip" does not buffer the output
+        np.take(source, indices, out=out, mode="clip")
+
+
+class GridInterpolator(ABC):
+    r"""
+    A reusable interpolator for a fixed set of quantities defined on a grid.
+
+    Instances are created with `AbstractGrid.make_interpolator` and are
+    called with an array of positions. Positions are interpolated in
+    chunks, and the work arrays used for each chunk are kept between
+    calls, so repeated interpolation into a preallocated ``out`` array
+    does not allocate memory.
+
+    Parameters
+    ----------
+    grid : `AbstractGrid`
+        The grid on which the quantities are defined.
+
+    quantities : ``iterable`` of `str`
+        Keys of the quantities to interpolate.
+
+    chunk_size : `int` or `None`, default: ``2**15``
+        The number of positions interpolated at a time. If `None`, all
+        positions are interpolated at once.
+
+    n_threads : `int`, default: 1
+        The number of threads over which chunks of positions are
+        distributed. NumPy releases the GIL for the bulk of the work, so
+        large arrays of positions are interpolated in parallel.
+
+    Notes
+    -----
+    Quantities that are added to or replaced on the grid after the
+    interpolator is created are picked up automatically. Each chunk being
+    interpolated uses its own set of work arrays, so an interpolator may
+    also be called from several threads at once.
+    """
+
+    def __init__(
+        self,
+        grid: "AbstractGrid",
+        quantities: Iterable[str],
+        *,
+        chunk_size: int | None = 2**15,
+        n_threads: int = 1,
+        to_si: bool = True,
+    ) -> None:
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, but was {chunk_size}.")
+        if n_threads < 1:
+            raise ValueError(f"n_threads must be positive, but was {n_threads}.")
+
+        self.grid = grid
+        self.quantities = tuple(quantities)
+        self.chunk_size = chunk_size
+        self.n_threads = n_threads
+
+        for key in self.quantities:
+            if key not in grid.quantities:
+                raise KeyError(
+                    "Quantity arguments must correspond to "
+                    "DataArrays in the DataSet. "
+                    f"{key} was not found. "
+                    f"Existing keys are: {grid.quantities}"
+                )
+
+        # Whether values are converted from the units in which they are
+        # stored on the grid to SI units
+        self._to_si = to_si
+
+        self._quantity_version: int | None = None
+        self._sources: list[np.ndarray | _LazyQuantity] = []
+        self._scales = np.ones(len(self.quantities))
+        self.units: list[u.UnitBase] = []
+
+        # Sets of work arrays not currently in use, along with the number
+        # of positions each can hold
+        self._free_workspaces: list[tuple[int, dict[str, np.ndarray]]] = []
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def __del__(self) -> None:
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __call__(
+        self, pos: np.ndarray | u.Quantity, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        r"""
+        Interpolate the quantities at an array of positions.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            Positions at which to interpolate. A `~numpy.ndarray` is
+            assumed to be in meters.
+
+        out : `~numpy.ndarray`, shape (nquantities, n), optional
+            A C-contiguous `~numpy.float64` array in which to write the
+            result. If not provided, a new array is allocated.
+
+        Returns
+        -------
+        `~numpy.ndarray`, shape (nquantities, n)
+            The value of each quantity at each position, in the SI units
+            listed in the ``units`` attribute. Positions that are off the
+            grid are assigned NaN.
+        """
+        if isinstance(pos, u.Quantity):
+            pos = pos.to(u.m).value
+        if pos.ndim == 1:
+            pos = np.reshape(pos, (1, 3))
+
+        n = pos.shape[0]
+        shape = (len(self.quantities), n)
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape or out.dtype != np.float64:
+            raise ValueError(
+                f"The out array must be a float64 array of shape {shape}, but "
+                f"an array of shape {out.shape} and dtype {out.dtype} was given."
+            )
+
+        with self._lock:
+            self._refresh()
+
+        self._interpolate_chunks(pos, out)
+
+        if self._to_si:
+            for j, scale in enumerate(self._scales):
+                if scale != 1:
+                    out[j] *= scale
+
+        return out
+
+    def _interpolate_chunks(self, pos: np.ndarray, out: np.ndarray) -> None:
+        r"""
+        Split the positions into chunks of ``chunk_size``, which are
+        distributed over ``n_threads`` threads.
+        """
+        n = pos.shape[0]
+        chunk_size = n if self.chunk_size is None else self.chunk_size
+        starts = range(0, n, max(chunk_size, 1))
+
+        def interpolate_chunk(start):
+            stop = start + chunk_size
+            self._interpolate_chunk(pos[start:stop], out[:, start:stop])
+
+        if self.n_threads > 1 and len(starts) > 1:
+            # Consume the iterator so that exceptions are raised here
+            list(self._get_executor().map(interpolate_chunk, starts))
+        else:
+            for start in starts:
+                interpolate_chunk(start)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        r"""The thread pool used to interpolate chunks, created on first use."""
+        with self._lock:
+            executor = self._executor
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=self.n_threads)
+                self._executor = executor
+            return executor
+
+    def _interpolate_chunk(self, pos: np.ndarray, out: np.ndarray) -> None:
+        r"""Interpolate a chunk of positions using a free set of work arrays."""
+        n = pos.shape[0]
+        with self._lock:
+            capacity, workspace = (
+                self._free_workspaces.pop() if self._free_workspaces else (0, None)
+            )
+        if capacity < n:
+            capacity, workspace = n, self._allocate_workspace(n)
+
+        try:
+            self._interpolate(pos, out, self._workspace_views(workspace, n))
+        finally:
+            with self._lock:
+                self._free_workspaces.append((capacity, workspace))
+
+    def _refresh(self) -> bool:
+        r"""
+        Update references to the quantities on the grid if any have been
+        added or replaced since the last call, returning `True` if so.
+        """
+        grid = self.grid
+        if self._quantity_version == grid._quantity_version:  # noqa: SLF001
+            return False
+
+        self._sources = [grid._flat_source(key) for key in self.quantities]  # noqa: SLF001
+        units = grid._quantity_units(self.quantities)  # noqa: SLF001
+        if self._to_si:
+            self._scales = np.array([unit.si.scale for unit in units])
+            self.units = [(1.0 * unit).si.unit for unit in units]
+        else:
+            self.units = units
+        self._quantity_version = grid._quantity_version  # noqa: SLF001
+        return True
+
+    @staticmethod
+    def _workspace_views(
+        workspace: dict[str, np.ndarray], n: int
+    ) -> dict[str, np.ndarray]:
+        r"""
+        Views of each of the work arrays sized for ``n`` positions. The
+        ``"vals"`` array holds one row per quantity, so it is sliced along
+        its second axis.
+        """
+        return {
+            key: arr[:, :n] if key == "vals" else arr[:n]
+            for key, arr in workspace.items()
+        }
+
+    def _gather(self, indices: np.ndarray, vals: np.ndarray) -> None:
+        r"""Gather each quantity at ``indices`` into the rows of ``vals``."""
+        for j, source in enumerate(self._sources):
+            _take(source, indices, vals[j])
+
+    @abstractmethod
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        r"""Allocate the work arrays needed to interpolate ``n`` positions."""
+        ...
+
+    @abstractmethod
+    def _interpolate(
+        self, pos: np.ndarray, out: np.ndarray, ws: dict[str, np.ndarray]
+    ) -> None:
+        r"""
+        Interpolate the quantities at positions ``pos`` (in meters) into
+        ``out``, in the units in which the quantities are stored, using
+        the work arrays ``ws``.
+        """
+        ...
+
+
+class _UniformGridInterpolator(GridInterpolator):
+    r"""
+    Shared machinery for interpolators on uniformly spaced grids, which
+    locate the cell containing each position using index arithmetic.
+    """
+
+    def __init__(self, grid, quantities, **kwargs) -> None:
+        super().__init__(grid, quantities, **kwargs)
+        origin, spacing, _ = grid._uniform_geometry_si  # noqa: SLF001
+        self._origin = origin
+        self._spacing = spacing
+        self._lower_bound, self._upper_bound = grid._bounds_si  # noqa: SLF001
+        self._upper_index = np.asarray(grid.shape) - 1
+        _, n1, n2 = grid.shape
+        self._strides = np.array([n1 * n2, n2, 1], dtype=np.intp)
+
+    # Shape of the vertices gathered for each position
+    _vertex_shape: ClassVar[tuple[int, ...]] = ()
+
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        nq = len(self.quantities)
+        return {
+            "frac_index": np.empty((n, 3)),
+            "ijk": np.empty((n, 3), dtype=np.intp),
+            "in_bounds": np.empty((n, 3), dtype=bool),
+            "below_upper": np.empty((n, 3), dtype=bool),
+            "mask_on": np.empty(n, dtype=bool),
+            "mask_off": np.empty(n, dtype=bool),
+            "vals": np.empty((nq, n, *self._vertex_shape), self.grid.storage_dtype),
+        }
+
+    def _locate(self, pos: np.ndarray, ws: dict[str, np.ndarray]) -> None:
+        r"""
+        Compute the fractional index of each position, where grid vertices
+        fall on integers, and the mask of positions that are off the grid.
+        The fractional index of off-grid positions is set to zero.
+        """
+        # Positions are compared with the bounds of the grid rather than
+        # their fractional index, which may be rounded just outside the
+        # grid for positions on its boundary, so that the mask agrees
+        # with `AbstractGrid.on_grid`. Non-finite positions fail both
+        # comparisons, so they are also considered to be off the grid.
+        in_bounds = ws["in_bounds"]
+        np.greater_equal(pos, self._lower_bound, out=in_bounds)
+        np.less_equal(pos, self._upper_bound, out=ws["below_upper"])
+        np.logical_and(in_bounds, ws["below_upper"], out=in_bounds)
+        np.all(in_bounds, axis=-1, out=ws["mask_on"])
+        np.logical_not(ws["mask_on"], out=ws["mask_off"])
+
+        frac_index = ws["frac_index"]
+        np.subtract(pos, self._origin, out=frac_index)
+        np.divide(frac_index, self._spacing, out=frac_index)
+        np.copyto(frac_index, 0, where=ws["mask_off"][:, np.newaxis])
+        np.clip(frac_index, 0, self._upper_index, out=frac_index)
+
+
+class _UniformNearestNeighborInterpolator(_UniformGridInterpolator):
+    r"""Nearest neighbor interpolation on a uniformly spaced grid."""
+
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        ws = super()._allocate_workspace(n)
+        ws["indices"] = np.empty(n, dtype=np.intp)
+        return ws
+
+    def _interpolate(self, pos: np.ndarray, out: np.ndarray, ws) -> None:
+        self._locate(pos, ws)
+
+        # Round half up, matching the tie-breaking of the axis search
+        frac_index, ijk = ws["frac_index"], ws["ijk"]
+        np.add(frac_index, 0.5, out=frac_index)
+        np.floor(frac_index, out=frac_index)
+        np.copyto(ijk, frac_index, casting="unsafe")
+        np.clip(ijk, 0, self._upper_index, out=ijk)
+        np.dot(ijk, self._strides, out=ws["indices"])
+
+        vals = ws["vals"]
+        self._gather(ws["indices"], vals)
+        np.copyto(out, vals)
+
+        # Replace values of off-grid positions with NaN
+        np.copyto(out, np.nan, where=ws["mask_off"])
+
+
+class _UniformVolumeAveragedInterpolator(_UniformGridInterpolator):
+    r"""
+    Volume averaged (trilinear) interpolation on a uniformly spaced grid.
+    See `CartesianGrid.volume_averaged_interpolator`.
+    """
+
+    _vertex_shape: ClassVar[tuple[int, ...]] = (8,)
+
+    def __init__(self, grid, quantities, **kwargs) -> None:
+        super().__init__(grid, quantities, **kwargs)
+        self._corner_offsets = _CELL_CORNER_OFFSETS @ self._strides
+        self._max_lower = np.maximum(self._upper_index - 1, 0)
+
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        ws = super()._allocate_workspace(n)
+        ws["lower_index"] = np.empty(n, dtype=np.intp)
+        ws["indices"] = np.empty((n, 8), dtype=np.intp)
+        ws["axis_weights"] = np.empty((n, 3, 2))
+        ws["weights"] = np.empty((n, 8))
+        ws["weighted"] = np.empty((n, 8))
+        return ws
+
+    def _interpolate(self, pos: np.ndarray, out: np.ndarray, ws) -> None:
+        self._locate(pos, ws)
+
+        # Positions on the upper boundary of an axis belong to the last cell
+        frac_index, lower = ws["frac_index"], ws["ijk"]
+        np.copyto(
+            lower,
+            np.floor(frac_index, out=ws["axis_weights"][..., 0]),
+            casting="unsafe",
+        )
+        np.clip(lower, 0, self._max_lower, out=lower)
+
+        # Linear weights of the lower and upper vertex along each axis,
+        # which are zero for off-grid positions
+        axis_weights = ws["axis_weights"]
+        np.subtract(frac_index, lower, out=axis_weights[..., 1])
+        np.subtract(1, axis_weights[..., 1], out=axis_weights[..., 0])
+        np.copyto(axis_weights, 0, where=ws["mask_off"][:, np.newaxis, np.newaxis])
+
+        weights = ws["weights"]
+        for c, (cx, cy, cz) in enumerate(_CELL_CORNER_OFFSETS):
+            np.multiply(
+                axis_weights[:, 0, cx], axis_weights[:, 1, cy], out=weights[:, c]
+            )
+            np.multiply(weights[:, c], axis_weights[:, 2, cz], out=weights[:, c])
+
+        # Find the eight vertices bounding each position
+        indices = ws["indices"]
+        np.dot(lower, self._strides, out=ws["lower_index"])
+        np.add(ws["lower_index"][:, np.newaxis], self._corner_offsets, out=indices)
+
+        # Get the values of each of the interpolated quantities at each
+        # of the bounding vertices and construct a weighted average
+        vals, weighted = ws["vals"], ws["weighted"]
+        self._gather(indices, vals)
+        for j in range(len(self.quantities)):
+            np.multiply(vals[j], weights, out=weighted)
+            np.sum(weighted, axis=-1, out=out[j])
+
+        np.copyto(out, np.nan, where=ws["mask_off"])
+
+
+class _UniformPolynomialInterpolator(_UniformGridInterpolator):
+    r"""
+    Piecewise polynomial interpolation on a uniformly spaced grid (see
+    `_polynomial_interpolation_matrix`).
+
+    The values needed at each vertex of the cell containing a position
+    are gathered, and the coefficients of the polynomial within that cell
+    are computed from them with a single matrix product, so no table of
+    coefficients per cell is stored.
+    """
+
+    grid: "CartesianGrid"
+
+    # Number of terms of the polynomial along each axis
+    _order: ClassVar[int]
+
+    # Number of values (the quantity and its derivatives) needed at each
+    # vertex of a cell
+    _nderivatives: ClassVar[int]
+
+    # The matrix giving the coefficients of the polynomial within a cell
+    # from the values at its vertices
+    _matrix: ClassVar[np.ndarray]
+
+    def __init__(self, grid, quantities, **kwargs) -> None:
+        super().__init__(grid, quantities, **kwargs)
+        self._corner_offsets = _CELL_CORNER_OFFSETS @ self._strides
+        self._max_lower = np.maximum(self._upper_index - 1, 0)
+
+        # The interpolation matrix orders its inputs by derivative, then by
+        # corner, while they are gathered by corner, then by derivative
+        p, nd = self._order, self._nderivatives
+        self._matrix_t = np.ascontiguousarray(
+            self._matrix.reshape(p**3, nd, 8).transpose(0, 2, 1).reshape(p**3, 8 * nd).T
+        )
+
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        p, nd = self._order, self._nderivatives
+        ws = super()._allocate_workspace(n)
+        # The rows of "vals" are not used, since vertex values are gathered
+        # for one quantity at a time
+        ws["vals"] = np.empty((0, n))
+        ws["lower_float"] = np.empty((n, 3))
+        ws["lower_index"] = np.empty(n, dtype=np.intp)
+        ws["indices"] = np.empty((n, 8), dtype=np.intp)
+        ws["vertex_values"] = np.empty((n, 8, nd))
+        ws["powers"] = np.empty((n, 3, p))
+        ws["coefficients"] = np.empty((n, p**3))
+        ws["partial_sum_2d"] = np.empty((n, p, p))
+        ws["partial_sum_1d"] = np.empty((n, p))
+        if self.grid.storage_dtype != np.float64:
+            ws["stored_values"] = np.empty((n, 8, nd), self.grid.storage_dtype)
+        return ws
+
+    def _interpolate(self, pos: np.ndarray, out: np.ndarray, ws) -> None:
+        p = self._order
+        n = pos.shape[0]
+        self._locate(pos, ws)
+
+        # The lower corner of the cell containing each position, where
+        # positions on the upper boundary of an axis belong to the last cell
+        frac_index, lower = ws["frac_index"], ws["ijk"]
+        np.floor(frac_index, out=ws["lower_float"])
+        np.copyto(lower, ws["lower_float"], casting="unsafe")
+        np.clip(lower, 0, self._max_lower, out=lower)
+
+        # Local coordinates of each position within its cell
+        np.subtract(frac_index, lower, out=frac_index)
+
+        # Powers of the local coordinates within the cell
+        powers = ws["powers"]
+        powers[:, :, 0] = 1
+        for i in range(1, p):
+            np.multiply(powers[:, :, i - 1], frac_index, out=powers[:, :, i])
+
+        # Find the eight vertices of the cell containing each position
+        indices = ws["indices"]
+        np.dot(lower, self._strides, out=ws["lower_index"])
+        np.add(ws["lower_index"][:, np.newaxis], self._corner_offsets, out=indices)
+
+        vertex_values = ws["vertex_values"]
+        gathered = ws.get("stored_values", vertex_values)
+        coefficients = ws["coefficients"]
+        shaped = coefficients.reshape(n, p, p, p)
+        for j, table in enumerate(self._tables):
+            self._gather_vertices(table, indices, gathered)
+            if gathered is not vertex_values:
+                np.copyto(vertex_values, gathered)
+            np.matmul(vertex_values.reshape(n, -1), self._matrix_t, out=coefficients)
+
+            # Evaluate the polynomial one axis at a time
+            np.einsum("nijk,nk->nij", shaped, powers[:, 2], out=ws["partial_sum_2d"])
+            np.einsum(
+                "nij,nj->ni",
+                ws["partial_sum_2d"],
+                powers[:, 1],
+                out=ws["partial_sum_1d"],
+            )
+            np.einsum("ni,ni->n", ws["partial_sum_1d"], powers[:, 0], out=out[j])
+
+        np.copyto(out, np.nan, where=ws["mask_off"])
+
+    @abstractmethod
+    def _vertex_tables(self) -> list:
+        r"""The values needed at each vertex, for each of the quantities."""
+        ...
+
+    @staticmethod
+    def _gather_vertices(table, indices: np.ndarray, out: np.ndarray) -> None:
+        r"""Gather the rows of ``table`` at the vertex ``indices`` into ``out``."""
+        _take(table, indices, out[..., 0])
+
+    def _refresh(self) -> bool:
+        refreshed = super()._refresh()
+        if refreshed:
+            self._tables = self._vertex_tables()
+        return refreshed
+
+
+class _UniformTrilinearInterpolator(_UniformPolynomialInterpolator):
+    r"""
+    Trilinear interpolation on a uniformly spaced grid. The result is the
+    same as that of volume averaged interpolation.
+    """
+
+    _order: ClassVar[int] = 2
+    _nderivatives: ClassVar[int] = 1
+    _matrix: ClassVar[np.ndarray] = _TRILINEAR_MATRIX
+
+    def _vertex_tables(self) -> list:
+        # Only the values of the quantities themselves are needed
+        return list(self._sources)
+
+
+class _UniformTricubicInterpolator(_UniformPolynomialInterpolator):
+    r"""
+    Tricubic interpolation on a uniformly spaced grid, which is continuous
+    along with its first derivatives.
+    """
+
+    _order: ClassVar[int] = 4
+    _nderivatives: ClassVar[int] = 8
+    _matrix: ClassVar[np.ndarray] = _TRICUBIC_MATRIX
+
+    def _vertex_tables(self) -> list:
+        return [
+            self.grid._vertex_derivatives(key)  # noqa: SLF001
+            for key in self.quantities
+        ]
+
+    @staticmethod
+    def _gather_vertices(table, indices: np.ndarray, out: np.ndarray) -> None:
+        # The indices are always in bounds, and unlike the default mode
+        # "clip" does not buffer the output
+        np.take(table, indices, axis=0, out=out, mode="clip")
+
+
+class _NonUniformNearestNeighborInterpolator(GridInterpolator):
+    r"""
+    Nearest neighbor interpolation on a non-uniform grid using the k-d
+    tree of the grid points.
+    """
+
+    grid: "NonUniformCartesianGrid"
+
+    def _allocate_workspace(self, n: int) -> dict[str, np.ndarray]:
+        nq = len(self.quantities)
+        return {
+            "mask_off": np.empty(n, dtype=bool),
+            "vals": np.empty((nq, n), dtype=self.grid.storage_dtype),
+        }
+
+    def _interpolate(self, pos: np.ndarray, out: np.ndarray, ws) -> None:
+        np.logical_not(self.grid.on_grid(pos), out=ws["mask_off"])
+
+        _, indices = self.grid._spatial_index.query(pos)  # noqa: SLF001
+
+        vals = ws["vals"]
+        self._gather(indices, vals)
+        np.copyto(out, vals)
+        np.copyto(out, np.nan, where=ws["mask_off"])
 
 
 class CartesianGrid(AbstractGrid):
     r"""A uniformly spaced Cartesian grid."""
 
+    _interpolator_methods: ClassVar[dict[str, type[GridInterpolator]]] = {
+        "nearest neighbor": _UniformNearestNeighborInterpolator,
+        "volume averaged": _UniformVolumeAveragedInterpolator,
+        "trilinear": _UniformTrilinearInterpolator,
+        "tricubic": _UniformTricubicInterpolator,
+    }
+
     def _validate(self):
         # Check that all units are lengths
         for i in range(3):
@@ -1081,30 +2751,66 @@ def vector_intersects(self, p1, p2):
         `True` if the vector from ``p1`` to ``p2`` intersects the grid,
         and `False` otherwise.
 
-        This is a standard ray-box intersection algorithm.
+        The grid is defined by a box extending in each dimension from the
+        minimum to the maximum value of the grid in that dimension, and
+        the vector is the line segment from ``p1`` to ``p2``. See
+        `ray_intersections` for a vectorized version.
         """
-        p1, p2 = p1.si.value, p2.si.value
-        # Calculate the minimum and maximum of each
-        Ax, Bx = np.min(self.pts0.si.value), np.max(self.pts0.si.value)
-        Ay, By = np.min(self.pts1.si.value), np.max(self.pts1.si.value)
-        Az, Bz = np.min(self.pts2.si.value), np.max(self.pts2.si.value)
-        A = np.array([Ax, Ay, Az])
-        B = np.array([Bx, By, Bz])
+        return self._segment_intersects(p1, p2)
+
+    @cached_property
+    def _uniform_geometry_si(self):
+        r"""
+        The origin, spacing, and upper bound of each axis of the grid (in SI
+        units), used by the uniform grid interpolation kernels.
 
-        # Calculate the equation of the line from p1 to p2 such that
-        # r = p1 + t*D
-        D = np.abs(p2 - p1)
+        The spacing is computed from the endpoints of each axis, so the
+        fractional index of a position ``(x - x0) / dx`` is within rounding
+        error of an integer at the grid vertices, but may not be exactly
+        equal to it.
+        """
+        axes = (self._ax0_si, self._ax1_si, self._ax2_si)
+        origin = np.array([ax[0] for ax in axes])
+        upper = np.array([ax[-1] for ax in axes])
+        spacing = (upper - origin) / (np.array(self.shape) - 1)
+        return origin, spacing, upper
+
+    @cached_property
+    def _vertex_derivative_cache(self) -> dict:
+        r"""
+        Derivatives of each quantity at each vertex, by quantity key, along
+        with the version of the quantity they were computed from.
+        """
+        return {}
+
+    def _vertex_derivatives(self, key: str) -> np.ndarray:
+        r"""
+        The values and derivatives of a quantity at each vertex of the
+        grid used for tricubic interpolation (see
+        `_uniform_vertex_derivatives`), computed on first use and cached
+        until the quantity is replaced.
 
-        # Calculate the intersection points. These operations are just vectorized
-        # for convenience. Ignore div-by-zero: outputting infty's here is fine.
-        with np.errstate(divide="ignore"):
-            Tmin = (A - p1) / D
-            Tmax = (B - p1) / D
+        Returns
+        -------
+        `~numpy.ndarray`, shape (nvertices, 8)
+            Derivatives in the units in which the quantity is stored and
+            with the `storage_dtype` of the grid.
 
-        Tmin = np.max(Tmin)
-        Tmax = np.min(Tmax)
+        Notes
+        -----
+        The derivatives at a vertex depend on the values of the quantity
+        at the neighboring vertices, so a lazy quantity is read fully into
+        memory while they are computed.
+        """
+        with self._interpolation_lock:
+            version = self._quantity_key_versions.get(key)
+            cached = self._vertex_derivative_cache.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
 
-        return Tmin < Tmax
+            table = _uniform_vertex_derivatives(self[key].value, self.storage_dtype)
+            self._vertex_derivative_cache[key] = (version, table)
+            return table
 
     @modify_docstring(prepend=AbstractGrid.nearest_neighbor_interpolator.__doc__)
     def nearest_neighbor_interpolator(
@@ -1117,34 +2823,7 @@ def nearest_neighbor_interpolator(
             pos, args, persistent
         )
 
-        ax0, ax1, ax2 = self._ax0_si, self._ax1_si, self._ax2_si
-
-        # Find particles that are off the grid
-        mask_particle_off = (
-            (pos[:, 0] < ax0.min())
-            | (pos[:, 0] > ax0.max())
-            | (pos[:, 1] < ax1.min())
-            | (pos[:, 1] > ax1.max())
-            | (pos[:, 2] < ax2.min())
-            | (pos[:, 2] > ax2.max())
-        )
-
-        # Interpolate nearest index to each point along each axis
-        i0 = _fast_nearest_neighbor_interpolate(pos[:, 0], ax0)
-        i1 = _fast_nearest_neighbor_interpolate(pos[:, 1], ax1)
-        i2 = _fast_nearest_neighbor_interpolate(pos[:, 2], ax2)
-
-        vals = self._interp_quantities[i0, i1, i2, :]
-
-        # Replace values of off-grid particles with NaN
-        vals[mask_particle_off, :] = np.nan
-
-        # Split output array into arrays with units
-        # Apply units to output arrays
-        output = [
-            vals[..., index] * self._interp_units[index] for index, _ in enumerate(args)
-        ]
-        return output[0] if len(output) == 1 else tuple(output)
+        return self._legacy_interpolate("nearest neighbor", pos, args, persistent)
 
     def volume_averaged_interpolator(
         self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
@@ -1186,134 +2865,16 @@ def volume_averaged_interpolator(
         introduces a linear interpolation between grid vertices.
 
         This implementation of this algorithm assumes that the grid is uniformly
-        spaced and Cartesian.
+        spaced and Cartesian, which allows the cell containing each point to
+        be found directly from :math:`\lfloor (x - x_0) / dx \rfloor` rather
+        than by searching the grid axes.
         """
         # Shared setup
         pos, args, persistent = self._persistent_interpolator_setup(
             pos, args, persistent
         )
 
-        nparticles = pos.shape[0]
-        nargs = len(args)
-
-        # Load grid attributes (so this isn't repeated)
-        ax0, ax1, ax2 = self._ax0_si, self._ax1_si, self._ax2_si
-        dx, dy, dz = self._dax0_si, self._dax1_si, self._dax2_si
-        n0, n1, n2 = self.shape
-
-        # find cell nearest to each position
-        nearest_neighbor_index = np.zeros((nparticles, 3), dtype=np.int32)
-        nearest_neighbor_index[..., 0] = _fast_nearest_neighbor_interpolate(
-            pos[:, 0], ax0
-        )
-        nearest_neighbor_index[..., 1] = _fast_nearest_neighbor_interpolate(
-            pos[:, 1], ax1
-        )
-        nearest_neighbor_index[..., 2] = _fast_nearest_neighbor_interpolate(
-            pos[:, 2], ax2
-        )
-
-        # Create a mask for positions that are off the grid. The values at
-        # these points will be set to zero later.
-        mask_particle_off = (
-            (pos[:, 0] < ax0.min())
-            | (pos[:, 0] > ax0.max())
-            | (pos[:, 1] < ax1.min())
-            | (pos[:, 1] > ax1.max())
-            | (pos[:, 2] < ax2.min())
-            | (pos[:, 2] > ax2.max())
-        )
-
-        # Get the physical positions for the nearest neighbor cell
-        # for the each particle
-        xpos = ax0[nearest_neighbor_index[:, 0]]
-        ypos = ax1[nearest_neighbor_index[:, 1]]
-        zpos = ax2[nearest_neighbor_index[:, 2]]
-        nearest_neighbor_pos = np.array([xpos, ypos, zpos]).swapaxes(0, 1)
-
-        # Determine the indices for the grid cells bounding the particle
-        # - The imaginary cell centered on the particle will overlap with
-        #   1 to 8 surrounding cells
-        # - typically this is 8 but will be 4, 2, or 1 when the particle is
-        #   near the boundary of the grid
-        bounding_cell_indices = np.empty((nparticles, 8, 3), dtype=np.int32)
-        lower_indices = np.where(
-            pos >= nearest_neighbor_pos,
-            nearest_neighbor_index,
-            nearest_neighbor_index - 1,
-        )
-
-        # populate x indices
-        bounding_cell_indices[:, 0:4, 0] = np.tile(
-            lower_indices[:, 0], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, 4:, 0] = bounding_cell_indices[:, 0:4, 0] + 1
-
-        # populate y indices
-        bounding_cell_indices[:, [0, 1, 4, 5], 1] = np.tile(
-            lower_indices[:, 1], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, [2, 3, 6, 7], 1] = (
-            bounding_cell_indices[:, [0, 1, 4, 5], 1] + 1
-        )
-
-        # populate z indices
-        bounding_cell_indices[:, 0::2, 2] = np.tile(
-            lower_indices[:, 2], (4, 1)
-        ).swapaxes(0, 1)
-        bounding_cell_indices[:, 1::2, 2] = bounding_cell_indices[:, 0::2, 2] + 1
-
-        # Create a mask for cells whose locations would be off the grid,
-        # which occurs when the interpolation point is near the edge of the
-        # grid. These values will be weighted as zero later.
-        mask_cell_off = (
-            (bounding_cell_indices < 0).any(axis=2)
-            | (bounding_cell_indices[:, :, 0] >= n0)
-            | (bounding_cell_indices[:, :, 1] >= n1)
-            | (bounding_cell_indices[:, :, 2] >= n2)
-        )
-
-        # Zero any out of bounds indices so IndexError is not raised
-        # during indexing.  This means an incorrect value will be retrieved
-        # but will not be used because of the zero weighting and the
-        # off the grid mask
-        bounding_cell_indices[mask_cell_off, :] = 0
-
-        # Calculate the volume of the overlap between the point volume
-        # and the volume of each of the surrounding vertices
-        lx = dx - np.abs(pos[:, None, 0] - ax0[bounding_cell_indices[..., 0]])
-        ly = dy - np.abs(pos[:, None, 1] - ax1[bounding_cell_indices[..., 1]])
-        lz = dz - np.abs(pos[:, None, 2] - ax2[bounding_cell_indices[..., 2]])
-        bounding_cell_weights = lx * ly * lz
-
-        # Set the weight for any off-grid vertices (cell or particle) to zero
-        bounding_cell_weights[mask_cell_off] = 0.0
-        bounding_cell_weights[mask_particle_off, ...] = 0.0
-        norms = np.sum(bounding_cell_weights, axis=1)
-        mask_norm_zero = norms == 0.0
-        bounding_cell_weights[~mask_norm_zero] = (
-            bounding_cell_weights[~mask_norm_zero, ...] / norms[~mask_norm_zero, None]
-        )
-
-        # Get the values of each of the interpolated quantities at each
-        # of the bounding vertices
-        vals = self._interp_quantities[
-            bounding_cell_indices[..., 0],
-            bounding_cell_indices[..., 1],
-            bounding_cell_indices[..., 2],
-            :,
-        ]
-        # Construct a weighted average of the interpolated quantities
-        weighted_ave = np.sum(bounding_cell_weights[..., None] * vals, axis=1)
-        weighted_ave[mask_particle_off, :] = np.nan
-
-        # Split output array into arrays with units
-        # Apply units to output arrays
-        output = [
-            weighted_ave[..., arg] * self._interp_units[arg] for arg in range(nargs)
-        ]
-
-        return output[0] if len(output) == 1 else tuple(output)
+        return self._legacy_interpolate("volume averaged", pos, args, persistent)
 
 
 class NonUniformCartesianGrid(AbstractGrid):
@@ -1322,6 +2883,10 @@ class NonUniformCartesianGrid(AbstractGrid):
     non-uniformly spaced grid.
     """
 
+    _interpolator_methods: ClassVar[dict[str, type[GridInterpolator]]] = {
+        "nearest neighbor": _NonUniformNearestNeighborInterpolator,
+    }
+
     def _validate(self):
         """Check that all units are lengths."""
         for i in range(3):
@@ -1332,47 +2897,60 @@ def _validate(self):
                     f"Units of grid are not valid for a Cartesian grid: {self.units}."
                 ) from ex
 
+    @cached_property
+    def _spatial_index(self) -> cKDTree:
+        r"""
+        A k-d tree of the grid points in SI units, built once and shared
+        by the resolution estimate and nearest neighbor lookups.
+        """
+        return cKDTree(self.grid.to(u.m).value)
+
     @property
     def grid_resolution(self):
         r"""
         A scalar estimate of the grid resolution, calculated as the
         closest spacing between any two points.
         """
-        distances = distance.cdist(self.grid, self.grid)
-        np.fill_diagonal(distances, np.inf)
-        return np.min(distances) * self.unit
+        return (self._grid_resolution_si * u.m).to(self.unit)
 
-    def vector_intersects(self, p1, p2):
-        r"""
-        `True` if the vector from ``p1`` to ``p2`` intersects the grid,
-        and `False` otherwise. The grid is defined by a cube extending in
-        each dimension from the minimum value of the grid to the maximum value
-        of the grid in that dimension.
+    @cached_property
+    def _grid_resolution_si(self) -> float:
+        r"""The closest spacing between any two grid points, in meters."""
+        return float(np.min(self._resolution_map_si))
 
-        This is a standard ray-box intersection algorithm.
+    @cached_property
+    def _resolution_map_si(self) -> np.ndarray:
+        r"""
+        The distance from each grid point to its nearest neighbor, in
+        meters, used as the local resolution of the grid.
         """
-        p1, p2 = p1.si.value, p2.si.value
-        # Calculate the minimum and maximum of each
-        Ax, Bx = np.min(self.pts0.si.value), np.max(self.pts0.si.value)
-        Ay, By = np.min(self.pts1.si.value), np.max(self.pts1.si.value)
-        Az, Bz = np.min(self.pts2.si.value), np.max(self.pts2.si.value)
-        A = np.array([Ax, Ay, Az])
-        B = np.array([Bx, By, Bz])
-
-        # Calculate the equation of the line from p1 to p2 such that
-        # r = p1 + t*D
-        D = np.abs(p2 - p1)
+        tree = self._spatial_index
+        # The nearest neighbor of each point other than itself
+        distances, _ = tree.query(tree.data, k=2)
+        return distances[:, 1]
 
-        # Calculate the intersection points. These operations are just vectorized
-        # for convenience. Ignore div-by-zero: outputting infty's here is fine.
-        with np.errstate(divide="ignore"):
-            Tmin = (A - p1) / D
-            Tmax = (B - p1) / D
+    def _local_resolution_si(self, pos: np.ndarray) -> np.ndarray:
+        r"""
+        The resolution of the grid, in meters, at each of the positions
+        ``pos``, taken from the grid point closest to each position.
+        """
+        resolution = self._resolution_map_si
+        if pos.shape[0] == 0:
+            return np.empty(0)
+        _, indices = self._spatial_index.query(pos)
+        return resolution[indices]
 
-        Tmin = np.max(Tmin)
-        Tmax = np.min(Tmax)
+    def vector_intersects(self, p1, p2):
+        r"""
+        `True` if the vector from ``p1`` to ``p2`` intersects the grid,
+        and `False` otherwise.
 
-        return Tmin < Tmax
+        The grid is defined by a box extending in each dimension from the
+        minimum to the maximum value of the grid in that dimension, and
+        the vector is the line segment from ``p1`` to ``p2``. See
+        `ray_intersections` for a vectorized version.
+        """
+        return self._segment_intersects(p1, p2)
 
     def _make_mesh(self, start, stop, num: int, **kwargs):
         r"""
@@ -1397,18 +2975,6 @@ def _make_mesh(self, start, stop, num: int, **kwargs):
 
         return arr0, arr1, arr2
 
-    @cached_property
-    def _nearest_neighbor_interpolator(self):
-        """
-        Creates a nearest neighbor interpolator object for this grid, which can
-        then be called repeatedly.
-
-        """
-
-        return interp.NearestNDInterpolator(
-            self.grid.to(u.m).value, self._interp_quantities
-        )
-
     @modify_docstring(prepend=AbstractGrid.nearest_neighbor_interpolator.__doc__)
     def nearest_neighbor_interpolator(
         self, pos: np.ndarray | u.Quantity, *args, persistent: bool = False
@@ -1419,29 +2985,183 @@ def nearest_neighbor_interpolator(
             pos, args, persistent
         )
 
-        # Clear additional property that is not handled in the
-        # _persistent_interpolator_setup function because it is unique
-        # to this non_uniform grid.
-        if not persistent:
-            with contextlib.suppress(AttributeError):
-                del self._nearest_neighbor_interpolator
-
-        pts0 = self.pts0.to(u.m).value
-        pts1 = self.pts1.to(u.m).value
-        pts2 = self.pts2.to(u.m).value
-
-        mask_particle_off = (
-            (pos[:, 0] < pts0.min())
-            | (pos[:, 0] > pts0.max())
-            | (pos[:, 1] < pts1.min())
-            | (pos[:, 1] > pts1.max())
-            | (pos[:, 2] < pts2.min())
-            | (pos[:, 2] > pts2.max())
-        )
+        return self._legacy_interpolate("nearest neighbor", pos, args, persistent)
 
-        vals = self._nearest_neighbor_interpolator(pos)
-        vals[mask_particle_off] = np.nan
 
-        output = [vals[:, arg] * self._interp_units[arg] for arg in range(len(args))]
+class GridCollection:
+    r"""
+    A collection of grids, with a spatial index of their bounding boxes
+    used to find which grids contain each of many positions.
+
+    The bounding box of all of the grids is divided into uniform bins,
+    and each bin records the grids overlapping it. Locating a position
+    then only requires testing it against the grids in its bin, rather
+    than against every grid in the collection.
+
+    Parameters
+    ----------
+    grids : ``iterable`` of `AbstractGrid`
+        The grids in the collection.
+
+    bins_per_axis : `int`, optional
+        The number of bins along each axis of the index. By default this
+        is twice the cube root of the number of grids, rounded up.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.plasma.grids import CartesianGrid, GridCollection
+    >>> grids = [
+    ...     CartesianGrid(-1 * u.cm, 0 * u.cm, num=5),
+    ...     CartesianGrid(0 * u.cm, 1 * u.cm, num=5),
+    ... ]
+    >>> collection = GridCollection(grids)
+    >>> pos = np.array([[-0.005, -0.005, -0.005], [0.005, 0.005, 0.005]])
+    >>> collection.on_grid(pos)
+    array([[ True, False],
+           [False,  True]])
+    """
 
-        return output[0] if len(output) == 1 else tuple(output)
+    def __init__(
+        self, grids: Iterable[AbstractGrid], bins_per_axis: int | None = None
+    ) -> None:
+        self.grids = list(grids)
+        ngrids = len(self.grids)
+
+        bounds = [grid._bounds_si for grid in self.grids]  # noqa: SLF001
+        self._lower = np.array([lower for lower, _ in bounds]).reshape(ngrids, 3)
+        self._upper = np.array([upper for _, upper in bounds]).reshape(ngrids, 3)
+
+        if bins_per_axis is None:
+            bins_per_axis = int(np.ceil(2 * ngrids ** (1 / 3))) if ngrids else 1
+        self._bins_per_axis = bins_per_axis
+
+        self._build_index()
+
+    def __len__(self) -> int:
+        return len(self.grids)
+
+    def __iter__(self) -> Iterator[AbstractGrid]:
+        return iter(self.grids)
+
+    def __getitem__(self, index: int) -> AbstractGrid:
+        return self.grids[index]
+
+    def _build_index(self) -> None:
+        r"""
+        Record the grids overlapping each bin, as a table with one row per
+        bin padded with ``-1``.
+        """
+        nbins = self._bins_per_axis
+        if len(self.grids) == 0:
+            self._origin = np.zeros(3)
+            self._bin_size = np.ones(3)
+            self._candidates = np.full((nbins**3, 0), -1, dtype=np.intp)
+            return
+
+        self._origin = np.min(self._lower, axis=0)
+        extent = np.max(self._upper, axis=0) - self._origin
+        self._bin_size = np.where(extent > 0, extent / nbins, 1)
+
+        # The bins overlapped by each grid, as a range of bin indices along
+        # each axis
+        first_bin = self._bin_of(self._lower)
+        last_bin = self._bin_of(self._upper)
+
+        candidates: list[list[int]] = [[] for _ in range(nbins**3)]
+        for grid_index, (first, last) in enumerate(
+            zip(first_bin, last_bin, strict=True)
+        ):
+            i, j, k = np.meshgrid(
+                *(np.arange(a, b + 1) for a, b in zip(first, last, strict=True)),
+                indexing="ij",
+            )
+            for bin_index in np.ravel_multi_index((i, j, k), (nbins,) * 3).ravel():
+                candidates[bin_index].append(grid_index)
+
+        width = max(len(c) for c in candidates)
+        self._candidates = np.full((nbins**3, width), -1, dtype=np.intp)
+        for bin_index, c in enumerate(candidates):
+            self._candidates[bin_index, : len(c)] = c
+
+    def _bin_of(self, pos: np.ndarray) -> np.ndarray:
+        r"""The index of the bin containing each position along each axis."""
+        with np.errstate(invalid="ignore"):
+            ijk = np.floor((pos - self._origin) / self._bin_size)
+        ijk = np.nan_to_num(ijk, nan=0, posinf=0, neginf=0)
+        return np.clip(ijk, 0, self._bins_per_axis - 1).astype(np.intp)
+
+    def _containing_pairs(self, pos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        r"""
+        Find every pair of a position and a grid containing it.
+
+        Returns
+        -------
+        pos_indices, grid_indices : `~numpy.ndarray` of `int`
+            The index of each position and of the grid containing it,
+            ordered by position index.
+        """
+        if isinstance(pos, u.Quantity):
+            pos = pos.to(u.m).value
+        pos = np.reshape(pos, (-1, 3))
+
+        nbins = self._bins_per_axis
+        bin_index = np.ravel_multi_index(tuple(self._bin_of(pos).T), (nbins,) * 3)
+        candidates = self._candidates[bin_index]
+
+        # Test each position against the bounding box of each candidate grid
+        valid = candidates >= 0
+        lower = self._lower[candidates]
+        upper = self._upper[candidates]
+        pos = pos[:, np.newaxis, :]
+        contained = valid & np.all((pos >= lower) & (pos <= upper), axis=-1)
+
+        pos_indices, slots = np.nonzero(contained)
+        return pos_indices, candidates[pos_indices, slots]
+
+    def on_grid(self, pos: np.ndarray | u.Quantity) -> np.ndarray:
+        r"""
+        Determine which grids contain each position.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            Positions to locate. A `~numpy.ndarray` is assumed to be in
+            meters.
+
+        Returns
+        -------
+        `~numpy.ndarray` of `bool`, shape (n, ngrids)
+            `True` where a position is in the region bounded by a grid,
+            as defined by `AbstractGrid.on_grid`.
+        """
+        pos_indices, grid_indices = self._containing_pairs(pos)
+        mask = np.zeros((np.shape(pos)[0], len(self.grids)), dtype=bool)
+        mask[pos_indices, grid_indices] = True
+        return mask
+
+    def positions_by_grid(self, pos: np.ndarray | u.Quantity) -> list[np.ndarray]:
+        r"""
+        Bin positions by the grids containing them.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray` or `~astropy.units.Quantity`, shape (n, 3)
+            Positions to locate. A `~numpy.ndarray` is assumed to be in
+            meters.
+
+        Returns
+        -------
+        `list` of `~numpy.ndarray` of `int`
+            For each grid, the sorted indices of the positions it contains.
+            A position contained by several overlapping grids appears in
+            the list of each of them.
+        """
+        if not self.grids:
+            return []
+
+        pos_indices, grid_indices = self._containing_pairs(pos)
+        order = np.argsort(grid_indices, kind="stable")
+        counts = np.bincount(grid_indices, minlength=len(self.grids))
+        return np.split(pos_indices[order], np.cumsum(counts)[:-1])
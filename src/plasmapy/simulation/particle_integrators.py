@@ -8,16 +8,288 @@
 memory allocation.
 """
 
-__all__ = ["AbstractIntegrator", "BorisIntegrator", "RelativisticBorisIntegrator"]
-
+__all__ = [
+    "AbstractIntegrator",
+    "BorisIntegrator",
+    "HigueraCaryIntegrator",
+    "IntegratorWorkspace",
+    "RelativisticBorisIntegrator",
+    "VayIntegrator",
+]
+
+import importlib.util
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 import astropy.constants as const
 import numpy as np
+from numpy.typing import NDArray
 
 _c = const.c
 
 
+class IntegratorWorkspace:
+    """
+    Preallocated scratch arrays reused by the in-place integrator kernels.
+
+    Buffers are allocated the first time they are requested and are only
+    reallocated when a larger number of particles is pushed, so repeated
+    pushes of the same ensemble do not allocate any temporary arrays.
+
+    Examples
+    --------
+    >>> workspace = IntegratorWorkspace()
+    >>> buffer = workspace.array("t", (4, 3))
+    >>> buffer.shape
+    (4, 3)
+    >>> np.shares_memory(buffer, workspace.array("t", (2, 3)))
+    True
+    """
+
+    def __init__(self) -> None:
+        self._buffers: dict[str, NDArray[np.float64]] = {}
+
+    def array(self, name: str, shape: tuple[int, ...]) -> NDArray[np.float64]:
+        """
+        Return an uninitialized float array of ``shape`` which is a view of
+        the buffer called ``name``.
+        """
+        buffer = self._buffers.get(name)
+        if (
+            buffer is None
+            or buffer.shape[0] < shape[0]
+            or buffer.shape[1:] != tuple(shape[1:])
+        ):
+            buffer = np.empty(shape)
+            self._buffers[name] = buffer
+        return buffer[: shape[0]]
+
+
+def _cross(a, b, out, scratch) -> None:
+    """
+    Compute the cross product of the rows of ``a`` and ``b`` into ``out``
+    without allocating, using the 1D array ``scratch``. ``out`` must not
+    share memory with ``a`` or ``b``.
+    """
+    for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+        np.multiply(a[:, j], b[:, k], out=out[:, i])
+        np.multiply(a[:, k], b[:, j], out=scratch)
+        out[:, i] -= scratch
+
+
+def _squared_norm(a, out) -> NDArray[np.float64]:
+    """Compute the squared norm of the rows of ``a`` into ``out``."""
+    squared_norm: NDArray[np.float64] = np.einsum("ij,ij->i", a, a, out=out)
+    return squared_norm
+
+
+def _half_impulse_factor(q, m, dt, workspace, n) -> float | NDArray[np.float64]:
+    """
+    The factor ``q * dt / (2 * m)``, with a column per particle if any of
+    ``q``, ``m`` or ``dt`` is.
+    """
+    if np.ndim(q) == np.ndim(m) == np.ndim(dt) == 0:
+        factor: float = 0.5 * q * dt / m
+        return factor
+    hqmdt: NDArray[np.float64] = np.multiply(
+        q, 0.5, out=workspace.array("hqmdt", (n, 1))
+    )
+    hqmdt *= dt
+    hqmdt /= m
+    return hqmdt
+
+
+def _rotate(v, B, hqmdt, workspace, n, gamma=None) -> None:
+    """
+    Rotate the velocities (or proper velocities) ``v`` in place about the
+    magnetic field, as in the Boris algorithm.
+    """
+    t = np.multiply(B, hqmdt, out=workspace.array("t", (n, 3)))
+    scalar = workspace.array("scalar", (n,))
+    if gamma is not None:
+        t /= gamma[:, np.newaxis]
+
+    # s = 2 t / (1 + |t|^2)
+    _squared_norm(t, scalar)
+    scalar += 1
+    np.divide(2, scalar, out=scalar)
+    s = np.multiply(t, scalar[:, np.newaxis], out=workspace.array("s", (n, 3)))
+
+    # v' = v + v × t and v += v' × s
+    cross_scratch = workspace.array("cross_scratch", (n,))
+    v_prime = workspace.array("v_prime", (n, 3))
+    _cross(v, t, v_prime, cross_scratch)
+    v_prime += v
+    v_cross = workspace.array("cross", (n, 3))
+    _cross(v_prime, s, v_cross, cross_scratch)
+    v += v_cross
+
+
+def _advance_position(x, v, dt, workspace, n) -> None:
+    """Advance the positions ``x`` in place by ``v * dt``."""
+    displacement = np.multiply(v, dt, out=workspace.array("cross", (n, 3)))
+    x += displacement
+
+
+def _lorentz_factor(u, workspace, n, c) -> NDArray[np.float64]:
+    """The Lorentz factor ``sqrt(1 + u^2 / c^2)`` of the proper velocities ``u``."""
+    gamma = _squared_norm(u, workspace.array("gamma", (n,)))
+    gamma /= c**2
+    gamma += 1
+    return np.sqrt(gamma, out=gamma)
+
+
+def _implicit_rotation(u, tau, workspace, n, c) -> NDArray[np.float64]:
+    """
+    Rotate the proper velocities ``u`` in place about the magnetic field,
+    using the Lorentz factor at the end of the rotation found by solving
+    the quartic shared by the Vay and Higuera–Cary algorithms.
+
+    ``tau`` is ``q * B * dt / (2 * m)``. Returns the rotation vector
+    ``t = tau / γ``.
+    """
+    gamma = _lorentz_factor(u, workspace, n, c)
+
+    # σ = γ^2 - τ^2
+    tau_squared = _squared_norm(tau, workspace.array("tau_squared", (n,)))
+    sigma = np.square(gamma, out=workspace.array("sigma", (n,)))
+    sigma -= tau_squared
+
+    # u* = u · τ / c
+    u_star = np.einsum("ij,ij->i", u, tau, out=workspace.array("u_star", (n,)))
+    u_star /= c
+
+    # γ_new = sqrt((σ + sqrt(σ^2 + 4 (τ^2 + u*^2))) / 2)
+    np.square(u_star, out=u_star)
+    u_star += tau_squared
+    u_star *= 4
+    np.square(sigma, out=gamma)
+    gamma += u_star
+    np.sqrt(gamma, out=gamma)
+    gamma += sigma
+    gamma /= 2
+    np.sqrt(gamma, out=gamma)
+
+    t: NDArray[np.float64] = np.divide(
+        tau, gamma[:, np.newaxis], out=workspace.array("t", (n, 3))
+    )
+
+    # u = s (u + (u · t) t + u × t), with s = 1 / (1 + t^2)
+    cross = workspace.array("cross", (n, 3))
+    _cross(u, t, cross, workspace.array("cross_scratch", (n,)))
+    u_dot_t = np.einsum("ij,ij->i", u, t, out=workspace.array("u_dot_t", (n,)))
+    projection = np.multiply(
+        t, u_dot_t[:, np.newaxis], out=workspace.array("projection", (n, 3))
+    )
+    u += projection
+    u += cross
+    s = _squared_norm(t, workspace.array("s", (n,)))
+    s += 1
+    u /= s[:, np.newaxis]
+
+    return t
+
+
+def _to_proper_velocity(v, workspace, n, c) -> None:
+    """Replace the velocities ``v`` in place by the proper velocities ``γ v``."""
+    gamma = _squared_norm(v, workspace.array("gamma", (n,)))
+    gamma /= -(c**2)
+    gamma += 1
+    np.sqrt(gamma, out=gamma)
+    v /= gamma[:, np.newaxis]
+
+
+def _from_proper_velocity(u, workspace, n, c) -> None:
+    """Replace the proper velocities ``u`` in place by the velocities ``u / γ``."""
+    u /= _lorentz_factor(u, workspace, n, c)[:, np.newaxis]
+
+
+def _per_particle(value, n) -> NDArray[np.float64]:
+    """Broadcast a scalar or column of per-particle values to shape ``(n,)``."""
+    return np.broadcast_to(np.ravel(value), (n,))
+
+
+def _boris_loop(x, v, B, E, q, m, dt) -> None:  # pragma: no cover
+    """
+    Fused Boris push of each particle in turn, compiled with numba when it
+    is installed. ``q``, ``m`` and ``dt`` have one entry per particle.
+    """
+    for i in range(x.shape[0]):
+        hqmdt = 0.5 * q[i] * dt[i] / m[i]
+
+        vm0 = v[i, 0] + hqmdt * E[i, 0]
+        vm1 = v[i, 1] + hqmdt * E[i, 1]
+        vm2 = v[i, 2] + hqmdt * E[i, 2]
+
+        t0 = hqmdt * B[i, 0]
+        t1 = hqmdt * B[i, 1]
+        t2 = hqmdt * B[i, 2]
+        factor = 2 / (1 + t0 * t0 + t1 * t1 + t2 * t2)
+
+        vp0 = vm0 + vm1 * t2 - vm2 * t1
+        vp1 = vm1 + vm2 * t0 - vm0 * t2
+        vp2 = vm2 + vm0 * t1 - vm1 * t0
+
+        v[i, 0] = vm0 + factor * (vp1 * t2 - vp2 * t1) + hqmdt * E[i, 0]
+        v[i, 1] = vm1 + factor * (vp2 * t0 - vp0 * t2) + hqmdt * E[i, 1]
+        v[i, 2] = vm2 + factor * (vp0 * t1 - vp1 * t0) + hqmdt * E[i, 2]
+
+        x[i, 0] += v[i, 0] * dt[i]
+        x[i, 1] += v[i, 1] * dt[i]
+        x[i, 2] += v[i, 2] * dt[i]
+
+
+def _relativistic_boris_loop(x, v, B, E, q, m, dt, c) -> None:  # pragma: no cover
+    """
+    Fused relativistic Boris push of each particle in turn, compiled with
+    numba when it is installed. ``q``, ``m`` and ``dt`` have one entry per
+    particle.
+    """
+    for i in range(x.shape[0]):
+        hqmdt = 0.5 * q[i] * dt[i] / m[i]
+
+        gamma = 1 / np.sqrt(1 - (v[i, 0] ** 2 + v[i, 1] ** 2 + v[i, 2] ** 2) / c**2)
+
+        um0 = gamma * v[i, 0] + hqmdt * E[i, 0]
+        um1 = gamma * v[i, 1] + hqmdt * E[i, 1]
+        um2 = gamma * v[i, 2] + hqmdt * E[i, 2]
+
+        gamma1 = np.sqrt(1 + (um0 * um0 + um1 * um1 + um2 * um2) / c**2)
+
+        t0 = hqmdt * B[i, 0] / gamma1
+        t1 = hqmdt * B[i, 1] / gamma1
+        t2 = hqmdt * B[i, 2] / gamma1
+        factor = 2 / (1 + t0 * t0 + t1 * t1 + t2 * t2)
+
+        up0 = um0 + um1 * t2 - um2 * t1
+        up1 = um1 + um2 * t0 - um0 * t2
+        up2 = um2 + um0 * t1 - um1 * t0
+
+        un0 = um0 + factor * (up1 * t2 - up2 * t1) + hqmdt * E[i, 0]
+        un1 = um1 + factor * (up2 * t0 - up0 * t2) + hqmdt * E[i, 1]
+        un2 = um2 + factor * (up0 * t1 - up1 * t0) + hqmdt * E[i, 2]
+
+        gamma2 = np.sqrt(1 + (un0 * un0 + un1 * un1 + un2 * un2) / c**2)
+
+        v[i, 0] = un0 / gamma2
+        v[i, 1] = un1 / gamma2
+        v[i, 2] = un2 / gamma2
+
+        x[i, 0] += v[i, 0] * dt[i]
+        x[i, 1] += v[i, 1] * dt[i]
+        x[i, 2] += v[i, 2] * dt[i]
+
+
+_boris_kernel: Callable[..., None] | None = None
+_relativistic_boris_kernel: Callable[..., None] | None = None
+
+if importlib.util.find_spec("numba") is not None:  # coverage: ignore
+    import numba
+
+    _boris_kernel = numba.njit(_boris_loop)
+    _relativistic_boris_kernel = numba.njit(_relativistic_boris_loop)
+
+
 class AbstractIntegrator(ABC):
     """Outlines the necessary methods to define a particle integrator."""
 
@@ -32,7 +304,15 @@ def is_relativistic(self):
 
     @staticmethod
     @abstractmethod
-    def push(x, v, B, E, q, m, dt):
+    def push(
+        x: NDArray[np.float64],
+        v: NDArray[np.float64],
+        B: NDArray[np.float64],
+        E: NDArray[np.float64],
+        q: float | NDArray[np.float64],
+        m: float | NDArray[np.float64],
+        dt: float | NDArray[np.float64],
+    ) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
         r"""
         The method for applying a push to the specified ensemble of particles.
 
@@ -41,6 +321,19 @@ def push(x, v, B, E, q, m, dt):
         """
         ...
 
+    @classmethod
+    def push_inplace(cls, x, v, B, E, q, m, dt, workspace=None) -> None:  # noqa: ARG003
+        r"""
+        Push the specified ensemble of particles, overwriting the position
+        and velocity arrays ``x`` and ``v`` with the pushed values.
+
+        Integrators may override this method with a kernel that avoids
+        allocating temporary arrays by using the preallocated buffers of
+        ``workspace``, an `IntegratorWorkspace`. By default, the result of
+        `push` is copied into ``x`` and ``v``.
+        """
+        x[...], v[...] = cls.push(x, v, B, E, q, m, dt)
+
 
 class BorisIntegrator(AbstractIntegrator):
     """The explicit Boris pusher."""
@@ -69,11 +362,13 @@ def push(x, v, B, E, q, m, dt):
         E : `float`
             Electric field at full timestep, in SI (V/m) units.
 
-        q : `float`
-            Particle charge, in SI (coulomb) units.
+        q : `float` or `~numpy.ndarray`
+            Particle charge, in SI (coulomb) units. An array of shape
+            (N, 1) gives the charge of each particle.
 
-        m : `float`
-            Particle mass, in SI (kg) units.
+        m : `float` or `~numpy.ndarray`
+            Particle mass, in SI (kg) units. An array of shape (N, 1)
+            gives the mass of each particle.
 
         dt : `float`
             Timestep, in SI (second) units.
@@ -168,18 +463,51 @@ def push(x, v, B, E, q, m, dt):
         This ends up causing the magnetic field action to be properly "centered" in
         time, and the algorithm, being a symplectic integrator, conserves energy.
         """
-        hqmdt = 0.5 * dt * q / m
-        vminus = v + hqmdt * E
+        x = np.array(x, dtype=float)
+        v = np.array(v, dtype=float)
+        BorisIntegrator.push_inplace(x, v, B, E, q, m, dt)
+        return x, v
+
+    @staticmethod
+    def push_inplace(x, v, B, E, q, m, dt, workspace=None) -> None:
+        r"""
+        Apply the Boris push to the particles, overwriting the position and
+        velocity arrays ``x`` and ``v``.
+
+        The parameters are the same as for `push`. Temporary arrays are
+        taken from ``workspace``, an `IntegratorWorkspace`, so that repeated
+        pushes do not allocate memory. If numba is installed, a fused
+        kernel that pushes each particle in turn is used instead.
+        """
+        n = x.shape[0]
+        if _boris_kernel is not None:  # coverage: ignore
+            _boris_kernel(
+                x,
+                v,
+                B,
+                E,
+                _per_particle(q, n),
+                _per_particle(m, n),
+                _per_particle(dt, n),
+            )
+            return
+
+        if workspace is None:
+            workspace = IntegratorWorkspace()
+
+        hqmdt = _half_impulse_factor(q, m, dt, workspace, n)
+        half_impulse = np.multiply(E, hqmdt, out=workspace.array("impulse", (n, 3)))
+
+        # add first half of electric impulse
+        v += half_impulse
 
         # rotate to add magnetic field
-        t = B * hqmdt
-        s = 2 * t / (1 + (t * t).sum(axis=1, keepdims=True))
-        vprime = vminus + np.cross(vminus, t)
-        vplus = vminus + np.cross(vprime, s)
+        _rotate(v, B, hqmdt, workspace, n)
 
         # add second half of electric impulse
-        v = vplus + hqmdt * E
-        return x + v * dt, v
+        v += half_impulse
+
+        _advance_position(x, v, dt, workspace, n)
 
 
 class RelativisticBorisIntegrator(AbstractIntegrator):
@@ -206,10 +534,12 @@ def push(x, v, B, E, q, m, dt):
             magnetic field at full timestep, in SI (tesla) units.
         E : float
             electric field at full timestep, in SI (V/m) units.
-        q : float
-            particle charge, in SI (Coulomb) units.
-        m : float
-            particle mass, in SI (kg) units.
+        q : float or `~numpy.ndarray`
+            particle charge, in SI (Coulomb) units, or an array of shape
+            (N, 1) with the charge of each particle.
+        m : float or `~numpy.ndarray`
+            particle mass, in SI (kg) units, or an array of shape (N, 1)
+            with the mass of each particle.
         dt : float
             timestep, in SI (second) units.
 
@@ -235,30 +565,278 @@ def push(x, v, B, E, q, m, dt):
         .. [1] C. K. Birdsall, A. B. Langdon, "Plasma Physics via Computer
                Simulation", 2004, p. 58-63
         """
-        γ = 1 / np.sqrt(
-            1 - (np.linalg.norm(v, axis=1, keepdims=True) / _c.si.value) ** 2
-        )
-        uvel = v * γ
-
-        uvel_minus = uvel + q * E * dt / (2 * m)
-
-        γ1 = np.sqrt(
-            1 + (np.linalg.norm(uvel_minus, axis=1, keepdims=True) / _c.si.value) ** 2
-        )
+        x = np.array(x, dtype=float)
+        v = np.array(v, dtype=float)
+        RelativisticBorisIntegrator.push_inplace(x, v, B, E, q, m, dt)
+        return x, v
 
-        t = q * B * dt / (2 * γ1 * m)
-        s = 2 * t / (1 + (t * t).sum(axis=1, keepdims=True))
+    @staticmethod
+    def push_inplace(x, v, B, E, q, m, dt, workspace=None) -> None:
+        r"""
+        Apply the relativistic Boris push to the particles, overwriting the
+        position and velocity arrays ``x`` and ``v``.
 
-        uvel_prime = uvel_minus + np.cross(uvel_minus, t)
-        uvel_plus = uvel_minus + np.cross(uvel_prime, s)
-        uvel_new = uvel_plus + q * E * dt / (2 * m)
+        The parameters are the same as for `push`. Temporary arrays are
+        taken from ``workspace``, an `IntegratorWorkspace`, so that repeated
+        pushes do not allocate memory. If numba is installed, a fused
+        kernel that pushes each particle in turn is used instead.
+        """
+        n = x.shape[0]
+        c = _c.si.value
+        if _relativistic_boris_kernel is not None:  # coverage: ignore
+            _relativistic_boris_kernel(
+                x,
+                v,
+                B,
+                E,
+                _per_particle(q, n),
+                _per_particle(m, n),
+                _per_particle(dt, n),
+                c,
+            )
+            return
+
+        if workspace is None:
+            workspace = IntegratorWorkspace()
+
+        # The velocity is replaced by the proper velocity γ v
+        _to_proper_velocity(v, workspace, n, c)
+
+        hqmdt = _half_impulse_factor(q, m, dt, workspace, n)
+        half_impulse = np.multiply(E, hqmdt, out=workspace.array("impulse", (n, 3)))
+        v += half_impulse
+
+        # The rotation uses γ1 = sqrt(1 + u^2 / c^2)
+        _rotate(v, B, hqmdt, workspace, n, gamma=_lorentz_factor(v, workspace, n, c))
+        v += half_impulse
 
         # You can show that this expression is equivalent to calculating
         # v_new  then calculating γnew using the usual formula
-        γ2 = np.sqrt(
-            1 + (np.linalg.norm(uvel_new, axis=1, keepdims=True) / _c.si.value) ** 2
-        )
+        _from_proper_velocity(v, workspace, n, c)
+
+        _advance_position(x, v, dt, workspace, n)
+
+
+class VayIntegrator(AbstractIntegrator):
+    """The relativistic particle pusher of :cite:t:`vay:2008`."""
+
+    @property
+    def is_relativistic(self) -> bool:
+        r"""
+        The Vay pusher is relativistic.
+        """
+        return True
+
+    @staticmethod
+    def push(x, v, B, E, q, m, dt):
+        r"""
+        Parameters
+        ----------
+        x : `~numpy.ndarray`
+            particle position at full timestep, in SI (meter) units.
+        v : `~numpy.ndarray`
+            particle velocity at half timestep, in SI (meter/second) units.
+        B : `~numpy.ndarray`
+            magnetic field at full timestep, in SI (tesla) units.
+        E : `~numpy.ndarray`
+            electric field at full timestep, in SI (V/m) units.
+        q : float or `~numpy.ndarray`
+            particle charge, in SI (Coulomb) units, or an array of shape
+            (N, 1) with the charge of each particle.
+        m : float or `~numpy.ndarray`
+            particle mass, in SI (kg) units, or an array of shape (N, 1)
+            with the mass of each particle.
+        dt : float
+            timestep, in SI (second) units.
+
+        Returns
+        -------
+        x : `~numpy.ndarray`
+            Particle position x after the Vay push algorithm, in SI (meter) units.
+
+        v : `~numpy.ndarray`
+            Particle velocity after the Vay push algorithm, in SI (meter/second) units.
+
+        Examples
+        --------
+        A particle moving at the :math:`\mathbf{E} × \mathbf{B}` drift
+        velocity feels no force, which the Vay pusher preserves even when
+        the particle is highly relativistic.
 
-        v = uvel_new / γ2
+        >>> c = 299792458.0
+        >>> B = np.array([[0.0, 0.0, 1.0]])
+        >>> E = np.array([[0.0, 0.999 * c, 0.0]])
+        >>> x_t0 = np.array([[0.0, 0.0, 0.0]])
+        >>> v_t0 = np.array([[0.999 * c, 0.0, 0.0]])
+        >>> x_t1, v_t1 = VayIntegrator.push(
+        ...     x=x_t0, v=v_t0, B=B, E=E, q=1.0, m=1.0, dt=1.0
+        ... )
+        >>> np.allclose(v_t1, v_t0)
+        True
 
-        return x + v * dt, v
+        Notes
+        -----
+        The Boris algorithm (see `RelativisticBorisIntegrator`) does not
+        cancel the electric and magnetic forces on a particle moving at the
+        :math:`\mathbf{E} × \mathbf{B}` drift velocity when the particle is
+        relativistic, so the drift is only reproduced for time steps much
+        smaller than the gyroperiod. The pusher of :cite:t:`vay:2008` adds the
+        full electric impulse and half of the magnetic impulse from the
+        current velocity, then completes the rotation using the Lorentz
+        factor at the end of the step, found by solving a quartic equation
+        exactly. Force-free motion is then preserved for any time step, which
+        permits much larger time steps for relativistic particles.
+
+        Unlike the Boris algorithm, the Vay algorithm does not conserve
+        phase-space volume. See `HigueraCaryIntegrator` for a
+        volume-preserving pusher that also preserves the drift velocity.
+        """
+        x = np.array(x, dtype=float)
+        v = np.array(v, dtype=float)
+        VayIntegrator.push_inplace(x, v, B, E, q, m, dt)
+        return x, v
+
+    @staticmethod
+    def push_inplace(x, v, B, E, q, m, dt, workspace=None) -> None:
+        r"""
+        Apply the Vay push to the particles, overwriting the position and
+        velocity arrays ``x`` and ``v``.
+
+        The parameters are the same as for `push`. Temporary arrays are
+        taken from ``workspace``, an `IntegratorWorkspace`, so that repeated
+        pushes do not allocate memory.
+        """
+        n = x.shape[0]
+        c = _c.si.value
+        if workspace is None:
+            workspace = IntegratorWorkspace()
+
+        hqmdt = _half_impulse_factor(q, m, dt, workspace, n)
+
+        # u' = u + (q dt / m) (E + (v / 2) × B)
+        magnetic_impulse = workspace.array("impulse", (n, 3))
+        _cross(v, B, magnetic_impulse, workspace.array("cross_scratch", (n,)))
+        magnetic_impulse *= hqmdt
+        _to_proper_velocity(v, workspace, n, c)
+        v += magnetic_impulse
+        electric_impulse = np.multiply(E, hqmdt, out=magnetic_impulse)
+        electric_impulse *= 2
+        v += electric_impulse
+
+        tau = np.multiply(B, hqmdt, out=workspace.array("tau", (n, 3)))
+        _implicit_rotation(v, tau, workspace, n, c)
+
+        _from_proper_velocity(v, workspace, n, c)
+        _advance_position(x, v, dt, workspace, n)
+
+
+class HigueraCaryIntegrator(AbstractIntegrator):
+    """The relativistic particle pusher of :cite:t:`higuera:2017`."""
+
+    @property
+    def is_relativistic(self) -> bool:
+        r"""
+        The Higuera–Cary pusher is relativistic.
+        """
+        return True
+
+    @staticmethod
+    def push(x, v, B, E, q, m, dt):
+        r"""
+        Parameters
+        ----------
+        x : `~numpy.ndarray`
+            particle position at full timestep, in SI (meter) units.
+        v : `~numpy.ndarray`
+            particle velocity at half timestep, in SI (meter/second) units.
+        B : `~numpy.ndarray`
+            magnetic field at full timestep, in SI (tesla) units.
+        E : `~numpy.ndarray`
+            electric field at full timestep, in SI (V/m) units.
+        q : float or `~numpy.ndarray`
+            particle charge, in SI (Coulomb) units, or an array of shape
+            (N, 1) with the charge of each particle.
+        m : float or `~numpy.ndarray`
+            particle mass, in SI (kg) units, or an array of shape (N, 1)
+            with the mass of each particle.
+        dt : float
+            timestep, in SI (second) units.
+
+        Returns
+        -------
+        x : `~numpy.ndarray`
+            Particle position x after the Higuera–Cary push algorithm, in SI
+            (meter) units.
+
+        v : `~numpy.ndarray`
+            Particle velocity after the Higuera–Cary push algorithm, in SI
+            (meter/second) units.
+
+        Examples
+        --------
+        A particle moving at the :math:`\mathbf{E} × \mathbf{B}` drift
+        velocity feels no force, which the Higuera–Cary pusher preserves even
+        when the particle is highly relativistic.
+
+        >>> c = 299792458.0
+        >>> B = np.array([[0.0, 0.0, 1.0]])
+        >>> E = np.array([[0.0, 0.999 * c, 0.0]])
+        >>> x_t0 = np.array([[0.0, 0.0, 0.0]])
+        >>> v_t0 = np.array([[0.999 * c, 0.0, 0.0]])
+        >>> x_t1, v_t1 = HigueraCaryIntegrator.push(
+        ...     x=x_t0, v=v_t0, B=B, E=E, q=1.0, m=1.0, dt=1.0
+        ... )
+        >>> np.allclose(v_t1, v_t0)
+        True
+
+        Notes
+        -----
+        The pusher of :cite:t:`higuera:2017` has the same structure as the
+        Boris algorithm (see `RelativisticBorisIntegrator`): half of the
+        electric impulse is added, the proper velocity is rotated about the
+        magnetic field, and the second half of the electric impulse is added.
+        The rotation uses the Lorentz factor found by solving the same
+        quartic equation as `VayIntegrator`, rather than the Lorentz factor
+        before the rotation. This preserves both the phase-space volume, like
+        the Boris algorithm, and the :math:`\mathbf{E} × \mathbf{B}` drift
+        velocity, like the Vay algorithm, for any time step.
+        """
+        x = np.array(x, dtype=float)
+        v = np.array(v, dtype=float)
+        HigueraCaryIntegrator.push_inplace(x, v, B, E, q, m, dt)
+        return x, v
+
+    @staticmethod
+    def push_inplace(x, v, B, E, q, m, dt, workspace=None) -> None:
+        r"""
+        Apply the Higuera–Cary push to the particles, overwriting the position
+        and velocity arrays ``x`` and ``v``.
+
+        The parameters are the same as for `push`. Temporary arrays are
+        taken from ``workspace``, an `IntegratorWorkspace`, so that repeated
+        pushes do not allocate memory.
+        """
+        n = x.shape[0]
+        c = _c.si.value
+        if workspace is None:
+            workspace = IntegratorWorkspace()
+
+        hqmdt = _half_impulse_factor(q, m, dt, workspace, n)
+
+        # u- = u + (q dt / 2 m) E
+        _to_proper_velocity(v, workspace, n, c)
+        half_impulse = np.multiply(E, hqmdt, out=workspace.array("impulse", (n, 3)))
+        v += half_impulse
+
+        # u+ = s (u- + (u- · t) t + u- × t)
+        tau = np.multiply(B, hqmdt, out=workspace.array("tau", (n, 3)))
+        t = _implicit_rotation(v, tau, workspace, n, c)
+
+        # u_new = u+ + (q dt / 2 m) E + u+ × t
+        cross = workspace.array("cross", (n, 3))
+        _cross(v, t, cross, workspace.array("cross_scratch", (n,)))
+        v += cross
+        v += half_impulse
+
+        _from_proper_velocity(v, workspace, n, c)
+        _advance_position(x, v, dt, workspace, n)
@@ -1,13 +1,19 @@
 """
 The particle_tracker subpackage contains functionality related to the
 particle tracker class. These include the definition of the particle
-tracker, as well as the definitions of save routines and termination
-conditions.
+tracker, as well as the definitions of save routines, termination
+conditions, and analytic field sources.
 """
 
-__all__ = ["particle_tracker", "save_routines", "termination_conditions"]
+__all__ = [
+    "field_sources",
+    "particle_tracker",
+    "save_routines",
+    "termination_conditions",
+]
 
 from plasmapy.simulation.particle_tracker import (
+    field_sources,
     particle_tracker,
     save_routines,
     termination_conditions,
@@ -0,0 +1,195 @@
+"""
+Module containing the definition of field sources, which provide fields
+to the particle tracker as analytic functions of position rather than
+as quantities sampled on a grid.
+"""
+
+__all__ = [
+    "AbstractFieldSource",
+    "ForceFreeFluxRopeFieldSource",
+    "MagnetostaticFieldSource",
+]
+
+from abc import ABC, abstractmethod
+
+import astropy.units as u
+import numpy as np
+import scipy.special
+from numpy.typing import ArrayLike, NDArray
+
+from plasmapy.formulary.magnetostatics import MagnetoStatics
+from plasmapy.plasma.cylindrical_equilibria import ForceFreeFluxRope
+
+_MAGNETIC_FIELD_KEYS = ("B_x", "B_y", "B_z")
+
+
+class AbstractFieldSource(ABC):
+    r"""
+    Abstract base class for the field sources of the |ParticleTracker|.
+
+    Field sources are evaluated directly at the positions of the
+    particles on every time step, so smooth analytic fields do not
+    need to be sampled on a grid. Field sources can be used in place
+    of grids or alongside them, in which case the fields of all of the
+    grids and field sources are summed.
+    """
+
+    @property
+    @abstractmethod
+    def quantities(self) -> tuple[str, ...]:
+        r"""
+        The keys of the quantities provided by the field source, such
+        as ``"B_x"``. The keys are the same as those used by
+        `~plasmapy.plasma.grids.AbstractGrid`.
+        """
+        ...
+
+    @abstractmethod
+    def evaluate(self, pos: NDArray[np.float64]) -> dict[str, NDArray[np.float64]]:
+        r"""
+        Evaluate the quantities of the field source.
+
+        Parameters
+        ----------
+        pos : `~numpy.ndarray`, shape (N, 3)
+            The positions at which to evaluate the quantities, in meters.
+
+        Returns
+        -------
+        `dict` of `~numpy.ndarray`
+            A dictionary mapping each key in `quantities` to an array of
+            shape (N,) holding the values of that quantity in SI units.
+        """
+        ...
+
+
+class MagnetostaticFieldSource(AbstractFieldSource):
+    r"""
+    The summed magnetic field of one or more magnetostatic objects from
+    `~plasmapy.formulary.magnetostatics`, such as coils made of
+    `~plasmapy.formulary.magnetostatics.CircularWire` objects.
+
+    Parameters
+    ----------
+    *sources : `~plasmapy.formulary.magnetostatics.MagnetoStatics`
+        The magnetostatic objects providing the magnetic field.
+
+    chunk_size : `int`, optional
+        The maximum number of positions for which the magnetic field is
+        evaluated at once, which bounds the memory used by wires that
+        are divided into many segments. The default is ``4096``.
+
+    Examples
+    --------
+    >>> import astropy.units as u
+    >>> import numpy as np
+    >>> from plasmapy.formulary.magnetostatics import CircularWire
+    >>> from plasmapy.simulation.particle_tracker.field_sources import (
+    ...     MagnetostaticFieldSource,
+    ... )
+    >>> coil = CircularWire(
+    ...     np.array([0, 0, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.kA
+    ... )
+    >>> source = MagnetostaticFieldSource(coil)
+    >>> B = source.evaluate(np.zeros((1, 3)))
+    >>> np.round(B["B_z"] * 1e3, 4)
+    array([0.6283])
+    """
+
+    def __init__(self, *sources: MagnetoStatics, chunk_size: int = 4096) -> None:
+        if not sources:
+            raise ValueError("At least one magnetostatic object must be provided.")
+        for source in sources:
+            if not isinstance(source, MagnetoStatics):
+                raise TypeError(
+                    f"Expected magnetostatic objects, but got {type(source)}."
+                )
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least one.")
+
+        self.sources = sources
+        self.chunk_size = chunk_size
+
+    @property
+    def quantities(self) -> tuple[str, ...]:
+        """The keys of the components of the magnetic field."""
+        return _MAGNETIC_FIELD_KEYS
+
+    def evaluate(self, pos: NDArray[np.float64]) -> dict[str, NDArray[np.float64]]:
+        """Evaluate the magnetic field of the sources at ``pos``."""
+        B = np.zeros((pos.shape[0], 3))
+        for start in range(0, pos.shape[0], self.chunk_size):
+            chunk = slice(start, start + self.chunk_size)
+            for source in self.sources:
+                B[chunk] += source.magnetic_field(pos[chunk]).to_value(u.T)
+
+        return dict(zip(_MAGNETIC_FIELD_KEYS, B.T, strict=True))
+
+
+class ForceFreeFluxRopeFieldSource(AbstractFieldSource):
+    r"""
+    The magnetic field of a
+    `~plasmapy.plasma.cylindrical_equilibria.ForceFreeFluxRope`.
+
+    Parameters
+    ----------
+    flux_rope : `~plasmapy.plasma.cylindrical_equilibria.ForceFreeFluxRope`
+        The flux rope. Values of ``B0`` and ``alpha`` that are not
+        `~astropy.units.Quantity` objects are assumed to be in SI units.
+
+    center : `~astropy.units.Quantity`, shape (3,), optional
+        A point on the axis of the flux rope. The default is the origin.
+
+    axis : array_like, shape (3,), optional
+        The direction of the axis of the flux rope, which is the
+        direction of the axial field for positive ``B0``. The default
+        is the :math:`z` direction.
+
+    Notes
+    -----
+    The azimuthal component of the magnetic field points along
+    :math:`\hat{\mathbf{a}} × \hat{\mathbf{r}}`, where
+    :math:`\hat{\mathbf{a}}` is the direction of the axis and
+    :math:`\hat{\mathbf{r}}` is the radial direction away from it.
+    """
+
+    def __init__(
+        self,
+        flux_rope: ForceFreeFluxRope,
+        center: u.Quantity[u.m] | None = None,
+        axis: ArrayLike | None = None,
+    ) -> None:
+        self.B0 = u.Quantity(flux_rope.B0, u.T).value
+        self.alpha = u.Quantity(flux_rope.alpha, 1 / u.m).value
+
+        self.center = np.zeros(3) if center is None else center.to(u.m).value
+
+        axis = np.array([0.0, 0.0, 1.0]) if axis is None else np.asarray(axis)
+        if axis.shape != (3,) or not np.any(axis):
+            raise ValueError("The axis must be a non-zero vector of shape (3,).")
+        self.axis = axis / np.linalg.norm(axis)
+
+    @property
+    def quantities(self) -> tuple[str, ...]:
+        """The keys of the components of the magnetic field."""
+        return _MAGNETIC_FIELD_KEYS
+
+    def evaluate(self, pos: NDArray[np.float64]) -> dict[str, NDArray[np.float64]]:
+        """Evaluate the magnetic field of the flux rope at ``pos``."""
+        displacement = pos - self.center
+        axial_distance = displacement @ self.axis
+        radial = displacement - axial_distance[:, np.newaxis] * self.axis
+        r = np.linalg.norm(radial, axis=-1)
+
+        # The azimuthal field vanishes on the axis, where the azimuthal
+        # direction is undefined
+        azimuthal = np.cross(self.axis, radial)
+        on_axis = r == 0
+        azimuthal[~on_axis] /= r[~on_axis, np.newaxis]
+
+        B = self.B0 * (
+            scipy.special.j1(self.alpha * r)[:, np.newaxis] * azimuthal
+            + scipy.special.j0(self.alpha * r)[:, np.newaxis] * self.axis
+        )
+
+        return dict(zip(_MAGNETIC_FIELD_KEYS, B.T, strict=True))
@@ -7,37 +7,55 @@
 ]
 
 import collections
+import contextlib
+import copy
+import itertools
+import pickle
 import sys
+import time
+import tracemalloc
 import typing
 import warnings
-from collections.abc import Iterable
-from typing import Literal
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import ClassVar, Literal
 
 import astropy.constants as const
 import astropy.units as u
 import numpy as np
-from numpy.typing import NDArray
+from numpy.typing import ArrayLike, NDArray
 from tqdm import tqdm
 
 from plasmapy.formulary.collisions.misc import Bethe_stopping_lite
-from plasmapy.particles import Particle, particle_input
+from plasmapy.particles import (
+    ParticleLike,
+    ParticleList,
+    ParticleListLike,
+    particle_input,
+)
 from plasmapy.particles.atomic import stopping_power
-from plasmapy.plasma.grids import AbstractGrid
+from plasmapy.plasma.grids import AbstractGrid, GridCollection
 from plasmapy.plasma.plasma_base import BasePlasma
 from plasmapy.simulation.particle_integrators import (
     AbstractIntegrator,
+    IntegratorWorkspace,
     RelativisticBorisIntegrator,
 )
+from plasmapy.simulation.particle_tracker.field_sources import AbstractFieldSource
 from plasmapy.simulation.particle_tracker.save_routines import (
     AbstractSaveRoutine,
     DoNotSaveSaveRoutine,
+    SaveOnceOnCompletion,
 )
 from plasmapy.simulation.particle_tracker.termination_conditions import (
     AbstractTerminationCondition,
+    TimeElapsedTerminationCondition,
 )
 from plasmapy.utils.exceptions import PhysicsWarning, RelativityWarning
 
 _c = const.c
+_e = const.e.si.value
 _m_p = const.m_p
 
 
@@ -70,6 +88,11 @@ class to the ``run`` method.
     grids : An instance of `~plasmapy.plasma.grids.AbstractGrid`
         A Grid object or list of grid objects containing the required quantities.
         The list of required quantities varies depending on other keywords.
+        The list may also contain instances of
+        `~plasmapy.simulation.particle_tracker.field_sources.AbstractFieldSource`,
+        which are evaluated directly at the positions of the particles,
+        and whose fields are added to those interpolated from the grids.
+        A time step must be specified if no grids are provided.
 
     termination_condition : `~plasmapy.simulation.particle_tracker.termination_conditions.AbstractTerminationCondition`
         An subclass of `~plasmapy.simulation.particle_tracker.termination_conditions.AbstractTerminationCondition` which determines when the simulation has finished.
@@ -84,6 +107,9 @@ class to the ``run`` method.
         An subclass of `~plasmapy.simulation.particle_integrators.AbstractIntegrator` that is responsible for implementing the push behavior
         of the simulation when provided the electric and magnetic fields. The default value is set to `~plasmapy.simulation.particle_integrators.RelativisticBorisIntegrator`.
         See `~plasmapy.simulation.particle_integrators.AbstractIntegrator` for more information on how to implement custom push routines.
+        For relativistic particles, `~plasmapy.simulation.particle_integrators.VayIntegrator` and
+        `~plasmapy.simulation.particle_integrators.HigueraCaryIntegrator` reproduce the
+        :math:`\mathbf{E} × \mathbf{B}` drift for much larger time steps.
 
     dt : `~astropy.units.Quantity`, optional
         An explicitly set time step in units convertible to seconds.
@@ -102,8 +128,21 @@ class to the ``run`` method.
             the grid vertex closest to them.
         * 'volume averaged' : The fields experienced by a particle are a
             volume-average of the eight grid points surrounding them.
-
-        The default is 'volume averaged'.
+        * 'trilinear' : The same fields as 'volume averaged', found from
+            the coefficients of the linear polynomial within the cell
+            containing each particle, which are computed from the values
+            at its eight vertices on every push. Nothing is cached.
+        * 'tricubic' : The fields are interpolated by a piecewise cubic
+            polynomial which is continuous along with its first
+            derivatives, so the fields felt by particles are smoother
+            than with 'volume averaged'. Each field and seven of its
+            derivatives are computed once at every grid vertex and
+            cached on the grid (8 values per vertex), and the 64
+            coefficients of the cell containing each particle are
+            computed from them on every push.
+
+        The 'trilinear' and 'tricubic' options are only supported by
+        uniform grids. The default is 'volume averaged'.
 
     req_quantities : `list` of `str`, default : `None`
         A list of quantity keys required to be specified on the Grid object.
@@ -187,7 +226,9 @@ class to the ``run`` method.
 
     def __init__(
         self,
-        grids: AbstractGrid | Iterable[AbstractGrid],
+        grids: AbstractGrid
+        | AbstractFieldSource
+        | Iterable[AbstractGrid | AbstractFieldSource],
         termination_condition: AbstractTerminationCondition | None = None,
         save_routine: AbstractSaveRoutine | None = None,
         particle_integrator: type[AbstractIntegrator] | None = None,
@@ -204,10 +245,40 @@ def __init__(
             else particle_integrator()
         )
 
+        # Scratch arrays reused by the integrator on every push
+        self._workspace = IntegratorWorkspace()
+
         self._raised_relativity_warning = False
 
-        # self.grid is the grid object
-        self.grids = self._grid_factory(grids)
+        # Per-particle state derived from the position and velocity arrays,
+        # cached while the push loop is running (see `_cached_state`)
+        self._state_cache: dict[str, typing.Any] | None = None
+
+        # Compaction of the particle arrays is disabled by default
+        # (see `setup_compaction`)
+        self._compaction_interval: int | None = None
+        self._n_active: int | None = None
+        self._particle_order: NDArray[np.intp] | None = None
+
+        # Fast-forwarding of particles that will not meet any fields again is
+        # disabled by default (see `setup_fast_forward`)
+        self._fast_forward_interval: int | None = None
+        self._coasting: NDArray[np.bool_] | None = None
+        self._coast_time: NDArray[np.float64] | None = None
+
+        # Periodic checkpoints are disabled by default (see `setup_checkpoints`)
+        self._checkpoint_path: Path | None = None
+        self._checkpoint_interval: float | None = None
+
+        # Set by `resume` so that the next run continues from the checkpoint
+        self._resume_pending = False
+
+        # Profiling of the push loop is disabled by default (see `setup_profiling`)
+        self._profiler: _PhaseProfiler | None = None
+
+        # self.grids is the list of grid objects, and self.field_sources
+        # is the list of analytic field sources
+        self.grids, self.field_sources = self._grid_factory(grids)
 
         # Errors for unsupported grid types are raised in the validate constructor inputs method
 
@@ -227,6 +298,12 @@ def __init__(
                 "Specifying a time step range is only possible for an adaptive time step."
             )
 
+        # The adaptive time step falls back on the resolution of the grids
+        if self._is_adaptive_time_step and not self.grids:
+            raise ValueError(
+                "Please specify a time step for simulations without grids."
+            )
+
         self.verbose = verbose
 
         # This flag records whether the simulation has been run
@@ -247,12 +324,16 @@ def __init__(
         self._required_quantities = self._REQUIRED_QUANTITIES.copy()
         self._preprocess_grids(req_quantities)
 
-        # self.grid_arr is the grid positions in si units. This is created here
-        # so that it isn't continuously called later
-        self.grids_arr = [grid.grid.to(u.m).value for grid in self.grids]
+        # A spatial index of the grids, used to find the grids containing
+        # each particle without testing every particle against every grid
+        self._grid_collection = GridCollection(self.grids)
 
         self.dt = dt.to(u.s).value if dt is not None else None
 
+        # The time step set by the user, which is kept separately since
+        # `self.dt` holds the time step of the latest push
+        self._fixed_dt = self.dt
+
         dt_range = [0, np.inf] * u.s if dt_range is None else dt_range
         self.dt_range = dt_range.to(u.s).value
 
@@ -268,16 +349,24 @@ def __init__(
     def _grid_factory(grids):
         """
         Take the user provided argument for grids and convert it into the proper type.
+
+        Returns a list of the grids and a list of the field sources, or
+        `None` in place of the grids if the argument is not recognized.
         """
 
-        if isinstance(grids, AbstractGrid):
-            return [
+        if isinstance(grids, AbstractGrid | AbstractFieldSource):
+            grids = [
                 grids,
             ]
-        elif isinstance(grids, collections.abc.Iterable):
-            return grids
-        else:
-            return None
+        elif not isinstance(grids, collections.abc.Iterable):
+            return None, []
+
+        grids = list(grids)
+        field_sources = [
+            source for source in grids if isinstance(source, AbstractFieldSource)
+        ]
+        grids = [grid for grid in grids if not isinstance(grid, AbstractFieldSource)]
+        return grids, field_sources
 
     def _set_time_step_attributes(
         self, dt, termination_condition, save_routine
@@ -333,7 +422,9 @@ def setup_adaptive_time_step(
         with the gyroradius of the particle takes a ``time_steps_per_gyroperiod`` parameter that specifies
         how many times the orbit of a gyrating particles will be subdivided. The other candidate,
         associated with the spatial resolution of the grid object, calculates a time step using the time
-        it would take the fastest particle to cross some fraction of a grid cell length. This fraction is the Courant number.
+        it would take each particle to cross some fraction of the length of the grid cell it is in. This fraction is
+        the Courant number. The local cell length is given by `~plasmapy.plasma.grids.AbstractGrid.local_resolution`,
+        so particles in coarsely resolved regions of a grid can take larger time steps.
         """
 
         if not self._is_adaptive_time_step:
@@ -344,6 +435,319 @@ def setup_adaptive_time_step(
         self._steps_per_gyroperiod = time_steps_per_gyroperiod
         self._Courant_parameter = Courant_parameter
 
+    def setup_compaction(
+        self, interval: int = 10, min_inactive_fraction: float = 0.25
+    ) -> None:
+        """Periodically move the tracked particles to the start of the particle arrays.
+
+        Stopped and removed particles remain in the particle arrays. When
+        most particles have stopped or left the simulation, as in
+        radiography, compacting the arrays lets each push step operate on
+        the tracked particles only, rather than scanning every particle.
+
+        Parameters
+        ----------
+        interval : int, optional
+            The number of push steps between checks of whether the
+            particle arrays should be compacted. The default is ten.
+
+        min_inactive_fraction : float, optional
+            The particle arrays are compacted only if at least this
+            fraction of the particles that were tracked at the last
+            compaction are no longer tracked. The default is 0.25.
+
+        Notes
+        -----
+        While the simulation is running, the particle arrays are stored
+        in the compacted order. Save routines store the particles in the
+        order they were loaded, and the original order is restored once
+        the simulation has finished.
+        """
+        self._enforce_order()
+
+        if interval < 1:
+            raise ValueError(
+                f"The compaction interval must be a positive integer, got {interval}."
+            )
+
+        if not 0 <= min_inactive_fraction <= 1:
+            raise ValueError(
+                "The minimum inactive fraction must be between zero and one, "
+                f"got {min_inactive_fraction}."
+            )
+
+        self._compaction_interval = interval
+        self._compaction_min_inactive_fraction = min_inactive_fraction
+
+    def setup_fast_forward(self, interval: int = 1) -> None:
+        """Stop pushing particles that will not meet the fields of any grid again.
+
+        A particle outside of every grid, whose straight-line path does not
+        cross the bounding box of any grid, moves at a constant velocity for
+        the rest of the simulation. Such particles leave the push loop, and
+        are instead advanced analytically. For a synchronized time step,
+        they are advanced to the current time whenever the simulation is
+        saved and when it finishes. Otherwise, each fast-forwarded particle
+        keeps its position and time from when it left the push loop.
+
+        Parameters
+        ----------
+        interval : int, optional
+            The number of push steps between searches for particles to
+            fast-forward. The default is one.
+
+        Notes
+        -----
+        The fields are assumed to vanish outside of the grids, so this is
+        not possible for simulations with field sources. While the
+        simulation is running, fast-forwarded particles are not counted
+        as tracked. Once every remaining particle has been fast-forwarded,
+        the time continues to advance by the last time step until the
+        termination condition is met, without pushing any particles, so
+        that the save routine keeps saving the fast-forwarded particles.
+        Without a save routine, the simulation ends instead, and if the
+        termination condition is a
+        `~plasmapy.simulation.particle_tracker.termination_conditions.TimeElapsedTerminationCondition`
+        the particles are advanced to the termination time.
+        """
+        self._enforce_order()
+
+        if self.field_sources:
+            raise ValueError(
+                "Particles cannot be fast-forwarded in simulations with field "
+                "sources, whose fields are not confined to the grids."
+            )
+
+        if interval < 1:
+            raise ValueError(
+                f"The fast-forward interval must be a positive integer, got {interval}."
+            )
+
+        self._fast_forward_interval = interval
+
+    def setup_checkpoints(self, path: str | Path, interval: u.Quantity) -> None:
+        """Periodically save a checkpoint of the simulation while it is running.
+
+        Parameters
+        ----------
+        path : `str` or `~pathlib.Path`
+            The file the checkpoints are written to. Each checkpoint
+            replaces the previous one.
+
+        interval : `~astropy.units.Quantity`
+            The wall-clock time between checkpoints.
+
+        See Also
+        --------
+        checkpoint
+        resume
+        """
+        self._enforce_order()
+
+        interval = interval.to(u.s).value
+        if interval <= 0:
+            raise ValueError(
+                f"The checkpoint interval must be positive, got {interval} s."
+            )
+
+        self._checkpoint_path = Path(path)
+        self._checkpoint_interval = interval
+
+    # Attributes that refer to the grids, or are rebuilt from them when a
+    # simulation is resumed, and are therefore not saved in checkpoints
+    _unsaved_attributes: ClassVar[tuple[str, ...]] = (
+        "grids",
+        "field_sources",
+        "_grid_collection",
+        "_field_interpolators",
+        "_state_cache",
+        "_workspace",
+        "_profiler",
+    )
+
+    _checkpoint_format_version: ClassVar[int] = 1
+
+    def checkpoint(self, path: str | Path) -> None:
+        """Save the state of the simulation so that it can be resumed.
+
+        The checkpoint contains the particles, the time and iteration
+        number of the simulation, and the termination condition and save
+        routine including their state, but not the grids.
+
+        Parameters
+        ----------
+        path : `str` or `~pathlib.Path`
+            The file to write the checkpoint to. The file is replaced
+            only once the checkpoint has been written completely.
+
+        See Also
+        --------
+        resume
+        setup_checkpoints
+
+        Notes
+        -----
+        Checkpoints are written with `pickle`, so the stopping powers used
+        by ``add_stopping``, the termination condition, and the save routine
+        must be able to be pickled. Only resume checkpoints from trusted
+        sources.
+        """
+        path = Path(path)
+
+        # The saves made before the checkpoint must be on disk before it is
+        if self.save_routine is not None:
+            self.save_routine.flush()
+
+        state = {
+            key: value
+            for key, value in vars(self).items()
+            if key not in self._unsaved_attributes
+        }
+        checkpoint = {
+            "format_version": self._checkpoint_format_version,
+            "tracker_class": type(self).__name__,
+            "in_progress": self._state_cache is not None,
+            "state": state,
+        }
+
+        # Write to a temporary file first so that an interrupted write does
+        # not destroy the previous checkpoint
+        temporary_path = path.with_name(f"{path.name}.tmp")
+        with temporary_path.open("wb") as file:
+            _CheckpointPickler(file, self).dump(checkpoint)
+        temporary_path.replace(path)
+
+    @classmethod
+    def resume(
+        cls,
+        path: str | Path,
+        grids: AbstractGrid
+        | AbstractFieldSource
+        | Iterable[AbstractGrid | AbstractFieldSource],
+    ) -> "ParticleTracker":
+        """Create a simulation from a checkpoint.
+
+        If the checkpoint was saved while the simulation was running,
+        calling `run` on the returned simulation continues it from the
+        state in the checkpoint.
+
+        Parameters
+        ----------
+        path : `str` or `~pathlib.Path`
+            A checkpoint written by `checkpoint`.
+
+        grids : An instance of `~plasmapy.plasma.grids.AbstractGrid`
+            The grids and field sources of the simulation, which are not
+            saved in checkpoints.
+
+        Returns
+        -------
+        `ParticleTracker`
+            The resumed simulation.
+
+        See Also
+        --------
+        checkpoint
+        setup_checkpoints
+        """
+        tracker = cls.__new__(cls)
+
+        with Path(path).open("rb") as file:
+            checkpoint = _CheckpointUnpickler(file, tracker).load()
+
+        if checkpoint["tracker_class"] != cls.__name__:
+            raise TypeError(
+                f"The checkpoint in {path} is of a {checkpoint['tracker_class']}, "
+                f"not a {cls.__name__}."
+            )
+        if checkpoint["format_version"] > cls._checkpoint_format_version:
+            raise ValueError(
+                f"The checkpoint in {path} has format version "
+                f"{checkpoint['format_version']}, which is newer than the "
+                f"supported version {cls._checkpoint_format_version}."
+            )
+
+        vars(tracker).update(checkpoint["state"])
+        tracker._state_cache = None  # noqa: SLF001
+        tracker._workspace = IntegratorWorkspace()  # noqa: SLF001
+        tracker._resume_pending = checkpoint["in_progress"]  # noqa: SLF001
+        tracker._profiler = None  # noqa: SLF001
+
+        tracker.grids, tracker.field_sources = tracker._grid_factory(grids)  # noqa: SLF001
+        if tracker.grids is None:
+            raise TypeError("Type of argument `grids` not recognized.")
+        tracker._preprocess_grids(None)  # noqa: SLF001
+        tracker._grid_collection = GridCollection(tracker.grids)  # noqa: SLF001
+
+        return tracker
+
+    def setup_profiling(
+        self,
+        callback: Callable[[int, dict[str, float]], None] | None = None,
+        track_memory: bool = False,
+    ) -> None:
+        """Record the time spent in each phase of the push loop.
+
+        The phases are finding the grids containing the particles
+        (``"grid lookup"``), the interpolation of the fields of each grid
+        (``"interpolation (grid 0)"``, ...), the evaluation of each field
+        source (``"field source 0"``, ...), the time step calculation
+        (``"time step"``), the integrator (``"integrator"``), stopping
+        (``"stopping"``), the save routine (``"save"``), the termination
+        condition (``"termination"``), and fast-forwarding
+        (``"fast forward"``), compaction and checkpoints if they are
+        enabled. The totals are available from
+        `profiling_report` once the simulation has run.
+
+        Parameters
+        ----------
+        callback : callable, optional
+            A function called after every push step with the iteration
+            number and a dictionary mapping the name of each phase to the
+            time spent in it during the step, in seconds.
+
+        track_memory : `bool`, optional
+            If `True`, the peak memory allocated during each phase is also
+            recorded using `tracemalloc`, which slows the simulation down
+            considerably. The default is `False`.
+
+        Notes
+        -----
+        Profiling is not applied to the shards of a parallel run.
+        """
+        self._enforce_order()
+
+        self._profiler = _PhaseProfiler(callback, track_memory)
+
+    @property
+    def profiling_report(self) -> dict[str, dict[str, typing.Any]]:
+        """The time spent in each phase of the push loop.
+
+        Maps the name of each phase to a dictionary containing the number
+        of times the phase ran (``"calls"``), the total time spent in it
+        (``"time"``), the mean time per call (``"mean_time"``), and the
+        fraction of the profiled time spent in it (``"fraction"``). If
+        memory is tracked, it also contains the largest peak of memory
+        allocated during one call (``"peak_memory"``).
+
+        See Also
+        --------
+        setup_profiling
+        """
+        if self._profiler is None:
+            raise RuntimeError(
+                "Profiling is not enabled. Call `setup_profiling` before running "
+                "the simulation."
+            )
+
+        return self._profiler.report()
+
+    def _profile(self, phase: str) -> contextlib.AbstractContextManager[None]:
+        """A context manager recording the time spent in ``phase``."""
+        if self._profiler is None:
+            return _NOT_PROFILED
+        return self._profiler.phase(phase)
+
     def _validate_constructor_inputs(
         self, grids, termination_condition, save_routine, field_weighting: str
     ) -> None:
@@ -361,6 +765,8 @@ def _validate_constructor_inputs(
         # The constructor did not recognize the provided grid object
         elif self.grids is None:
             raise TypeError("Type of argument `grids` not recognized.")
+        elif not self.grids and not self.field_sources:
+            raise ValueError("Please specify at least one grid or field source.")
 
         if not isinstance(termination_condition, AbstractTerminationCondition):
             raise TypeError("Please specify a valid termination condition.")
@@ -369,7 +775,12 @@ def _validate_constructor_inputs(
             raise TypeError("Please specify a valid save routine.")
 
         # Load and validate inputs
-        field_weightings = ["volume averaged", "nearest neighbor"]
+        field_weightings = [
+            "volume averaged",
+            "nearest neighbor",
+            "trilinear",
+            "tricubic",
+        ]
         if field_weighting in field_weightings:
             self.field_weighting = field_weighting
         else:
@@ -412,8 +823,12 @@ def _preprocess_grids(self, additional_required_quantities) -> None:
 
         for grid in self.grids:
             for rq in self._required_quantities:
+                # Statistics are streamed so that quantities stored on disk
+                # are never loaded into memory all at once
+                all_finite, max_abs, edge_max = grid._quantity_statistics(rq)  # noqa: SLF001
+
                 # Check that there are no infinite values
-                if not np.isfinite(grid[rq].value).all():
+                if not all_finite:
                     raise ValueError(
                         f"Input arrays must be finite: {rq} contains "
                         "either NaN or infinite values."
@@ -421,27 +836,7 @@ def _preprocess_grids(self, additional_required_quantities) -> None:
 
                 # Check that the max values on the edges of the arrays are
                 # small relative to the maximum values on that grid
-                #
-                # Array must be dimensionless to re-assemble it into an array
-                # of max values like this
-                arr = np.abs(grid[rq]).value
-                edge_max = np.max(
-                    np.array(
-                        [
-                            np.max(a)
-                            for a in (
-                                arr[0, :, :],
-                                arr[-1, :, :],
-                                arr[:, 0, :],
-                                arr[:, -1, :],
-                                arr[:, :, 0],
-                                arr[:, :, -1],
-                            )
-                        ]
-                    )
-                )
-
-                if edge_max > 1e-3 * np.max(arr):
+                if edge_max > 1e-3 * max_abs:
                     unit = grid.recognized_quantities[rq].unit
                     warnings.warn(
                         "Quantities should go to zero at edges of grid to avoid "
@@ -466,7 +861,7 @@ def load_particles(
         self,
         x,
         v,
-        particle: Particle,
+        particle: ParticleLike | ParticleListLike,
     ) -> None:
         r"""
         Load arrays of particle positions and velocities.
@@ -479,17 +874,15 @@ def load_particles(
         v : `~astropy.units.Quantity`, shape (N,3)
             Velocities for N particles
 
-        particle : |particle-like|
+        particle : |particle-like| or |particle-list-like|
             Representation of the particle species as either a |Particle| object
-            or a string representation.
+            or a string representation. Ensembles of several species are
+            loaded by providing a |ParticleList| (or a list of particle-like
+            objects) with the species of each of the N particles.
         """
         # Raise an error if the run method has already been called.
         self._enforce_order()
 
-        self.q = particle.charge.to(u.C).value
-        self.m = particle.mass.to(u.kg).value
-        self._particle = particle
-
         if x.shape[0] != v.shape[0]:
             raise ValueError(
                 "Provided x and v arrays have inconsistent numbers "
@@ -499,9 +892,38 @@ def load_particles(
         else:
             self.nparticles: int = x.shape[0]
 
+        if isinstance(particle, ParticleList):
+            if len(particle) != self.nparticles:
+                raise ValueError(
+                    f"The number of particle species ({len(particle)}) does not "
+                    f"match the number of particles ({self.nparticles})."
+                )
+
+            # The charges and masses are columns, which broadcast against
+            # the (N, 3) arrays of positions and velocities
+            self.q = particle.charge.to(u.C).value[:, np.newaxis]
+            self.m = particle.mass.to(u.kg).value[:, np.newaxis]
+
+            # The distinct species, and the index of the species of each
+            # particle, which are used to calculate stopping powers
+            self._species_index: NDArray[np.intp] | None
+            _, first, self._species_index = np.unique(
+                particle.symbols, return_index=True, return_inverse=True
+            )
+            self._species = [particle[i] for i in first]
+        else:
+            self.q = particle.charge.to(u.C).value
+            self.m = particle.mass.to(u.kg).value
+            self._species = [particle]
+            self._species_index = None
+
         self.x = x.to(u.m).value
         self.v = v.to(u.m / u.s).value
 
+        self._n_active = None
+        self._particle_order = None
+        self._invalidate_particle_state()
+
     def _is_quantity_defined_on_one_grid(self, quantity: str) -> bool:
         r"""
         Check to ensure the provided quantity string is defined on at least one grid.
@@ -572,6 +994,11 @@ def add_stopping(
         PSTAR database. This information is combined with the mass density
         quantity provided in the grids to calculate the energy loss over the
         distance travelled during a timestep.
+
+        The stopping powers are tabulated once, at log-uniformly spaced
+        energies (or speeds, for the Bethe model), and interpolated linearly
+        in the push loop. The stopping powers of the materials of all of
+        the grids are summed into a single table.
         """
 
         # Check inputs for user error and raise respective exceptions/warnings if
@@ -587,9 +1014,9 @@ def add_stopping(
                     grid.require_quantities(["rho"], replace_with_zeros=True)
 
                 self._required_quantities.update({"rho"})
-                stopping_power_interpolators = [
-                    stopping_power(self._particle, material, return_interpolator=True)
-                    for material in materials
+                stopping_power_tables = [
+                    _NIST_stopping_power_table(species, materials)
+                    for species in self._species
                 ]
 
             case "Bethe":
@@ -600,19 +1027,10 @@ def add_stopping(
                 self._required_quantities.update({"n_e"})
                 self._raised_energy_warning = False
 
-                # These functions are used to represent that the mean excitation energy
-                # does not change over space for a given grid.
-                def wrapped_Bethe_stopping(I_grid):
-                    def inner_Bethe_stopping(v, n_e):
-                        return Bethe_stopping_lite(
-                            I_grid, n_e, v, self._particle.charge_number
-                        )
-
-                    return inner_Bethe_stopping
-
-                stopping_power_interpolators = [
-                    wrapped_Bethe_stopping(I_grid.si.value) for I_grid in I
-                ]
+                # The mean excitation energy does not change over space for a
+                # given grid, and the Bethe stopping power of every species is
+                # proportional to the square of its charge number
+                stopping_power_tables = [_Bethe_stopping_power_table(I)]
 
             case _:
                 raise ValueError(
@@ -621,37 +1039,101 @@ def inner_Bethe_stopping(v, n_e):
 
         self._do_stopping = True
         self._stopping_method = method
-        self._stopping_power_interpolators = stopping_power_interpolators
+        self._stopping_power_tables = stopping_power_tables
 
-    def run(self) -> None:
+    def run(self, n_processes: int = 1) -> None:
         r"""
         Runs a particle-tracing simulation.
         Time steps are adaptively calculated based on the local grid resolution
         of the particles and the electric and magnetic fields they are
         experiencing.
 
+        Parameters
+        ----------
+        n_processes : int, optional
+            The number of processes to run the simulation on. If greater
+            than one, the particles are split into this many shards which
+            are pushed in parallel by a pool of processes, and the results
+            of the shards are merged once they have all finished. The
+            default is one.
+
         Returns
         -------
         None
 
+        Notes
+        -----
+        Since particles do not interact, each shard is an independent
+        simulation of its particles. Each shard is pushed until its own
+        termination condition is met, and a synchronized adaptive time step
+        is only synchronized across the particles of a shard. For this
+        reason, simulations with an adaptive time step can only be run on
+        more than one process with a save routine that does not save
+        during the simulation, such as
+        `~plasmapy.simulation.particle_tracker.save_routines.SaveOnceOnCompletion`.
+        Otherwise, every shard must save at the same times. The shards save to memory, and save routines with
+        an output directory write the files of their saves once the shards
+        have finished. While the shards are running, the quantities of the
+        grids are placed in shared memory so that they are not copied to
+        every process. The stopping powers used by ``add_stopping`` and
+        the quantities of the grids must be able to be pickled.
         """
 
         self._enforce_particle_creation()
 
-        # Keep track of how many push steps have occurred for trajectory tracing
-        # This number is independent of the current "time" of the simulation
-        self.iteration_number = 0
+        if n_processes < 1:
+            raise ValueError(
+                f"The number of processes must be at least one, got {n_processes}."
+            )
 
-        # The time state of a simulation with synchronized time step can be described
-        # by a single number. Otherwise, a time value is required for each particle.
-        self.time: NDArray[np.float64] | float = (
-            np.zeros((self.nparticles, 1)) if not self.is_synchronized_time_step else 0
-        )
+        if (
+            n_processes > 1
+            and self._is_adaptive_time_step
+            and not isinstance(
+                self.save_routine, DoNotSaveSaveRoutine | SaveOnceOnCompletion
+            )
+        ):
+            raise ValueError(
+                "Simulations with an adaptive time step can only be run on more "
+                "than one process with a save routine that does not save during "
+                "the simulation, since each process chooses its own time step "
+                "and so saves at different times."
+            )
 
-        # Entered grid -> non-zero if particle EVER entered any grid
-        self.entered_grid: NDArray[np.bool_] = np.zeros([self.nparticles]).astype(
-            np.bool_
-        )
+        try:
+            if n_processes == 1:
+                self._run_push_loop()
+            else:
+                self._run_sharded(n_processes)
+
+            # Simulation has finished running
+            self._has_run = True
+
+            # Force save of the final state of the simulation if a save routine
+            # is provided
+            if self.save_routine is not None:
+                self.save_routine.save()
+        finally:
+            # Wait for any saves being written in the background, even if the
+            # simulation failed, so that the output is not left incomplete
+            if self.save_routine is not None:
+                self.save_routine.flush()
+
+        self._log("Run completed")
+
+    def _run_push_loop(self) -> None:
+        r"""
+        Push the particles until the termination condition is satisfied or
+        no particles are being tracked.
+        """
+        self._setup_field_interpolators()
+
+        if self._resume_pending:
+            # Continue from the time, iteration number and particle order
+            # of the checkpoint
+            self._resume_pending = False
+        else:
+            self._initialize_run_state()
 
         # Initialize a "progress bar" (really more of a meter)
         # Setting sys.stdout lets this play nicely with regular print()
@@ -665,37 +1147,231 @@ def run(self) -> None:
             file=sys.stdout,
         )
 
+        # Derived particle state is cached between changes to the particles
+        # while the push loop is running
+        self._state_cache = {}
+
+        last_checkpoint = time.monotonic()
+
         # Push the particles until the termination condition is satisfied
         # or the number of particles being evolved is zero
+        if self._profiler is not None:
+            self._profiler.start()
+
         is_finished = False
-        while not (is_finished or self.nparticles_tracked == 0):
-            is_finished = self.termination_condition.is_finished
-            progress = min(
-                self.termination_condition.progress, self.termination_condition.total
-            )
+        while not (is_finished or self._is_out_of_particles()):
+            with self._profile("termination"):
+                is_finished = self.termination_condition.is_finished
+                progress = min(
+                    self.termination_condition.progress,
+                    self.termination_condition.total,
+                )
 
             pbar.n = progress
             pbar.last_print_n = progress
             pbar.update(0)
 
-            self._push()
+            self._step()
+
+            if (
+                self._fast_forward_interval is not None
+                and self.iteration_number % self._fast_forward_interval == 0
+            ):
+                with self._profile("fast forward"):
+                    self._fast_forward_particles()
 
             # The state of a step is saved after each time step by calling `post_push_hook`
             # The save routine may choose to do nothing with this information
             if self.save_routine is not None:
-                self.save_routine.post_push_hook()
+                with self._profile("save"):
+                    self._save_step()
 
-        # Simulation has finished running
-        self._has_run = True
+            if (
+                self._compaction_interval is not None
+                and self.iteration_number % self._compaction_interval == 0
+            ):
+                with self._profile("compaction"):
+                    self._compact_particles()
+
+            # The checkpoint path and interval are set together
+            if (
+                self._checkpoint_path is not None
+                and self._checkpoint_interval is not None
+                and time.monotonic() - last_checkpoint >= self._checkpoint_interval
+            ):
+                with self._profile("checkpoint"):
+                    self.checkpoint(self._checkpoint_path)
+                last_checkpoint = time.monotonic()
 
-        # Force save of the final state of the simulation if a save routine is
-        # provided
-        if self.save_routine is not None:
-            self.save_routine.save()
+            if self._profiler is not None:
+                self._profiler.end_step(self.iteration_number)
+
+        if self._profiler is not None:
+            self._profiler.stop()
+
+        self._finish_fast_forward()
+
+        self._state_cache = None
+        self._restore_particle_order()
 
         pbar.close()
 
-        self._log("Run completed")
+    def _is_out_of_particles(self) -> bool:
+        r"""
+        Whether no particles are left to push. Once every remaining particle
+        has been fast-forwarded, the simulation continues without pushing
+        only if the fast-forwarded particles still need to be saved.
+        """
+        if self.nparticles_tracked > 0:
+            return False
+
+        return not (
+            self._coasting is not None
+            and not isinstance(self.save_routine, DoNotSaveSaveRoutine)
+            and self.is_synchronized_time_step
+            and np.any(self._coasting)
+        )
+
+    def _step(self) -> None:
+        r"""
+        Push the tracked particles. While every remaining particle is
+        fast-forwarded, only advance the time by the last time step.
+        """
+        if self.nparticles_tracked > 0:
+            self._push()
+        else:
+            self.iteration_number += 1
+            self.time += self.dt
+
+    def _save_step(self) -> None:
+        r"""Pass the state of the simulation after a push to the save routine."""
+        # Fast-forwarded particles are only moved when they are saved
+        if self._coasting is not None and self.save_routine.save_now:
+            self._advance_coasting_particles()
+
+        self.save_routine.post_push_hook()
+
+    def _initialize_run_state(self) -> None:
+        r"""Set the time, iteration number, and entered grid flags for a new run."""
+        # Keep track of how many push steps have occurred for trajectory tracing
+        # This number is independent of the current "time" of the simulation
+        self.iteration_number = 0
+
+        # The time state of a simulation with synchronized time step can be described
+        # by a single number. Otherwise, a time value is required for each particle.
+        self.time: NDArray[np.float64] | float = (
+            np.zeros((self.nparticles, 1)) if not self.is_synchronized_time_step else 0
+        )
+
+        # Entered grid -> non-zero if particle EVER entered any grid
+        self.entered_grid: NDArray[np.bool_] = np.zeros([self.nparticles]).astype(
+            np.bool_
+        )
+
+        # The particles that have left the push loop (see `setup_fast_forward`),
+        # and the time of their positions
+        if self._fast_forward_interval is not None:
+            self._coasting = np.zeros(self.nparticles, dtype=np.bool_)
+            self._coast_time = np.zeros(self.nparticles)
+
+    def _run_sharded(self, n_processes: int) -> None:
+        r"""
+        Split the particles into shards, push each shard in a separate
+        process, and merge the final states of the shards.
+        """
+        bounds = np.linspace(0, self.nparticles, n_processes + 1).astype(int)
+        shards = [
+            self._make_shard(slice(start, stop))
+            for start, stop in itertools.pairwise(bounds)
+            if stop > start
+        ]
+
+        self._log(f"Running {len(shards)} shards in parallel")
+
+        with contextlib.ExitStack() as stack:
+            for grid in self.grids:
+                stack.enter_context(grid._shared_quantities())  # noqa: SLF001
+
+            with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                shard_states = list(executor.map(_run_shard, shards))
+
+        self._merge_shards(shard_states)
+
+    def _make_shard(self, particles: slice) -> "ParticleTracker":
+        r"""
+        Create a copy of the tracker that simulates only the particles
+        selected by ``particles``.
+        """
+        shard = copy.copy(self)
+        for name in self._per_particle_attributes():
+            setattr(shard, name, getattr(self, name)[particles])
+        shard.nparticles = shard.x.shape[0]
+        shard.dt = shard._fixed_dt  # noqa: SLF001
+        shard.verbose = False
+        shard._workspace = IntegratorWorkspace()  # noqa: SLF001
+        shard._checkpoint_interval = None  # noqa: SLF001
+        shard._profiler = None  # noqa: SLF001
+
+        shard.termination_condition = copy.copy(self.termination_condition)
+        shard.termination_condition.tracker = shard
+
+        # Shards record their saves in memory, which are merged afterwards
+        if self.save_routine is not None:
+            shard.save_routine = self.save_routine._shard_copy(shard)  # noqa: SLF001
+
+        return shard
+
+    def _merge_shards(self, shard_states: list[dict[str, typing.Any]]) -> None:
+        r"""Combine the final states of the shards of a parallel run."""
+        self.x = np.concatenate([state["x"] for state in shard_states])
+        self.v = np.concatenate([state["v"] for state in shard_states])
+        self.entered_grid = np.concatenate(
+            [state["entered_grid"] for state in shard_states]
+        )
+        self.iteration_number = max(state["iteration_number"] for state in shard_states)
+
+        if self.is_synchronized_time_step:
+            self.time = max(state["time"] for state in shard_states)
+        else:
+            self.time = np.concatenate([state["time"] for state in shard_states])
+
+        self._invalidate_particle_state()
+
+        if self.save_routine is None:
+            return
+
+        # Per-particle quantities saved by each shard are concatenated, while
+        # other quantities (such as the time) must be the same in every shard
+        results = [state["results"] for state in shard_states]
+        merged_results = {}
+        for key in results[0]:
+            histories = [shard_results[key] for shard_results in results]
+            if len({len(history) for history in histories}) > 1:
+                raise RuntimeError(
+                    f"The shards of the simulation saved {key} a different number "
+                    "of times, so their results cannot be merged. Use a save "
+                    "routine that only saves on completion, or a fixed time step "
+                    "and a termination condition that ends every shard at the "
+                    "same time."
+                )
+
+            merged_results[key] = [
+                _merge_shard_entries(key, entries, shard_states)
+                for entries in zip(*histories, strict=True)
+            ]
+
+        # Each save is named after the latest iteration of any shard at
+        # that save, as the final save is named after the latest iteration
+        save_iterations = [
+            max(iterations)
+            for iterations in zip(
+                *(state["save_iterations"] for state in shard_states), strict=True
+            )
+        ]
+
+        self.save_routine._merge_shard_results(  # noqa: SLF001
+            merged_results, save_iterations
+        )
 
     @property
     def num_entered(self):
@@ -727,7 +1403,11 @@ def _stop_particles(self, particles_to_stop_mask) -> None:
                 f"Expected mask of size {self.x.shape[0]}, got {len(particles_to_stop_mask)}"
             )
 
-        self.v[particles_to_stop_mask] = np.nan
+        # The push loop calls this every step when stopping is enabled, so
+        # the cached state is kept if no particles are stopped
+        if np.any(particles_to_stop_mask):
+            self.v[particles_to_stop_mask] = np.nan
+            self._invalidate_particle_state()
 
     def _remove_particles(self, particles_to_remove_mask) -> None:
         """Remove the specified particles from the simulation.
@@ -743,6 +1423,196 @@ def _remove_particles(self, particles_to_remove_mask) -> None:
 
         self.x[particles_to_remove_mask] = np.nan
         self.v[particles_to_remove_mask] = np.nan
+        self._invalidate_particle_state()
+
+    def _fast_forward_particles(self) -> None:
+        """
+        Remove the tracked particles that will not meet the fields of any
+        grid again from the push loop.
+        """
+        tracked = self._tracked_particle_index
+        pos_tracked, vel_tracked = self.x[tracked], self.v[tracked]
+
+        # A particle meets a grid again if its path leaves the bounding box
+        # of the grid in the future. Paths that miss the box give NaN.
+        meets_grid = np.zeros(pos_tracked.shape[0], dtype=np.bool_)
+        for grid in self.grids:
+            _, t_exit = grid.ray_intersections(pos_tracked, vel_tracked)
+            meets_grid |= t_exit >= 0
+
+        if meets_grid.all():
+            return
+
+        coasting = np.arange(self.x.shape[0])[tracked][~meets_grid]
+        self._coasting[coasting] = True
+        if self.is_synchronized_time_step:
+            self._coast_time[coasting] = self.time
+        self._invalidate_particle_state()
+
+    def _advance_coasting_particles(self) -> None:
+        """
+        Move the fast-forwarded particles to the current time, if the time
+        step is synchronized.
+        """
+        coasting_mask, coast_time = self._coasting, self._coast_time
+        if (
+            coasting_mask is None
+            or coast_time is None
+            or not self.is_synchronized_time_step
+        ):
+            return
+
+        coasting = np.flatnonzero(coasting_mask)
+        if coasting.size == 0:
+            return
+
+        elapsed = self.time - coast_time[coasting]
+        self.x[coasting] += self.v[coasting] * elapsed[:, np.newaxis]
+        coast_time[coasting] = self.time
+        self._invalidate_motion_state()
+
+    def _finish_fast_forward(self) -> None:
+        """
+        Advance the fast-forwarded particles to the end of the simulation,
+        and return them to the tracked particles.
+        """
+        if self._coasting is None:
+            return
+
+        # The push loop ends early if every remaining particle is fast-forwarded
+        if (
+            isinstance(self.termination_condition, TimeElapsedTerminationCondition)
+            and np.any(self._coasting)
+            and self.time < self.termination_condition.termination_time
+        ):
+            self.time = self.termination_condition.termination_time
+
+        self._advance_coasting_particles()
+
+        self._coasting = None
+        self._coast_time = None
+        self._invalidate_particle_state()
+
+    def _per_particle_attributes(self) -> list[str]:
+        """
+        The names of the attributes holding arrays with one entry per
+        particle, which are reordered when the particle arrays are compacted
+        and split when the particles are sharded across processes.
+        """
+        attributes = []
+        for name in (
+            "x",
+            "v",
+            "q",
+            "m",
+            "_species_index",
+            "entered_grid",
+            "time",
+            "_fixed_dt",
+            "_coasting",
+            "_coast_time",
+        ):
+            value = getattr(self, name, None)
+            if isinstance(value, np.ndarray) and value.ndim > 0:
+                attributes.append(name)
+        return attributes
+
+    def _compact_particles(self) -> None:
+        """
+        Move the tracked particles to the start of the particle arrays, if
+        enough of the particles in the active part of the arrays are no
+        longer tracked.
+
+        Only the active part of the arrays (the rows that may hold tracked
+        particles) is reordered, so the cost scales with the number of
+        particles that were tracked at the last compaction.
+        """
+        n_active = self.nparticles if self._n_active is None else self._n_active
+        active_mask = self._tracked_particle_mask[:n_active]
+        tracked = np.flatnonzero(active_mask)
+
+        if n_active - tracked.size < self._compaction_min_inactive_fraction * n_active:
+            return
+
+        order = np.concatenate([tracked, np.flatnonzero(~active_mask)])
+        for name in self._per_particle_attributes():
+            values = getattr(self, name)
+            values[:n_active] = values[order]
+
+        if self._particle_order is None:
+            self._particle_order = np.arange(self.nparticles)
+        self._particle_order[:n_active] = self._particle_order[order]
+
+        self._n_active = tracked.size
+        self._invalidate_particle_state()
+
+    def _restore_particle_order(self) -> None:
+        """Return the particle arrays to the order the particles were loaded in."""
+        if self._particle_order is not None:
+            for name in self._per_particle_attributes():
+                values = getattr(self, name)
+                restored = np.empty_like(values)
+                restored[self._particle_order] = values
+                setattr(self, name, restored)
+
+        self._particle_order = None
+        self._n_active = None
+        self._invalidate_particle_state()
+
+    def _in_original_order(self, values):
+        """
+        Return a copy of ``values`` with any per-particle array put in the
+        order the particles were loaded in.
+        """
+        values = np.copy(values)
+        if (
+            self._particle_order is None
+            or values.ndim == 0
+            or values.shape[0] != self.nparticles
+        ):
+            return values
+
+        restored = np.empty_like(values)
+        restored[self._particle_order] = values
+        return restored
+
+    def _cached_state(self, key: str, compute: Callable[[], typing.Any]):
+        """
+        Return the state stored under ``key`` in the state cache, calling
+        ``compute`` to calculate it if it has not been cached.
+
+        The cache is only used while the push loop is running, so that any
+        changes made to the particle arrays outside the loop are always
+        reflected. Cached arrays are made read only, since they may be
+        shared by several callers.
+        """
+        if self._state_cache is None:
+            return compute()
+
+        value = self._state_cache.get(key)
+        if value is None:
+            value = compute()
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            self._state_cache[key] = value
+        return value
+
+    def _invalidate_particle_state(self) -> None:
+        """
+        Clear the state cache after particles have been loaded, stopped or
+        removed.
+        """
+        if self._state_cache is not None:
+            self._state_cache.clear()
+
+    def _invalidate_motion_state(self) -> None:
+        """
+        Clear the cached state that depends on the positions and velocities
+        of the tracked particles after they have been pushed.
+        """
+        if self._state_cache is not None:
+            for key in ("particles_on_grid", "on_any_grid", "vmax"):
+                self._state_cache.pop(key, None)
 
     # *************************************************************************
     # Run/push loop methods
@@ -753,32 +1623,42 @@ def _adaptive_dt(self, Ex, Ey, Ez, Bx, By, Bz) -> NDArray[np.float64] | float:
         Calculate the appropriate dt for each grid based on a number of
         considerations including the local grid resolution (ds) and the
         gyroperiod of the particles in the current fields.
+
+        If the time step is not synchronized, one time step is returned
+        for each tracked particle.
         """
+        tracked = self._tracked_particle_index
+        particles_on_grid = self.particles_on_grid[tracked]
+        pos_tracked = self.x[tracked]
+        speeds = np.linalg.norm(self.v[tracked], axis=-1)
 
         # candidate time steps includes one per grid (based on the grid resolution)
         # plus additional candidates based on the field at each particle
-        candidates = np.ones([self.nparticles, self.num_grids + 1]) * np.inf
-
-        # Compute the time step indicated by the grid resolution
-        ds = np.array([grid.grid_resolution.to(u.m).value for grid in self.grids])
-        gridstep = self._Courant_parameter * (ds / self.vmax)
-
-        # Wherever a particle is on a grid, include that grid's grid step
-        # in the list of candidate time steps
-        for i, _grid in enumerate(self.grids):
-            candidates[:, i] = np.where(
-                self.particles_on_grid[:, i] > 0, gridstep[i], np.inf
-            )
+        candidates = np.ones([particles_on_grid.shape[0], self.num_grids + 1]) * np.inf
+
+        # Wherever a particle is on a grid, include the time it takes that
+        # particle to cross a fraction of the local grid cell in the list of
+        # candidate time steps. The resolution of each grid is precomputed,
+        # so this only looks up the resolution near each particle.
+        with np.errstate(divide="ignore"):
+            for i, grid in enumerate(self.grids):
+                on_grid = particles_on_grid[:, i]
+                ds = grid._local_resolution_si(pos_tracked[on_grid])  # noqa: SLF001
+                candidates[on_grid, i] = self._Courant_parameter * ds / speeds[on_grid]
 
         # If not, compute a number of possible time steps
         # Compute the cyclotron gyroperiod
-        Bmag = np.max(np.sqrt(Bx**2 + By**2 + Bz**2)).to(u.T).value
-        # Compute the gyroperiod
+        Bmag = np.max(np.sqrt(Bx**2 + By**2 + Bz**2))
+        # Compute the gyroperiod, one per particle for multi-species ensembles
+        gyroperiod: float | NDArray[np.float64]
         if Bmag == 0:
             gyroperiod = np.inf
         else:
-            gyroperiod = (
-                2 * np.pi * self.m / (np.abs(self.q) * np.max(Bmag))
+            gyroperiod = np.ravel(
+                2
+                * np.pi
+                * self._tracked_values(self.m)
+                / (np.abs(self._tracked_values(self.q)) * np.max(Bmag))
             )  # Account for negative charges!
 
         # Subdivide the gyroperiod into a provided number of steps
@@ -796,8 +1676,9 @@ def _adaptive_dt(self, Ex, Ey, Ez, Bx, By, Bz) -> NDArray[np.float64] | float:
             dt = np.min(candidates, axis=-1)
 
             # dt should never actually be infinite, so replace any infinities
-            # with the largest gridstep
-            dt[dt == np.inf] = np.max(gridstep)
+            # with the largest gridstep of the fastest particle
+            ds_max = max(grid._grid_resolution_si for grid in self.grids)  # noqa: SLF001
+            dt[dt == np.inf] = self._Courant_parameter * ds_max / self.vmax
         else:
             # a single value for dt is returned
             # this is the time step used for all particles
@@ -812,11 +1693,26 @@ def particles_on_grid(self):
         whether or not the particle is on the associated grid.
         """
 
-        all_particles = np.array([grid.on_grid(self.x * u.m) for grid in self.grids]).T
-        all_particles[~self._tracked_particle_mask] = False
+        return self._cached_state("particles_on_grid", self._particles_on_grid)
+
+    def _particles_on_grid(self) -> NDArray[np.bool_]:
+        """Calculate `particles_on_grid`."""
+        # Only the positions of tracked particles are tested
+        tracked = self._tracked_particle_index
+        all_particles = np.zeros((self.x.shape[0], self.num_grids), dtype=np.bool_)
+        all_particles[tracked] = self._grid_collection.on_grid(self.x[tracked])
 
         return all_particles
 
+    def _tracked_values(self, values):
+        """
+        Return the entries of a per-particle array for the tracked particles,
+        or ``values`` itself if it is shared by all of the particles.
+        """
+        if values is None or np.ndim(values) == 0:
+            return values
+        return values[self._tracked_particle_index]
+
     @property
     def _particle_kinetic_energy(self):
         r"""
@@ -826,55 +1722,74 @@ def _particle_kinetic_energy(self):
         # TODO: how should the relativistic case be handled?
         return 0.5 * self.m * np.square(np.linalg.norm(self.v, axis=-1, keepdims=True))
 
-    def _interpolate_grid(self):
+    def _setup_field_interpolators(self) -> None:
+        r"""
+        Create the interpolators used in the push loop for the required
+        quantities on each grid.
+
+        The interpolators return values in SI units as `~numpy.ndarray`
+        objects, so the push loop never has to construct or convert
+        `~astropy.units.Quantity` objects.
+        """
+        self._field_names = sorted(self._required_quantities)
+        self._field_interpolators = [
+            grid.make_interpolator(self._field_names, method=self.field_weighting)
+            for grid in self.grids
+        ]
+
+    def _interpolate_grid(self) -> dict[str, NDArray[np.float64]]:
+        r"""
+        Interpolate the required quantities at the positions of the tracked
+        particles, summing the contributions of every grid and field source.
+
+        Returns a dictionary mapping each quantity key to an array of its
+        values in SI units, with one entry per tracked particle.
+        """
         # Get a list of positions (input for interpolator)
-        tracked_mask = self._tracked_particle_mask
+        tracked = self._tracked_particle_index
 
         self.iteration_number += 1
 
-        pos_tracked = self.x[tracked_mask]
+        pos_tracked = self.x[tracked]
+
+        with self._profile("grid lookup"):
+            # entered_grid is zero at the end if a particle has never
+            # entered any grid
+            self.entered_grid[tracked] |= np.any(
+                self.particles_on_grid[tracked], axis=-1
+            )
 
-        # entered_grid is zero at the end if a particle has never
-        # entered any grid
-        self.entered_grid += np.sum(self.particles_on_grid, axis=-1).astype(np.bool_)
+            # Each grid only interpolates the particles that are on it
+            particles_by_grid = self._grid_collection.positions_by_grid(pos_tracked)
 
         # TODO: how should we handle unrecognized quantities?
 
-        # Construct a dictionary to store the interpolation results
-        # This is accomplished using a dictionary comprehension. Each quantity is
-        # initialized as a zeros array with its respective units
-        total_grid_values = {
-            field_name: np.zeros(self.nparticles_tracked)
-            * AbstractGrid.recognized_quantities[field_name].unit
-            for field_name in self._required_quantities
-        }
+        # Each row holds the sum over the grids of one quantity in SI units
+        total_grid_values = np.zeros((len(self._field_names), pos_tracked.shape[0]))
 
-        for grid in self.grids:
-            # TODO: maybe convert this to a ternary operator for now?
-            match self.field_weighting:
-                case "volume averaged":
-                    interpolation_method = grid.volume_averaged_interpolator
-                case "nearest neighbor":
-                    interpolation_method = grid.nearest_neighbor_interpolator
-
-            # Use the keys of `total_grid_values` as input quantity strings to the interpolator
-            grid_values = interpolation_method(
-                pos_tracked * u.m, *total_grid_values.keys(), persistent=True
-            )
+        for i, (interpolator, particles) in enumerate(
+            zip(self._field_interpolators, particles_by_grid, strict=True)
+        ):
+            if particles.size == 0:
+                continue
 
-            # Iterate through the interpolated fields and add them to the running sum
-            # NaN values are zeroed
-            for grid_value, grid_name in zip(
-                grid_values,
-                total_grid_values.keys(),
-                strict=True,
-            ):
-                total_grid_values[grid_name] += np.nan_to_num(
-                    grid_value,
-                    0.0 * AbstractGrid.recognized_quantities[grid_name].unit,
+            with self._profile(f"interpolation (grid {i})"):
+                grid_values = interpolator(pos_tracked[particles])
+
+                # NaN values are zeroed before adding to the running sum
+                total_grid_values[:, particles] += np.nan_to_num(
+                    grid_values, copy=False
                 )
 
-        return total_grid_values
+        # Field sources are evaluated at the positions of all tracked particles
+        for i, source in enumerate(self.field_sources):
+            with self._profile(f"field source {i}"):
+                source_values = source.evaluate(pos_tracked)
+                for j, key in enumerate(self._field_names):
+                    if key in source_values:
+                        total_grid_values[j] += source_values[key]
+
+        return dict(zip(self._field_names, total_grid_values, strict=True))
 
     def _update_time(self, summed_field_values):
         r"""
@@ -884,7 +1799,9 @@ def _update_time(self, summed_field_values):
         # Calculate the adaptive time step from the fields currently experienced
         # by the particles
         # If user sets dt explicitly, that's handled in _adaptive_dt
+        tracked = self._tracked_particle_index
         if self._is_adaptive_time_step:
+            # Per-particle time steps are only calculated for tracked particles
             dt = self._adaptive_dt(
                 summed_field_values["E_x"],
                 summed_field_values["E_y"],
@@ -894,14 +1811,16 @@ def _update_time(self, summed_field_values):
                 summed_field_values["B_z"],
             )
         else:
-            dt = self.dt
+            dt = self._fixed_dt
+            if isinstance(dt, np.ndarray) and dt.ndim > 0:
+                dt = dt[tracked]
 
         # Make sure the time step can be multiplied by a [nparticles, 3] shape field array
-        if isinstance(dt, np.ndarray) and dt.size > 1:
-            dt = dt[self._tracked_particle_mask, np.newaxis]
+        if isinstance(dt, np.ndarray) and dt.ndim > 0:
+            dt = dt[:, np.newaxis]
 
             # Increment the tracked particles' time by dt
-            self.time[self._tracked_particle_mask] += dt
+            self.time[tracked] += dt
         else:
             self.time += dt
 
@@ -913,34 +1832,47 @@ def _update_position(self, summed_field_values) -> None:
         integrator provided at instantiation.
         """
 
-        # Create arrays of E and B as required by push algorithm
-        E = np.array(
-            [
-                summed_field_values["E_x"].to(u.V / u.m).value,
-                summed_field_values["E_y"].to(u.V / u.m).value,
-                summed_field_values["E_z"].to(u.V / u.m).value,
-            ]
-        )
-        E = np.moveaxis(E, 0, -1)
-        B = np.array(
-            [
-                summed_field_values["B_x"].to(u.T).value,
-                summed_field_values["B_y"].to(u.T).value,
-                summed_field_values["B_z"].to(u.T).value,
-            ]
-        )
-        B = np.moveaxis(B, 0, -1)
-
-        pos_tracked = self.x[self._tracked_particle_mask]
-        vel_tracked = self.v[self._tracked_particle_mask]
-        x_results, v_results = self._integrator.push(
-            pos_tracked, vel_tracked, B, E, self.q, self.m, self.dt
-        )
+        workspace = self._workspace
+        n = self.nparticles_tracked
+
+        # Fill arrays of E and B as required by push algorithm
+        # The interpolated values are already in SI units
+        E = workspace.array("E", (n, 3))
+        B = workspace.array("B", (n, 3))
+        for i, axis in enumerate("xyz"):
+            E[:, i] = summed_field_values[f"E_{axis}"]
+            B[:, i] = summed_field_values[f"B_{axis}"]
+
+        tracked = self._tracked_particle_index
+        if isinstance(tracked, slice):
+            # The tracked particles are views of the particle arrays, which
+            # are pushed in place
+            self._integrator.push_inplace(
+                self.x[tracked],
+                self.v[tracked],
+                B,
+                E,
+                self._tracked_values(self.q),
+                self._tracked_values(self.m),
+                self.dt,
+                workspace,
+            )
+        else:
+            x = np.take(self.x, tracked, axis=0, out=workspace.array("x", (n, 3)))
+            v = np.take(self.v, tracked, axis=0, out=workspace.array("v", (n, 3)))
+            self._integrator.push_inplace(
+                x,
+                v,
+                B,
+                E,
+                self._tracked_values(self.q),
+                self._tracked_values(self.m),
+                self.dt,
+                workspace,
+            )
+            self.x[tracked], self.v[tracked] = x, v
 
-        self.x[self._tracked_particle_mask], self.v[self._tracked_particle_mask] = (
-            x_results,
-            v_results,
-        )
+        self._invalidate_motion_state()
 
     def _update_velocity_stopping(self, summed_field_values) -> None:
         r"""
@@ -950,42 +1882,49 @@ def _update_velocity_stopping(self, summed_field_values) -> None:
         velocity to match these energies.
         """
 
-        current_speeds = np.linalg.norm(
-            self.v[self._tracked_particle_mask], axis=-1, keepdims=True
-        )
-        velocity_unit_vectors = np.multiply(
-            1 / current_speeds, self.v[self._tracked_particle_mask]
-        )
+        tracked = self._tracked_particle_index
+        vel_tracked = self.v[tracked]
+
+        current_speeds = np.linalg.norm(vel_tracked, axis=-1, keepdims=True)
+        velocity_unit_vectors = np.multiply(1 / current_speeds, vel_tracked)
         dx = np.multiply(current_speeds, self.dt)
 
-        stopping_power = np.zeros((self.nparticles_tracked, 1))
-        relevant_kinetic_energy = (
-            self._particle_kinetic_energy[self._tracked_particle_mask] * u.J
-        )
+        stopping_power = np.empty((self.nparticles_tracked, 1))
+        # The non-relativistic kinetic energy of the tracked particles
+        mass = self._tracked_values(self.m)
+        kinetic_energy = 0.5 * mass * np.square(current_speeds)
 
         # TODO: how can we reorganize this if we decide to add more stopping
         #  routines in the future?
         match self._stopping_method:
             case "NIST":
-                for cs in self._stopping_power_interpolators:
-                    interpolation_result = cs(relevant_kinetic_energy).si.value
-
-                    stopping_power += interpolation_result
+                # The stopping powers are tabulated for each species
+                species_index = self._tracked_values(self._species_index)
+                for species, table in enumerate(self._stopping_power_tables):
+                    of_species = (
+                        slice(None)
+                        if species_index is None
+                        else species_index == species
+                    )
+                    stopping_power[of_species] = table(kinetic_energy[of_species])
 
                 energy_loss_per_length = np.multiply(
                     stopping_power,
-                    summed_field_values["rho"].si.value[:, np.newaxis],
+                    summed_field_values["rho"][:, np.newaxis],
                 )
             case "Bethe":
-                for cs in self._stopping_power_interpolators:
-                    interpolation_result = cs(
-                        current_speeds,
-                        summed_field_values["n_e"].si.value[:, np.newaxis],
-                    )
-
-                    stopping_power += interpolation_result
-
-                energy_loss_per_length = stopping_power
+                # The table is indexed by the proper speed γv, for a unit
+                # electron density and charge number
+                beta_squared = np.square(current_speeds / _c.si.value)
+                np.minimum(beta_squared, _MAX_BETA_SQUARED, out=beta_squared)
+                proper_speeds = current_speeds / np.sqrt(1 - beta_squared)
+
+                charge_number = self._tracked_values(self.q) / _e
+                energy_loss_per_length = (
+                    self._stopping_power_tables[0](proper_speeds)
+                    * summed_field_values["n_e"][:, np.newaxis]
+                    * np.square(charge_number)
+                )
 
                 if (
                     not self._raised_energy_warning
@@ -1003,25 +1942,20 @@ def _update_velocity_stopping(self, summed_field_values) -> None:
 
         # Update the velocities of the particles using the new energy values
         # TODO: again, figure out how to differentiate relativistic and classical cases
-        E = self._particle_kinetic_energy[self._tracked_particle_mask] + dE
+        E = kinetic_energy + dE
 
-        particles_to_be_stopped_mask = np.full(
-            shape=self._tracked_particle_mask.shape, fill_value=False
-        )
+        particles_to_be_stopped_mask = np.full(shape=self.x.shape[0], fill_value=False)
         tracked_particles_to_be_stopped_mask = (
             E < 0
         ).flatten()  # A subset of the tracked particles!
         # Of the tracked particles, stop the ones indicated by the subset mask
-        particles_to_be_stopped_mask[self._tracked_particle_mask] = (
-            tracked_particles_to_be_stopped_mask
-        )
+        particles_to_be_stopped_mask[tracked] = tracked_particles_to_be_stopped_mask
 
         # Eliminate negative energies before calculating new speeds
         E = np.where(E < 0, 0, E)
-        new_speeds = np.sqrt(2 * E / self.m)
-        self.v[self._tracked_particle_mask] = np.multiply(
-            new_speeds, velocity_unit_vectors
-        )
+        new_speeds = np.sqrt(2 * E / mass)
+        self.v[tracked] = np.multiply(new_speeds, velocity_unit_vectors)
+        self._invalidate_motion_state()
 
         self._stop_particles(particles_to_be_stopped_mask)
 
@@ -1035,11 +1969,13 @@ def _push(self) -> None:
         total_grid_values = self._interpolate_grid()
 
         # Calculate an appropriate timestep (uniform, synchronized)
-        self.dt = self._update_time(total_grid_values)
+        with self._profile("time step"):
+            self.dt = self._update_time(total_grid_values)
 
         # Update the position and velocities of the particles using timestep
         # calculations as well as the magnitude of E and B fields
-        self._update_position(total_grid_values)
+        with self._profile("integrator"):
+            self._update_position(total_grid_values)
 
         if not self._integrator.is_relativistic and not self._raised_relativity_warning:
             beta_max = self.vmax / const.c.si.value
@@ -1054,7 +1990,8 @@ def _push(self) -> None:
 
         # Update velocities to reflect stopping
         if self._do_stopping:
-            self._update_velocity_stopping(total_grid_values)
+            with self._profile("stopping"):
+                self._update_velocity_stopping(total_grid_values)
 
     @property
     def on_any_grid(self) -> NDArray[np.bool_]:
@@ -1062,7 +1999,9 @@ def on_any_grid(self) -> NDArray[np.bool_]:
         Binary array for each particle indicating whether it is currently
         on ANY grid.
         """
-        return np.sum(self.particles_on_grid, axis=-1) > 0
+        return self._cached_state(
+            "on_any_grid", lambda: np.sum(self.particles_on_grid, axis=-1) > 0
+        )
 
     @property
     def vmax(self) -> float:
@@ -1070,9 +2009,12 @@ def vmax(self) -> float:
 
         This quantity is used for determining the grid crossing maximum time step.
         """
-        tracked_mask = self._tracked_particle_mask
-
-        return float(np.max(np.linalg.norm(self.v[tracked_mask], axis=-1)))
+        return self._cached_state(
+            "vmax",
+            lambda: float(
+                np.max(np.linalg.norm(self.v[self._tracked_particle_index], axis=-1))
+            ),
+        )
 
     @property
     def _tracked_particle_mask(self) -> NDArray[np.bool_]:
@@ -1080,14 +2022,58 @@ def _tracked_particle_mask(self) -> NDArray[np.bool_]:
         Calculates a boolean mask corresponding to particles that have not been stopped or removed.
         """
         # See Class docstring for definition of `stopped` and `removed`
-        return ~np.logical_or(np.isnan(self.x[:, 0]), np.isnan(self.v[:, 0]))
+        return self._cached_state("tracked_mask", self._compute_tracked_particle_mask)
+
+    def _compute_tracked_particle_mask(self) -> NDArray[np.bool_]:
+        """Calculate `_tracked_particle_mask`."""
+        # Particles after the active part of compacted arrays are never tracked
+        n_active = self.x.shape[0] if self._n_active is None else self._n_active
+
+        mask = np.zeros(self.x.shape[0], dtype=np.bool_)
+        mask[:n_active] = ~np.logical_or(
+            np.isnan(self.x[:n_active, 0]), np.isnan(self.v[:n_active, 0])
+        )
+
+        # Fast-forwarded particles have left the push loop
+        if self._coasting is not None:
+            mask[:n_active] &= ~self._coasting[:n_active]
+
+        return mask
+
+    @property
+    def _tracked_particle_index(self) -> slice | NDArray[np.intp]:
+        """
+        An index selecting the tracked particles from the particle arrays.
+
+        This is a slice if the tracked particles are the leading rows of
+        the arrays, as is the case after they have been compacted, so that
+        indexing the particle arrays returns views rather than copies.
+        """
+        return self._cached_state("tracked_index", self._compute_tracked_index)
+
+    def _compute_tracked_index(self) -> slice | NDArray[np.intp]:
+        """Calculate `_tracked_particle_index`."""
+        n_active = self.x.shape[0] if self._n_active is None else self._n_active
+        active_mask = self._tracked_particle_mask[:n_active]
+
+        if active_mask.all():
+            return slice(0, n_active)
+        return np.flatnonzero(active_mask)
 
     @property
     def nparticles_tracked(self) -> int:
         """Return the number of particles currently being tracked.
-        That is, they do not have NaN position or velocity.
+        That is, they do not have NaN position or velocity, and are not
+        being fast-forwarded.
         """
-        return int(self._tracked_particle_mask.sum())
+        return self._cached_state("nparticles_tracked", self._count_tracked_particles)
+
+    def _count_tracked_particles(self) -> int:
+        """Calculate `nparticles_tracked`."""
+        tracked = self._tracked_particle_index
+        if isinstance(tracked, slice):
+            return tracked.stop - tracked.start
+        return int(tracked.size)
 
     @property
     def _stopped_particle_mask(self) -> NDArray[np.bool_]:
@@ -1153,3 +2139,251 @@ def _enforce_order(self) -> None:
                 "simulation is not supported. Create a new `Tracker` "
                 "object for a new simulation."
             )
+
+
+# The largest value of (v / c)^2 used to look up Bethe stopping powers,
+# which keeps the proper speed finite for particles moving at c
+_MAX_BETA_SQUARED = 1 - 1e-12
+
+
+class _LogUniformTable:
+    """
+    Values of a function tabulated at log-uniformly spaced arguments, which
+    are interpolated linearly in the logarithm of the argument. Arguments
+    outside of the table are clamped to its ends.
+
+    The table only holds arrays, so unlike interpolators wrapping a
+    function it can always be pickled.
+    """
+
+    def __init__(
+        self,
+        function: Callable[[NDArray[np.floating]], ArrayLike],
+        lower: float,
+        upper: float,
+        points_per_decade: int = 200,
+    ) -> None:
+        n = int(np.ceil(points_per_decade * np.log10(upper / lower))) + 1
+        self._values = np.asarray(
+            function(np.geomspace(lower, upper, n)), dtype=np.float64
+        )
+        self._log_lower = np.log(lower)
+        self._inverse_step = (n - 1) / np.log(upper / lower)
+        self._last_index = n - 1
+
+    def __call__(self, arguments: NDArray[np.float64]) -> NDArray[np.float64]:
+        # The position of each argument in units of the table spacing
+        with np.errstate(divide="ignore"):
+            position = np.log(arguments)
+        position -= self._log_lower
+        position *= self._inverse_step
+        np.clip(position, 0, self._last_index, out=position)
+
+        # NaN arguments are given NaN values
+        index = np.nan_to_num(position, nan=0).astype(np.intp)
+        np.minimum(index, self._last_index - 1, out=index)
+        position -= index
+
+        lower_values = self._values[index]
+        return lower_values + position * (self._values[index + 1] - lower_values)
+
+
+def _NIST_stopping_power_table(particle, materials) -> _LogUniformTable:
+    """
+    Tabulate the summed NIST stopping powers of ``materials`` for
+    ``particle``, in SI units, against the kinetic energy in joules.
+    """
+    interpolators = [
+        stopping_power(particle, material, return_interpolator=True)
+        for material in materials
+    ]
+
+    # The stopping powers of all materials are tabulated at the same energies
+    energies, _ = stopping_power(particle, materials[0])
+    energies = energies.to_value(u.J)
+
+    def summed_stopping_power(energy):
+        return sum(
+            interpolator(energy * u.J).si.value for interpolator in interpolators
+        )
+
+    return _LogUniformTable(summed_stopping_power, np.min(energies), np.max(energies))
+
+
+def _Bethe_stopping_power_table(I) -> _LogUniformTable:  # noqa: E741
+    """
+    Tabulate the summed Bethe stopping powers of grids with the mean
+    excitation energies ``I``, for a unit electron density and charge
+    number, against the proper speed in meters per second.
+    """
+    c = _c.si.value
+    I = u.Quantity(I).to_value(u.J)  # noqa: E741
+
+    def summed_stopping_power(proper_speed):
+        speed = proper_speed / np.sqrt(1 + np.square(proper_speed / c))
+        unit_density = np.ones_like(speed)
+
+        summed = np.zeros_like(speed)
+        for I_grid in I:
+            summed += Bethe_stopping_lite(np.asarray(I_grid), unit_density, speed, 1)
+        return summed
+
+    return _LogUniformTable(summed_stopping_power, 1e-4 * c, 1e3 * c)
+
+
+_NOT_PROFILED = contextlib.nullcontext()
+
+
+class _PhaseProfiler:
+    """
+    Accumulates the wall time (and optionally the peak memory allocation)
+    of the phases of the push loop of a |ParticleTracker|.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[int, dict[str, float]], None] | None,
+        track_memory: bool,
+    ) -> None:
+        self.callback = callback
+        self.track_memory = track_memory
+
+        self.calls: dict[str, int] = collections.defaultdict(int)
+        self.times: dict[str, float] = collections.defaultdict(float)
+        self.peak_memory: dict[str, int] = collections.defaultdict(int)
+        self._step_times: dict[str, float] = collections.defaultdict(float)
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Prepare to profile a run of the push loop."""
+        if self.track_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Finish profiling a run of the push loop."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """Record the time spent in the body of the context as ``name``."""
+        if self.track_memory:
+            memory_at_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+
+            self.calls[name] += 1
+            self.times[name] += elapsed
+            self._step_times[name] += elapsed
+
+            if self.track_memory:
+                peak = tracemalloc.get_traced_memory()[1] - memory_at_start
+                self.peak_memory[name] = max(self.peak_memory[name], peak)
+
+    def end_step(self, iteration_number: int) -> None:
+        """Pass the times of the phases of the latest step to the callback."""
+        if self.callback is not None:
+            self.callback(iteration_number, dict(self._step_times))
+        self._step_times.clear()
+
+    def report(self) -> dict[str, dict[str, typing.Any]]:
+        """Summarize the profiled phases, as described in `ParticleTracker.profiling_report`."""
+        total_time = sum(self.times.values())
+
+        report = {}
+        for name, calls in self.calls.items():
+            report[name] = {
+                "calls": calls,
+                "time": self.times[name] * u.s,
+                "mean_time": self.times[name] / calls * u.s,
+                "fraction": self.times[name] / total_time if total_time > 0 else 0.0,
+            }
+            if self.track_memory:
+                report[name]["peak_memory"] = self.peak_memory[name] * u.byte
+
+        return report
+
+
+class _CheckpointPickler(pickle.Pickler):
+    """
+    Pickle the state of a tracker, storing references to the tracker itself
+    (such as those of its termination condition and save routine) by name.
+    """
+
+    def __init__(self, file, tracker: ParticleTracker) -> None:
+        super().__init__(file)
+        self._tracker = tracker
+
+    def persistent_id(self, obj):
+        return "tracker" if obj is self._tracker else None
+
+
+class _CheckpointUnpickler(pickle.Unpickler):
+    """Load a checkpoint, resolving references to the tracker to ``tracker``."""
+
+    def __init__(self, file, tracker: ParticleTracker) -> None:
+        super().__init__(file)
+        self._tracker = tracker
+
+    def persistent_load(self, pid):
+        if pid == "tracker":
+            return self._tracker
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid!r}.")
+
+
+def _merge_shard_entries(
+    key: str, entries: tuple[typing.Any, ...], shard_states: list[dict[str, typing.Any]]
+) -> typing.Any:
+    """
+    Merge the entries of quantity ``key`` saved at the same save by each
+    shard of a parallel run.
+    """
+    if all(
+        np.ndim(entry) > 0 and len(entry) == state["nparticles"]
+        for entry, state in zip(entries, shard_states, strict=True)
+    ):
+        return np.concatenate(entries)
+
+    if not all(np.array_equal(entry, entries[0]) for entry in entries[1:]):
+        raise RuntimeError(
+            f"The shards of the simulation saved different values of {key} at "
+            "the same save, so their results cannot be merged. Use a save "
+            "routine that only saves on completion, or a fixed time step and "
+            "a termination condition that ends every shard at the same time."
+        )
+
+    return entries[0]
+
+
+def _run_shard(shard: ParticleTracker) -> dict[str, typing.Any]:
+    """
+    Push the particles of one shard of a parallel run in a worker process,
+    returning its final state.
+    """
+    shard._run_push_loop()  # noqa: SLF001
+
+    return {
+        "nparticles": shard.nparticles,
+        "x": shard.x,
+        "v": shard.v,
+        "entered_grid": shard.entered_grid,
+        "time": shard.time,
+        "iteration_number": shard.iteration_number,
+        "results": (
+            shard.save_routine._results  # noqa: SLF001
+            if shard.save_routine is not None
+            else None
+        ),
+        "save_iterations": (
+            shard.save_routine._save_iterations  # noqa: SLF001
+            if shard.save_routine is not None
+            else None
+        ),
+    }
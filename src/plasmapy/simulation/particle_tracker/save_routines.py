@@ -7,14 +7,67 @@
     "DoNotSaveSaveRoutine",
     "SaveOnceOnCompletion",
     "IntervalSaveRoutine",
+    "HDF5StreamingSaveRoutine",
 ]
 
+import copy
+import functools
+import queue
+import threading
+import typing
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
 
 import astropy.units as u
 import h5py
 import numpy as np
+from numpy.typing import DTypeLike, NDArray
+
+
+class _BackgroundWriter:
+    """
+    A thread which performs the writes submitted to it in order.
+
+    At most ``max_pending`` writes wait in the queue, in addition to the
+    write being performed, so that submitting a write blocks if the writes
+    fall behind.
+    """
+
+    def __init__(self, max_pending: int) -> None:
+        self._queue: queue.Queue[Callable[[], None] | None] = queue.Queue(
+            maxsize=max_pending
+        )
+        self._error: Exception | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while (write := self._queue.get()) is not None:
+            # Writes after a failed write are skipped, since they would
+            # leave the output incomplete anyway
+            if self._error is None:
+                try:
+                    write()
+                except Exception as error:  # noqa: BLE001
+                    self._error = error
+
+    def submit(self, write: Callable[[], None]) -> None:
+        """Queue ``write`` to be performed, waiting if the queue is full."""
+        self._raise_error()
+        self._queue.put(write)
+
+    def close(self) -> None:
+        """Wait for the queued writes to finish and stop the thread."""
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("Writing the output of the simulation failed.") from (
+                self._error
+            )
 
 
 class AbstractSaveRoutine(ABC):
@@ -30,6 +83,16 @@ class AbstractSaveRoutine(ABC):
         Output for objects that are saved to disk. If a directory is not specified
         then a memory save routine is used.
 
+    asynchronous : `bool`, optional
+        If `True`, saves are written to disk by a background thread, so
+        that the simulation continues while the output is written. The
+        default is `False`.
+
+    max_pending_writes : `int`, optional
+        The number of saves which may wait to be written by the background
+        thread. Once this many saves are waiting, the simulation waits for
+        the oldest one to be written. The default is two, which allows the
+        next save to be prepared while the previous one is being written.
 
     Notes
     -----
@@ -38,10 +101,29 @@ class AbstractSaveRoutine(ABC):
     Then, the hook calls `save_now` to determine whether or not the simulation state should be saved.
     """
 
-    def __init__(self, output_directory: Path | None = None) -> None:
+    def __init__(
+        self,
+        output_directory: Path | None = None,
+        asynchronous: bool = False,
+        max_pending_writes: int = 2,
+    ) -> None:
+        if max_pending_writes < 1:
+            raise ValueError(
+                "The number of pending writes must be at least one, "
+                f"got {max_pending_writes}."
+            )
+
         self.output_directory = output_directory
+        self.asynchronous = asynchronous
+        self.max_pending_writes = max_pending_writes
+
+        # The background writer is started by the first asynchronous write
+        self._writer: _BackgroundWriter | None = None
 
         self._results = {}
+        # The iteration number of each save, which names the files saved
+        # for the shards of a parallel run once their results are merged
+        self._save_iterations: list[int] = []
         self._quantities = {
             "time": (u.s, "dataset"),
             "x": (u.m, "dataset"),
@@ -90,18 +172,61 @@ def save(self) -> None:
         if self.output_directory is not None:
             self._save_to_disk()
 
+    def flush(self) -> None:
+        """Wait until all saves have been written.
+
+        This is called when the simulation finishes running.
+        """
+        if self._writer is not None:
+            writer, self._writer = self._writer, None
+            writer.close()
+
+    def _write(self, write: Callable[[], None]) -> None:
+        """
+        Perform ``write`` now, or in the background if the save routine is
+        asynchronous. ``write`` must not depend on state that changes while
+        the simulation is running.
+        """
+        if not self.asynchronous:
+            write()
+            return
+
+        if self._writer is None:
+            self._writer = _BackgroundWriter(self.max_pending_writes)
+        self._writer.submit(write)
+
+    def __getstate__(self) -> dict[str, typing.Any]:
+        state = self.__dict__.copy()
+        state["_writer"] = None
+        return state
+
     def _save_to_disk(self) -> None:
         """Save a hdf5 file containing simulation positions and velocities."""
+        self._write_results_file(self.tracker.iteration_number, self._results)
 
-        path = self.output_directory / f"{self.tracker.iteration_number}.hdf5"
+    def _write_results_file(self, iteration_number: int, results) -> None:
+        """
+        Write the histories in ``results`` to the hdf5 file of the save at
+        iteration ``iteration_number``.
+        """
+        path = self.output_directory / f"{iteration_number}.hdf5"
 
+        # The saved arrays are copies, but the lists of them keep growing
+        results = {key: list(results[key]) for key in self._quantities}
+        self._write(
+            functools.partial(self._write_hdf5_file, path, self._quantities, results)
+        )
+
+    @staticmethod
+    def _write_hdf5_file(path, quantities, results) -> None:
+        """Write the ``results`` to a new hdf5 file."""
         with h5py.File(path, "w") as output_file:
-            for key, (_units, data_type) in self._quantities.items():
+            for key, (_units, data_type) in quantities.items():
                 match data_type:
                     case "attribute":
-                        output_file.attrs.create(key, self._results[key])
+                        output_file.attrs.create(key, results[key])
                     case "dataset":
-                        output_file.create_dataset(key, data=self._results[key])
+                        output_file.create_dataset(key, data=results[key])
 
     # TODO: Find a better name for this method
     def _save_to_memory(self) -> None:
@@ -109,11 +234,17 @@ def _save_to_memory(self) -> None:
 
         for quantity in self._quantities:
             quantity_history = self._results.get(quantity, [])
-            current_quantity = np.copy(getattr(self._particle_tracker, quantity, 0))
+            # The particle arrays of the tracker may be reordered while it is
+            # running, so per-particle quantities are put in their original order
+            current_quantity = self.tracker._in_original_order(  # noqa: SLF001
+                getattr(self.tracker, quantity, 0)
+            )
 
             quantity_history.append(current_quantity)
             self._results[quantity] = quantity_history
 
+        self._save_iterations.append(self.tracker.iteration_number)
+
     def _apply_units_to_results(self):
         """Apply units to the results dictionary.
 
@@ -129,6 +260,40 @@ def _apply_units_to_results(self):
 
         return results_copy
 
+    def _shard_copy(self, tracker) -> "AbstractSaveRoutine":
+        """
+        Return a copy of the save routine for ``tracker``, a shard of a
+        parallel run, which saves to memory so that the results of the
+        shards can be merged.
+        """
+        save_routine = copy.copy(self)
+        save_routine.tracker = tracker
+        save_routine.output_directory = None
+        save_routine._results = {}  # noqa: SLF001
+        save_routine._save_iterations = []  # noqa: SLF001
+        save_routine._writer = None  # noqa: SLF001
+        return save_routine
+
+    def _merge_shard_results(self, results, save_iterations: list[int]) -> None:
+        """
+        Store the merged results of the shards of a parallel run, whose
+        saves were made at iterations ``save_iterations``.
+
+        If an output directory is specified, the file of each save is
+        written as it would have been by a run in a single process.
+        """
+        self._results = results
+        self._save_iterations = list(save_iterations)
+
+        if self.output_directory is None:
+            return
+
+        for n_saves, iteration_number in enumerate(save_iterations, start=1):
+            self._write_results_file(
+                iteration_number,
+                {key: history[:n_saves] for key, history in results.items()},
+            )
+
     def post_push_hook(self) -> None:
         """Function called after a push step.
 
@@ -171,8 +336,8 @@ class SaveOnceOnCompletion(AbstractSaveRoutine):
     bypassing the ``save_now()`` criteria.
     """
 
-    def __init__(self, output_directory: Path | None = None) -> None:
-        super().__init__(output_directory)
+    def __init__(self, output_directory: Path | None = None, **kwargs) -> None:
+        super().__init__(output_directory, **kwargs)
 
     @property
     def save_now(self) -> bool:
@@ -218,3 +383,164 @@ def save(self) -> None:
         super().save()
 
         self.time_of_last_save = self.tracker.time
+
+
+class HDF5StreamingSaveRoutine(IntervalSaveRoutine):
+    """Save every given interval by appending to the datasets of one HDF5 file.
+
+    Each saved quantity is stored in a single chunked dataset which grows
+    along its first axis with every save, so the memory used by the save
+    routine does not depend on the length of the simulation.
+
+    Parameters
+    ----------
+    path : `~pathlib.Path`
+        The HDF5 file to save to. An existing file is overwritten at the
+        first save.
+
+    interval : `~astropy.units.Quantity`
+        The simulation time between saves.
+
+    particles : `slice` or array_like of `int`, optional
+        The indices of the particles to save, such as ``slice(None, None, 10)``
+        to save every tenth particle. By default, all particles are saved.
+
+    dtype : data-type, optional
+        The floating point type the positions and velocities are stored as.
+        Storing them as ``numpy.float32`` halves the size of the file. The
+        time is always stored in double precision. The default is
+        ``numpy.float64``.
+
+    compression : `str`, optional
+        The compression filter applied to the datasets, such as ``"gzip"``
+        or ``"lzf"``. By default, the datasets are not compressed.
+
+    compression_opts : optional
+        Options for the compression filter, such as the ``"gzip"`` level.
+
+    **kwargs
+        Other keyword arguments of `AbstractSaveRoutine`, such as
+        ``asynchronous`` to write the saves in a background thread.
+
+    Notes
+    -----
+    The datasets have the names of the saved quantities, an extra leading
+    dimension indexing the saves, and a ``unit`` attribute. The `results`
+    are read back from the file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        interval: u.Quantity,
+        particles: slice | NDArray[np.intp] | None = None,
+        dtype: DTypeLike = np.float64,
+        compression: str | None = None,
+        compression_opts=None,
+        **kwargs,
+    ) -> None:
+        super().__init__(interval, **kwargs)
+
+        self.path: Path | None = Path(path)
+        self.particles = (
+            slice(None)
+            if particles is None
+            else particles
+            if isinstance(particles, slice)
+            else np.asarray(particles, dtype=np.intp)
+        )
+        self.dtype = np.dtype(dtype)
+        self.compression = compression
+        self.compression_opts = compression_opts
+
+        self._n_saves = 0
+
+    @property
+    def results(self) -> dict[str, u.Quantity]:
+        """Return the results of the simulation read from the HDF5 file."""
+        self.flush()
+
+        if self._n_saves == 0:
+            return {}
+
+        with h5py.File(self.path, "r") as output_file:
+            return {
+                quantity: output_file[quantity][...] * u.Unit(units)
+                if units is not None
+                else output_file[quantity][...]
+                for quantity, (units, _data_type) in self._quantities.items()
+            }
+
+    def save(self) -> None:
+        """Append the current state of the simulation to the HDF5 file."""
+        if self.path is None:
+            # This is a shard of a parallel run, whose saves are merged and
+            # written by the save routine of the full simulation
+            self._save_to_memory()
+        else:
+            self._append(
+                {
+                    # The particle arrays of the tracker may be reordered
+                    # while it is running
+                    quantity: self.tracker._in_original_order(  # noqa: SLF001
+                        getattr(self.tracker, quantity, 0)
+                    )
+                    for quantity in self._quantities
+                }
+            )
+
+        self.time_of_last_save = self.tracker.time
+
+    def _shard_copy(self, tracker) -> "HDF5StreamingSaveRoutine":
+        save_routine = typing.cast(
+            "HDF5StreamingSaveRoutine", super()._shard_copy(tracker)
+        )
+        save_routine.path = None
+        return save_routine
+
+    def _merge_shard_results(
+        self,
+        results,
+        save_iterations: list[int],  # noqa: ARG002
+    ) -> None:
+        # The saves are appended to the one file, so are not named after
+        # their iterations
+        for entries in zip(
+            *(results[quantity] for quantity in self._quantities), strict=True
+        ):
+            self._append(dict(zip(self._quantities, entries, strict=True)))
+
+    def _append(self, state) -> None:
+        """
+        Append one save of each quantity in ``state``, which must not be
+        modified afterwards, to its dataset.
+        """
+        self._write(functools.partial(self._write_save, self._n_saves, state))
+        self._n_saves += 1
+
+    def _write_save(self, index: int, state) -> None:
+        """Write the save of the quantities in ``state`` with index ``index``."""
+        mode = "a" if index > 0 else "w"
+        with h5py.File(self.path, mode) as output_file:
+            for quantity, saved_value in state.items():
+                value = np.asarray(saved_value)
+                if value.ndim > 0:
+                    # Per-particle quantities are subsampled and converted
+                    value = value[self.particles].astype(self.dtype, copy=False)
+
+                if quantity not in output_file:
+                    units = self._quantities[quantity][0]
+                    dataset = output_file.create_dataset(
+                        quantity,
+                        shape=(0, *value.shape),
+                        maxshape=(None, *value.shape),
+                        dtype=value.dtype,
+                        chunks=True,
+                        compression=self.compression,
+                        compression_opts=self.compression_opts,
+                    )
+                    dataset.attrs["unit"] = "" if units is None else units.to_string()
+
+                dataset = output_file[quantity]
+                dataset.resize(index + 1, axis=0)
+                dataset[index] = value
@@ -10,6 +10,7 @@
     GeneralWire,
     InfiniteStraightWire,
     MagneticDipole,
+    MagnetoStatics,
 )
 
 mu0_4pi = const.mu0 / 4 / np.pi
@@ -183,3 +184,26 @@ def test_repr(self) -> None:
             repr(cw)
             == r"CircularWire(normal=[0. 0. 1.], center=[0. 0. 0.]m, radius=1.0m, current=1.0A)"
         )
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        MagneticDipole(np.array([0, 1, 1]) * u.A * u.m**2, np.array([0, 0, 0.1]) * u.m),
+        GeneralWire(lambda t: np.array([0, np.cos(t), np.sin(t)]), 0, np.pi, 1 * u.A),
+        FiniteStraightWire(
+            np.array([0, 0, -1]) * u.m, np.array([0, 0.5, 1]) * u.m, 1 * u.A
+        ),
+        InfiniteStraightWire(np.array([1, 1, 0]), np.array([0, 0, 0]) * u.m, 1 * u.A),
+        CircularWire(np.array([0, 1, 1]), np.array([0, 0, 0]) * u.m, 1 * u.m, 1 * u.A),
+    ],
+)
+def test_magnetic_field_vectorized(source: MagnetoStatics) -> None:
+    """Test that the fields at several positions match those at each position."""
+    positions = np.random.default_rng(seed=1).uniform(2, 3, size=(5, 3))
+
+    B = source.magnetic_field(positions)
+
+    assert B.shape == (5, 3)
+    for p, B_p in zip(positions, B, strict=True):
+        assert u.allclose(source.magnetic_field(p), B_p)
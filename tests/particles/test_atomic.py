@@ -1,3 +1,5 @@
+import pickle
+
 import astropy.constants as const
 import astropy.units as u
 import numpy as np
@@ -706,3 +708,13 @@ def test_stopping_power_no_interpolation() -> None:
     result = stopping_power(Particle("H+"), "COPPER")
 
     assert type(result) is tuple
+
+
+def test_stopping_power_interpolator_pickle() -> None:
+    """Test that the interpolator can be sent to other processes."""
+    interpolator = stopping_power(Particle("p+"), "ALUMINUM", return_interpolator=True)
+    energies = [1, 10] * u.MeV
+
+    unpickled_interpolator = pickle.loads(pickle.dumps(interpolator))  # noqa: S301
+
+    assert u.allclose(unpickled_interpolator(energies), interpolator(energies))
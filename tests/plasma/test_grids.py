@@ -2,6 +2,9 @@
 Tests for grids.py
 """
 
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 import astropy.units as u
 import numpy as np
 import pytest
@@ -361,6 +364,245 @@ def test_AbstractGrid_add_quantities(
         assert abstract_grid_uniform[key].shape == abstract_grid_uniform.shape
 
 
+def test_AbstractGrid_quantity_storage() -> None:
+    """
+    Tests that quantities are stored in a single contiguous array that
+    backs the DataArrays of the dataset.
+    """
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5)
+    grid.add_quantities(B_x=np.ones(grid.shape) * u.T, B_y=np.zeros(grid.shape) * u.T)
+    grid.add_quantities(rho=np.full(grid.shape, 2) * u.kg / u.m**3)
+
+    buffer = grid._quantity_buffer
+    assert buffer.flags["C_CONTIGUOUS"]
+    assert buffer.shape == (3, *grid.shape)
+    for key in ("B_x", "B_y", "rho"):
+        assert np.shares_memory(grid.ds[key].data, buffer)
+    assert np.all(grid["rho"] == 2 * u.kg / u.m**3)
+
+    # Replacing an existing quantity is done in place
+    grid.add_quantities(B_y=np.full(grid.shape, 3) * u.mT)
+    assert grid._quantity_buffer is buffer
+    assert np.all(grid["B_y"] == 3 * u.mT)
+
+    # Interpolating different subsets of the quantities does not
+    # repack the stored values
+    pos = np.array([[0.1, 0.2, 0.3]]) * u.cm
+    grid.volume_averaged_interpolator(pos, "B_x", "rho", persistent=True)
+    grid.volume_averaged_interpolator(pos, "B_y", persistent=True)
+    assert grid._quantity_buffer is buffer
+
+
+@pytest.mark.parametrize("storage_dtype", [np.float32, np.float64])
+def test_AbstractGrid_storage_dtype(storage_dtype) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5, storage_dtype=storage_dtype)
+    grid.add_quantities(B_x=grid.grids[0].value * u.T)
+
+    assert grid.storage_dtype == storage_dtype
+    assert grid["B_x"].dtype == storage_dtype
+
+    # Interpolated values are returned in double precision
+    pos = np.array([[0.13, 0.2, 0.3]]) * u.cm
+    B_x = grid.volume_averaged_interpolator(pos, "B_x")
+    assert B_x.dtype == np.float64
+    assert np.isclose(B_x.to(u.T).value, 0.13, rtol=1e-6)
+
+
+def test_AbstractGrid_storage_dtype_error() -> None:
+    with pytest.raises(ValueError, match="storage_dtype"):
+        grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5, storage_dtype=np.int32)
+
+
+def test_AbstractGrid_lazy_quantities_hdf5(tmp_path) -> None:
+    h5py = pytest.importorskip("h5py")
+
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=24)
+    lazy_grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=24)
+    B_x = rs.random_sample(grid.shape) * u.T
+    n_e = rs.random_sample(grid.shape) * u.cm**-3
+    grid.add_quantities(B_x=B_x, n_e=n_e)
+
+    path = tmp_path / "quantities.h5"
+    with h5py.File(path, "w") as f:
+        f.create_dataset("B_x", data=B_x.value, chunks=(8, 8, 8))
+        f.create_dataset("n_e", data=n_e.value, chunks=(8, 8, 8))
+        f["n_e"].attrs["unit"] = "cm-3"
+
+    with h5py.File(path, "r") as f:
+        lazy_grid.add_lazy_quantities(B_x=f["B_x"], n_e=f["n_e"])
+        assert set(lazy_grid.quantities) == {"B_x", "n_e"}
+        assert "on disk" in repr(lazy_grid)
+
+        pos = np.array([[0.1, -0.3, 0.2], [0.5, 0.5, -0.5]]) * u.cm
+        expected = grid.volume_averaged_interpolator(pos, "B_x", "n_e")
+        result = lazy_grid.volume_averaged_interpolator(pos, "B_x", "n_e")
+        for a, b in zip(result, expected, strict=True):
+            assert a.unit == b.unit
+            assert np.allclose(a.value, b.value)
+
+        # Only the chunks around the interpolated positions are read
+        assert 0 < len(lazy_grid._lazy_quantities["B_x"]._cache) < 27
+
+        # Trilinear interpolation also only reads the chunks it needs
+        trilinear = lazy_grid.make_interpolator(["B_x", "n_e"], method="trilinear")
+        assert np.allclose(
+            trilinear(pos), grid.make_interpolator(["B_x", "n_e"], "trilinear")(pos)
+        )
+        assert 0 < len(lazy_grid._lazy_quantities["B_x"]._cache) < 27
+
+        assert u.allclose(lazy_grid["n_e"], n_e)
+        assert lazy_grid._quantity_statistics("B_x") == grid._quantity_statistics("B_x")
+
+    # Replacing a lazy quantity with an in-memory one
+    lazy_grid.add_quantities(B_x=B_x)
+    assert "B_x" not in lazy_grid._lazy_quantities
+    assert u.allclose(lazy_grid["B_x"], B_x)
+
+
+def test_AbstractGrid_lazy_quantities_memmap(tmp_path) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=10)
+    E_x = rs.random_sample(grid.shape) * u.V / u.m
+    grid.add_quantities(E_x=E_x)
+
+    arr = np.memmap(tmp_path / "E_x.dat", dtype=np.float64, mode="w+", shape=grid.shape)
+    arr[...] = E_x.value
+    arr.flush()
+
+    # Replacing an in-memory quantity with a lazy one
+    mmap = np.memmap(tmp_path / "E_x.dat", dtype=np.float64, mode="r", shape=grid.shape)
+    grid.add_lazy_quantities(E_x=mmap * u.V / u.m)
+    assert "E_x" not in grid.ds.data_vars
+    assert grid.quantities == ["E_x"]
+
+    pos = np.array([0.1, -0.3, 0.2]) * u.cm
+    value = grid.nearest_neighbor_interpolator(pos, "E_x")
+    index = np.unravel_index(
+        np.argmin(np.sum((grid.grid - pos) ** 2, axis=-1)), grid.shape
+    )
+    assert value == E_x[index]
+
+    # Adding another quantity keeps the existing in-memory quantities
+    grid.add_quantities(E_y=E_x)
+    assert u.allclose(grid["E_y"], E_x)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"unknown": np.zeros((10, 10, 10))}, "could not be determined"),
+        ({"E_x": np.zeros((10, 10, 10)) * u.T}, "not compatible"),
+        ({"E_x": np.zeros((10, 10, 9)) * u.V / u.m}, "does not match"),
+    ],
+)
+def test_AbstractGrid_lazy_quantities_errors(kwargs, match) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=10)
+    with pytest.raises(ValueError, match=match):
+        grid.add_lazy_quantities(**kwargs)
+
+
+@pytest.mark.parametrize("memmap", [True, False])
+@pytest.mark.parametrize("storage_dtype", [np.float64, np.float32])
+def test_AbstractGrid_save_load(tmp_path, memmap, storage_dtype) -> None:
+    grid = grids.CartesianGrid(
+        -1 * u.cm, 1 * u.cm, num=(10, 12, 14), storage_dtype=storage_dtype
+    )
+    B_x = rs.random_sample(grid.shape) * u.T
+    rho = rs.random_sample(grid.shape) * u.kg / u.m**3
+    grid.add_quantities(B_x=B_x, rho=rho)
+
+    path = tmp_path / "grid.h5"
+    grid.save(path)
+    loaded = grids.AbstractGrid.load(path, memmap=memmap)
+
+    assert isinstance(loaded, grids.CartesianGrid)
+    assert loaded.is_uniform
+    assert loaded.shape == grid.shape
+    assert loaded.units == grid.units
+    assert u.allclose(loaded.ax1, grid.ax1)
+    assert set(loaded.quantities) == {"B_x", "rho"}
+    assert loaded["rho"].unit == rho.unit
+    assert u.allclose(loaded["B_x"], grid["B_x"])
+    assert (loaded._lazy_quantities.keys() == {"B_x", "rho"}) == memmap
+    if memmap:
+        assert loaded._lazy_quantities["B_x"].is_memory_mapped
+
+    pos = rs.uniform(-0.9, 0.9, size=(50, 3)) * u.cm
+    expected = grid.make_interpolator(["B_x", "rho"], method="trilinear")(pos)
+    result = loaded.make_interpolator(["B_x", "rho"], method="trilinear")(pos)
+    assert np.allclose(result, expected)
+
+    # A grid with memory mapped quantities can itself be saved
+    loaded.save(tmp_path / "copy.h5")
+    copy = grids.CartesianGrid.load(tmp_path / "copy.h5")
+    assert u.allclose(copy["rho"], grid["rho"])
+
+    # Overwriting the file that quantities are memory mapped from is refused
+    if memmap:
+        with pytest.raises(ValueError, match="memory mapped"):
+            loaded.save(path)
+    else:
+        loaded.save(path)
+
+
+def test_AbstractGrid_local_resolution() -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=(11, 21, 41))
+    pos = rs.uniform(-1, 1, size=(5, 3)) * u.cm
+    resolution = grid.local_resolution(pos)
+    assert resolution.shape == (5,)
+    assert u.allclose(resolution, grid.grid_resolution)
+    assert grid.local_resolution(np.zeros(3)).shape == (1,)
+
+
+def test_AbstractGrid_save_load_nonuniform(tmp_path) -> None:
+    grid = grids.NonUniformCartesianGrid(-1 * u.cm, 1 * u.cm, num=8)
+    n_e = rs.random_sample(grid.shape) * u.cm**-3
+    grid.add_quantities(n_e=n_e)
+
+    path = tmp_path / "grid.h5"
+    grid.save(path)
+    loaded = grids.NonUniformCartesianGrid.load(path)
+
+    assert isinstance(loaded, grids.NonUniformCartesianGrid)
+    assert not loaded.is_uniform
+    assert u.allclose(loaded.pts2, grid.pts2)
+    assert u.allclose(loaded["n_e"], n_e)
+
+    pos = rs.uniform(-0.9, 0.9, size=(20, 3)) * u.cm
+    assert np.allclose(
+        loaded.make_interpolator("n_e")(pos),
+        grid.make_interpolator("n_e")(pos),
+        equal_nan=True,
+    )
+
+    with pytest.raises(TypeError, match="is not a CartesianGrid"):
+        grids.CartesianGrid.load(path)
+
+
+@pytest.mark.parametrize("shared", [False, True])
+def test_AbstractGrid_pickle(shared) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=10)
+    n_e = rs.random_sample(grid.shape) * u.cm**-3
+    grid.add_quantities(n_e=n_e, B_x=np.ones(grid.shape) * u.T)
+    grid.make_interpolator("n_e")
+
+    if shared:
+        with grid._shared_quantities():
+            unpickled = pickle.loads(pickle.dumps(grid))  # noqa: S301
+            # Only the name of the shared memory block is pickled
+            assert len(pickle.dumps(grid)) < n_e.nbytes
+    else:
+        unpickled = pickle.loads(pickle.dumps(grid))  # noqa: S301
+
+    assert grid._shared_memory is None
+    assert set(unpickled.quantities) == {"n_e", "B_x"}
+    assert u.allclose(unpickled["n_e"], n_e)
+
+    pos = rs.uniform(-0.9, 0.9, size=(20, 3)) * u.cm
+    assert u.allclose(
+        unpickled.make_interpolator("n_e")(pos), grid.make_interpolator("n_e")(pos)
+    )
+
+
 req_q = [
     # Requiring an existing keyword
     (["x"], False, None, None, None),
@@ -474,6 +716,47 @@ def test_AbstractGrid_vector_intersects(
     assert grid.vector_intersects(p2, p1) == result
 
 
+@pytest.mark.parametrize("fixture", ["uniform", "nonuniform"])
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+def test_AbstractGrid_ray_intersections(
+    abstract_grid_uniform, abstract_grid_nonuniform, fixture
+) -> None:
+    grid = abstract_grid_uniform if fixture == "uniform" else abstract_grid_nonuniform
+    lower, upper = grid._bounds_si
+    center = (lower + upper) / 2
+
+    origins = np.array(
+        [
+            lower - 1,  # Diagonally through the box
+            center,  # Starting inside the box
+            center + np.array([0, 1, 0]),  # Parallel to the box, outside of it
+            [lower[0], center[1], center[2]],  # Along a face of the box
+            [np.nan, 0, 0],
+        ]
+    )
+    directions = np.array(
+        [[1, 1, 1], [0, 0, 2], [1, 0, 0], [0, 1, 0], [1, 0, 0]], dtype=float
+    )
+    t_entry, t_exit = grid.ray_intersections(origins * u.m, directions)
+
+    extent = upper - lower
+    assert np.isclose(t_entry[0], 1)
+    assert np.isclose(t_exit[0], 1 + np.min(extent))
+    assert np.isclose(t_entry[1], -extent[2] / 4)
+    assert np.isclose(t_exit[1], extent[2] / 4)
+    assert np.all(np.isnan([t_entry[2], t_exit[2], t_entry[4], t_exit[4]]))
+    assert np.isclose(t_entry[3], lower[1] - center[1])
+    assert np.isclose(t_exit[3], upper[1] - center[1])
+
+    # Entry and exit points lie on the boundary of the grid
+    hit = ~np.isnan(t_entry)
+    for t in (t_entry, t_exit):
+        points = origins[hit] + t[hit, np.newaxis] * directions[hit]
+        assert np.all((points >= lower - 1e-12) & (points <= upper + 1e-12))
+
+
 # **********************************************************************
 # Uniform Cartesian grid tests
 # **********************************************************************
@@ -609,6 +892,39 @@ def test_uniform_cartesian_NN_interp_persistence(uniform_cartesian_grid) -> None
     assert np.allclose(pout, pos[:, [0, 2]].T, atol=0.6 * uniform_cartesian_grid.dax0)
 
 
+def test_uniform_cartesian_interp_replaced_quantities() -> None:
+    """
+    Test that interpolators which are not persistent use the current
+    values of the quantities, and that persistent interpolators are
+    rebuilt when quantities are replaced.
+    """
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5)
+    grid.add_quantities(B_x=np.full(grid.shape, 5) * u.T)
+    pos = np.array([[0.1, 0.2, 0.3]]) * u.cm
+
+    assert u.allclose(grid.volume_averaged_interpolator(pos, "B_x"), 5 * u.T)
+
+    # Quantities assigned directly to the dataset
+    grid.ds["B_x"] = grid.ds["B_x"].copy(data=grid["B_x"].value * 3)
+    assert u.allclose(grid["B_x"], 15 * u.T)
+    for interpolator in (
+        grid.volume_averaged_interpolator,
+        grid.nearest_neighbor_interpolator,
+    ):
+        assert u.allclose(interpolator(pos, "B_x"), 15 * u.T)
+
+    # Persistent interpolators are cached until quantities are replaced
+    assert u.allclose(
+        grid.volume_averaged_interpolator(pos, "B_x", persistent=True), 15 * u.T
+    )
+    assert len(grid._legacy_interpolators) == 1
+    grid.add_quantities(B_x=np.full(grid.shape, 2) * u.T)
+    assert not grid._legacy_interpolators
+    assert u.allclose(
+        grid.volume_averaged_interpolator(pos, "B_x", persistent=True), 2 * u.T
+    )
+
+
 # **********************************************************************
 # Non-uniform Cartesian grid tests
 # **********************************************************************
@@ -748,6 +1064,45 @@ def test_nonuniform_cartesian_nearest_neighbor_interpolator() -> None:
     assert np.allclose(pout1, pout2)
 
 
+@pytest.mark.filterwarnings(
+    "ignore:.*MultiIndex.*:DeprecationWarning"
+)  # see issue 2319
+def test_nonuniform_cartesian_spatial_index() -> None:
+    """
+    Test that the k-d tree based geometry of a non-uniform grid matches
+    a brute force calculation.
+    """
+    grid = grids.NonUniformCartesianGrid(-1 * u.cm, 1 * u.cm, num=8)
+    points = grid.grid.to(u.cm).value
+    grid.add_quantities(x=grid.grids[0])
+
+    # Resolution is the smallest distance between two distinct points
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=-1)
+    np.fill_diagonal(distances, np.inf)
+    assert u.isclose(grid.grid_resolution, np.min(distances) * u.cm)
+
+    # Nearest neighbors of positions on the grid match a brute force search
+    pos = rs.uniform(points.min(axis=0), points.max(axis=0), size=(20, 3))
+    nearest = np.argmin(
+        np.linalg.norm(points[np.newaxis] - pos[:, np.newaxis], axis=-1), axis=-1
+    )
+    pout = grid.nearest_neighbor_interpolator(pos * u.cm, "x")
+    assert u.allclose(pout, grid["x"][nearest])
+
+    # The local resolution is the spacing of the nearest grid point
+    spacing = np.min(distances, axis=-1)
+    assert u.allclose(grid.local_resolution(pos * u.cm), spacing[nearest] * u.cm)
+    assert u.isclose(np.min(grid._resolution_map_si) * u.m, grid.grid_resolution)
+
+    # The tree is built once and reused
+    assert grid._spatial_index is grid._spatial_index
+
+    # Positions outside of the bounding box of the grid are off the grid
+    lower, upper = grid._bounds_si
+    pos = np.array([lower, upper, lower - 1e-6, (lower + upper) / 2])
+    assert np.array_equal(grid.on_grid(pos), [True, True, False, True])
+
+
 @pytest.mark.parametrize(
     ("pos", "what", "expected"),
     [
@@ -932,6 +1287,64 @@ def test_volume_averaged_interpolator_compare_NN_3D(uniform_cartesian_grid) -> N
     assert va_error < nn_error
 
 
+def test_uniform_interpolators_match_reference() -> None:
+    """
+    Compare the index arithmetic used by the uniform grid interpolators
+    against a brute force nearest vertex search and a standard trilinear
+    interpolation.
+    """
+    from scipy.interpolate import RegularGridInterpolator
+
+    grid = grids.CartesianGrid(
+        [-1 * u.cm, -2 * u.cm, 0 * u.cm], [1 * u.cm, 1 * u.cm, 3 * u.cm], num=[9, 7, 5]
+    )
+    values = rs.randn(*grid.shape) * u.T
+    grid.add_quantities(B_x=values)
+
+    pos = np.empty((500, 3))
+    pos[:, 0] = rs.uniform(-1, 1, size=500)
+    pos[:, 1] = rs.uniform(-2, 1, size=500)
+    pos[:, 2] = rs.uniform(0, 3, size=500)
+    # Include points exactly on the grid boundaries
+    pos[0] = [-1, -2, 0]
+    pos[1] = [1, 1, 3]
+    pos = pos * u.cm
+
+    axes = [ax.to(u.m).value for ax in (grid.ax0, grid.ax1, grid.ax2)]
+    pos_si = pos.to(u.m).value
+
+    # Nearest neighbor: compare against an argmin search along each axis
+    nn_expected = values.value[
+        tuple(
+            np.abs(pos_si[:, i, None] - axes[i][None, :]).argmin(axis=1)
+            for i in range(3)
+        )
+    ]
+    nn = grid.nearest_neighbor_interpolator(pos, "B_x")
+    assert np.allclose(nn.to(u.T).value, nn_expected)
+
+    # Volume averaged: equivalent to trilinear interpolation
+    va_expected = RegularGridInterpolator(axes, values.value)(pos_si)
+    va = grid.volume_averaged_interpolator(pos, "B_x")
+    assert np.allclose(va.to(u.T).value, va_expected)
+
+    # The fractional index of the upper vertex may be rounded to just above
+    # the last index, which should not place it off the grid
+    for _ in range(50):
+        start = rs.uniform(-1, 1, size=3)
+        stop = start + rs.uniform(0.1, 2, size=3)
+        grid = grids.CartesianGrid(start * u.m, stop * u.m, num=rs.randint(3, 20))
+        grid.add_quantities(B_x=rs.randn(*grid.shape) * u.T)
+        corner = stop[np.newaxis, :] * u.m
+        assert grid.on_grid(corner).all()
+        for interpolator in (
+            grid.nearest_neighbor_interpolator,
+            grid.volume_averaged_interpolator,
+        ):
+            value = interpolator(corner, "B_x")
+            assert np.allclose(value.to(u.T).value, grid["B_x"][-1, -1, -1].value)
+
+
 @pytest.mark.filterwarnings(
     "ignore:.*MultiIndex.*:DeprecationWarning"
 )  # see issue 2319
@@ -1019,23 +1432,196 @@ def debug_volume_avg_interpolator() -> None:
     plt.xlim(-11, 11)
 
 
-def test_fast_nearest_neighbor_interpolate() -> None:
-    """
-    Confirms that the fast linear interpolator function is equivalent to
-    the np.argmin(np.abs(x-y)) search method for ordered arrays
-    """
-    ax = 100 * np.linspace(0, 1, num=100)
-    # Seed random number generator for repeatability
-    pos = rs.random([300])
-    # Make sure values outside the axis on either end are included
-    pos[0] = -2
-    pos[1] = 102
-    # Make sure at least one value is closer to the top of an interval than
-    # the bottom
-    pos[2] = 3.9
+@pytest.mark.parametrize("method", ["nearest neighbor", "volume averaged"])
+def test_make_interpolator_uniform(method) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=15)
+    grid.add_quantities(
+        B_x=rs.random_sample(grid.shape) * u.mT,
+        n_e=rs.random_sample(grid.shape) * u.cm**-3,
+    )
+    pos = rs.uniform(-1.2, 1.2, size=(100, 3)) * u.cm
+
+    interpolator = grid.make_interpolator(["B_x", "n_e"], method=method)
+    legacy = {
+        "nearest neighbor": grid.nearest_neighbor_interpolator,
+        "volume averaged": grid.volume_averaged_interpolator,
+    }[method]
+    expected = legacy(pos, "B_x", "n_e")
+
+    # Results are plain arrays in SI units
+    out = np.empty((2, 100))
+    result = interpolator(pos.to(u.m).value, out=out)
+    assert result is out
+    for value, quantity, unit in zip(result, expected, interpolator.units, strict=True):
+        assert unit.is_equivalent(quantity.unit)
+        assert np.allclose(value, quantity.si.value, equal_nan=True)
+
+    # Steady-state interpolation into the same output does not allocate
+    # arrays that scale with the number of positions
+    tracemalloc = pytest.importorskip("tracemalloc")
+    many_pos = rs.uniform(-0.012, 0.012, size=(50000, 3))
+    many_out = np.empty((2, 50000))
+    interpolator(many_pos, out=many_out)
+    tracemalloc.start()
+    interpolator(many_pos, out=many_out)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert peak < many_out.nbytes / 2
+
+    pos_si = pos.to(u.m).value
+
+    # Replacing a quantity on the grid is picked up by the interpolator
+    grid.add_quantities(B_x=np.ones(grid.shape) * u.T)
+    result = interpolator(pos_si)
+    on_grid = grid.on_grid(pos_si)
+    assert np.allclose(result[0][on_grid], 1)
+    assert np.all(np.isnan(result[0][~on_grid]))
+
+
+@pytest.mark.parametrize("storage_dtype", [np.float32, np.float64])
+def test_polynomial_interpolators(storage_dtype) -> None:
+    def smooth(x, y, z):
+        return np.sin(300 * x) * np.cos(200 * y) + 50 * z
+
+    def linear(x, y, z):
+        return 2 * x + 3 * y - z + 1
+
+    def make_grid(num):
+        grid = grids.CartesianGrid(
+            -1 * u.cm, 1 * u.cm, num=num, storage_dtype=storage_dtype
+        )
+        pts = [pts.to(u.m).value for pts in grid.grids]
+        grid.add_quantities(B_x=smooth(*pts) * u.T, n_e=linear(*pts) * u.m**-3)
+        return grid
+
+    grid = make_grid(11)
+    pos = rs.uniform(-0.0099, 0.0099, size=(1000, 3))
+    rtol = 1e-5 if storage_dtype == np.float32 else 1e-10
+
+    # Trilinear interpolation is the same as volume averaged interpolation
+    trilinear = grid.make_interpolator(["B_x", "n_e"], method="trilinear")
+    volume_averaged = grid.make_interpolator(["B_x", "n_e"], method="volume averaged")
+    assert np.allclose(trilinear(pos), volume_averaged(pos), rtol=rtol, atol=rtol)
+
+    # Tricubic interpolation reproduces linear fields, and is more accurate
+    # for smooth fields than volume averaged interpolation on a grid with
+    # eight times as many cells
+    tricubic = grid.make_interpolator(["B_x", "n_e"], method="tricubic")
+    B_x, n_e = tricubic(pos)
+    assert np.allclose(n_e, linear(*pos.T), rtol=rtol)
+
+    fine_grid = make_grid(21)
+    fine = fine_grid.make_interpolator("B_x", method="volume averaged")(pos)[0]
+    exact = smooth(*pos.T)
+    assert np.max(np.abs(B_x - exact)) < np.max(np.abs(fine - exact))
+
+    # Off-grid positions are assigned NaN
+    result = tricubic(np.array([[0.02, 0, 0], [np.nan, 0, 0], [0, 0, 0]]))
+    assert np.array_equal(np.isnan(result[0]), [True, True, False])
+
+    # Derivatives are cached on the grid until the quantity is replaced,
+    # with 8 values per vertex
+    table = grid._vertex_derivatives("B_x")
+    assert table.shape == (grid["B_x"].size, 8)
+    assert table.dtype == storage_dtype
+    assert grid._vertex_derivatives("B_x") is table
+    grid.add_quantities(B_x=np.ones(grid.shape) * u.T)
+    assert grid._vertex_derivatives("B_x") is not table
+    assert np.allclose(tricubic(pos)[0], 1, rtol=rtol)
+
+
+@pytest.mark.parametrize("method", ["nearest neighbor", "volume averaged", "tricubic"])
+def test_make_interpolator_chunks_and_threads(method) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=12)
+    grid.add_quantities(
+        B_x=rs.random_sample(grid.shape) * u.T,
+        B_y=rs.random_sample(grid.shape) * u.T,
+    )
+    pos = rs.uniform(-0.011, 0.011, size=(1001, 3))
+
+    expected = grid.make_interpolator(["B_x", "B_y"], method, chunk_size=None)(pos)
+
+    interpolator = grid.make_interpolator(
+        ["B_x", "B_y"], method, chunk_size=64, n_threads=4
+    )
+    assert np.array_equal(interpolator(pos), expected, equal_nan=True)
+
+    # Each chunk in flight uses its own work arrays, which are sized for
+    # at most a single chunk (the last chunk is shorter)
+    assert 1 <= len(interpolator._free_workspaces) <= interpolator.n_threads
+    assert all(1 <= capacity <= 64 for capacity, _ in interpolator._free_workspaces)
+
+    # The same interpolator can be called from several threads at once
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(interpolator, [pos] * 8))
+    for result in results:
+        assert np.array_equal(result, expected, equal_nan=True)
+
 
-    expected = np.abs(pos[:, None] - ax).argmin(axis=1)
+@pytest.mark.parametrize(("chunk_size", "n_threads"), [(0, 1), (10, 0)])
+def test_make_interpolator_chunk_errors(chunk_size, n_threads) -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5)
+    grid.add_quantities(B_x=np.ones(grid.shape) * u.T)
+    with pytest.raises(ValueError, match="must be positive"):
+        grid.make_interpolator("B_x", chunk_size=chunk_size, n_threads=n_threads)
 
-    result = grids._fast_nearest_neighbor_interpolate(pos, ax)
 
-    assert np.allclose(expected, result)
+def test_make_interpolator_nonuniform() -> None:
+    grid = grids.NonUniformCartesianGrid(-1 * u.cm, 1 * u.cm, num=8)
+    grid.add_quantities(x=grid.grids[0])
+    pos = rs.uniform(-0.5, 0.5, size=(10, 3)) * u.cm
+
+    interpolator = grid.make_interpolator("x")
+    expected = grid.nearest_neighbor_interpolator(pos, "x")
+    assert np.allclose(interpolator(pos)[0], expected.si.value, equal_nan=True)
+
+    with pytest.raises(ValueError, match="not supported"):
+        grid.make_interpolator("x", method="volume averaged")
+
+
+def test_make_interpolator_errors() -> None:
+    grid = grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=5)
+    grid.add_quantities(B_x=np.ones(grid.shape) * u.T)
+
+    with pytest.raises(KeyError):
+        grid.make_interpolator(["B_x", "B_y"])
+    with pytest.raises(ValueError, match="not supported"):
+        grid.make_interpolator("B_x", method="quintic")
+
+    interpolator = grid.make_interpolator("B_x")
+    with pytest.raises(ValueError, match="out array"):
+        interpolator(np.zeros((4, 3)), out=np.empty((1, 3)))
+
+
+@pytest.mark.parametrize("bins_per_axis", [None, 1, 7])
+def test_GridCollection(bins_per_axis) -> None:
+    # Nested, adjacent, and overlapping grids
+    grid_list = [
+        grids.CartesianGrid(-3 * u.cm, 3 * u.cm, num=4),
+        grids.CartesianGrid(-1 * u.cm, 1 * u.cm, num=4),
+        grids.CartesianGrid(1 * u.cm, 2 * u.cm, num=4),
+        grids.CartesianGrid([2, -1, -1] * u.cm, [4, 0, 0] * u.cm, num=4),
+        grids.CartesianGrid([-2, 0.5, 0.5] * u.cm, [-1, 2.5, 0.7] * u.cm, num=4),
+    ]
+    collection = grids.GridCollection(grid_list, bins_per_axis=bins_per_axis)
+    assert len(collection) == 5
+    assert list(collection) == grid_list
+    assert collection[1] is grid_list[1]
+
+    pos = rs.uniform(-0.05, 0.05, size=(2000, 3))
+    pos[:4] = np.array([[0.01, 0.01, 0.01], [0.02, 0, 0], [np.nan, 0, 0], [1, 1, 1]])
+
+    expected = np.array([grid.on_grid(pos) for grid in grid_list]).T
+    assert np.array_equal(collection.on_grid(pos * u.m), expected)
+
+    by_grid = collection.positions_by_grid(pos)
+    assert len(by_grid) == 5
+    for i, indices in enumerate(by_grid):
+        assert np.array_equal(indices, np.flatnonzero(expected[:, i]))
+
+
+def test_GridCollection_empty() -> None:
+    collection = grids.GridCollection([])
+    pos = np.zeros((3, 3))
+    assert collection.on_grid(pos).shape == (3, 0)
+    assert collection.positions_by_grid(pos) == []
@@ -0,0 +1,77 @@
+"""
+Tests for field_sources.py
+"""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+from plasmapy.formulary.magnetostatics import CircularWire, MagneticDipole
+from plasmapy.plasma.cylindrical_equilibria import ForceFreeFluxRope
+from plasmapy.simulation.particle_tracker.field_sources import (
+    ForceFreeFluxRopeFieldSource,
+    MagnetostaticFieldSource,
+)
+
+rng = np.random.default_rng()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_magnetostatic_field_source(chunk_size: int) -> None:
+    coil = CircularWire(
+        np.array([0, 0, 1]), np.array([0, 0, 0]) * u.cm, 20 * u.cm, 1 * u.kA
+    )
+    dipole = MagneticDipole(
+        np.array([1, 0, 0]) * u.A * u.m**2, np.array([0, 0, 1]) * u.m
+    )
+    source = MagnetostaticFieldSource(coil, dipole, chunk_size=chunk_size)
+
+    pos = rng.uniform(-0.5, 0.5, size=(20, 3))
+    B = source.evaluate(pos)
+
+    expected_B = coil.magnetic_field(pos) + dipole.magnetic_field(pos)
+    assert source.quantities == ("B_x", "B_y", "B_z")
+    for i, key in enumerate(source.quantities):
+        assert np.allclose(B[key], expected_B[:, i].to_value(u.T))
+
+
+def test_magnetostatic_field_source_errors() -> None:
+    with pytest.raises(ValueError, match="At least one"):
+        MagnetostaticFieldSource()
+
+    with pytest.raises(TypeError, match="magnetostatic"):
+        MagnetostaticFieldSource(ForceFreeFluxRope(1 * u.T, 1 / u.m))  # type: ignore[arg-type]
+
+    dipole = MagneticDipole(np.array([0, 0, 1]) * u.A * u.m**2, np.zeros(3) * u.m)
+    with pytest.raises(ValueError, match="chunk size"):
+        MagnetostaticFieldSource(dipole, chunk_size=0)
+
+
+def test_force_free_flux_rope_field_source() -> None:
+    flux_rope = ForceFreeFluxRope(1 * u.T, 2 / u.m)
+    center = np.array([1, 0, 0]) * u.m
+    source = ForceFreeFluxRopeFieldSource(flux_rope, center, axis=[0, 2, 0])
+
+    # Positions on a circle of radius r around the axis, which points
+    # in the y direction
+    r, angles = 0.4, np.linspace(0, 2 * np.pi, 10)
+    pos = np.stack(
+        [1 + r * np.cos(angles), rng.uniform(-1, 1, 10), r * np.sin(angles)], axis=-1
+    )
+    B = source.evaluate(pos)
+
+    # The azimuthal direction is y × r, which is (sin, 0, -cos)
+    B_theta = flux_rope.B_theta(r * u.m).to_value(u.T)  # type: ignore[no-untyped-call]
+    B_z = flux_rope.B_z(r * u.m).to_value(u.T)  # type: ignore[no-untyped-call]
+    assert np.allclose(B["B_x"], B_theta * np.sin(angles))
+    assert np.allclose(B["B_y"], B_z)
+    assert np.allclose(B["B_z"], -B_theta * np.cos(angles))
+
+    # On the axis, the field is purely axial
+    B = source.evaluate(np.array([[1, 3, 0]]))
+    assert np.allclose([B["B_x"], B["B_y"], B["B_z"]], [[0], [1], [0]])
+
+
+def test_force_free_flux_rope_field_source_axis_error() -> None:
+    with pytest.raises(ValueError, match="non-zero vector"):
+        ForceFreeFluxRopeFieldSource(ForceFreeFluxRope(1 * u.T, 1 / u.m), axis=[0, 0])
@@ -0,0 +1,220 @@
+"""
+Tests for particle_integrators.py
+"""
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+from numpy.typing import NDArray
+
+from plasmapy.simulation import particle_integrators
+from plasmapy.simulation.particle_integrators import (
+    AbstractIntegrator,
+    BorisIntegrator,
+    HigueraCaryIntegrator,
+    IntegratorWorkspace,
+    RelativisticBorisIntegrator,
+    VayIntegrator,
+)
+
+rng = np.random.default_rng()
+
+c = particle_integrators._c.si.value
+
+Array = NDArray[np.float64]
+
+
+def reference_boris_push(
+    x: Array,
+    v: Array,
+    B: Array,
+    E: Array,
+    q: Array | float,
+    m: Array | float,
+    dt: Array | float,
+) -> tuple[Array, Array]:
+    hqmdt = 0.5 * dt * q / m
+    vminus = v + hqmdt * E
+    t = B * hqmdt
+    s = 2 * t / (1 + (t * t).sum(axis=1, keepdims=True))
+    vprime = vminus + np.cross(vminus, t)
+    v = vminus + np.cross(vprime, s) + hqmdt * E
+    return x + v * dt, v
+
+
+def reference_relativistic_boris_push(
+    x: Array,
+    v: Array,
+    B: Array,
+    E: Array,
+    q: Array | float,
+    m: Array | float,
+    dt: Array | float,
+) -> tuple[Array, Array]:
+    γ = 1 / np.sqrt(1 - (np.linalg.norm(v, axis=1, keepdims=True) / c) ** 2)
+    uvel_minus = v * γ + q * E * dt / (2 * m)
+    γ1 = np.sqrt(1 + (np.linalg.norm(uvel_minus, axis=1, keepdims=True) / c) ** 2)
+    t = q * B * dt / (2 * γ1 * m)
+    s = 2 * t / (1 + (t * t).sum(axis=1, keepdims=True))
+    uvel_prime = uvel_minus + np.cross(uvel_minus, t)
+    uvel_new = uvel_minus + np.cross(uvel_prime, s) + q * E * dt / (2 * m)
+    γ2 = np.sqrt(1 + (np.linalg.norm(uvel_new, axis=1, keepdims=True) / c) ** 2)
+    v = uvel_new / γ2
+    return x + v * dt, v
+
+
+def random_ensemble(n: int = 50) -> tuple[Array, Array, Array, Array]:
+    x = rng.uniform(-1, 1, size=(n, 3))
+    v = rng.uniform(-1e7, 1e7, size=(n, 3))
+    B = rng.uniform(-5, 5, size=(n, 3))
+    E = rng.uniform(-1e6, 1e6, size=(n, 3))
+    return x, v, B, E
+
+
+integrator_cases = [
+    (BorisIntegrator, reference_boris_push, particle_integrators._boris_loop, ()),
+    (
+        RelativisticBorisIntegrator,
+        reference_relativistic_boris_push,
+        particle_integrators._relativistic_boris_loop,
+        (c,),
+    ),
+]
+
+# Whether push_inplace uses the numba kernels, if numba is installed, or
+# the NumPy implementation
+kernel_cases = [
+    pytest.param(
+        True,
+        marks=pytest.mark.skipif(
+            particle_integrators._boris_kernel is None,
+            reason="numba is not installed",
+        ),
+        id="numba",
+    ),
+    pytest.param(False, id="numpy"),
+]
+
+
+def random_species(n: int = 50) -> tuple[Array, Array]:
+    """Random charges and masses of protons, deuterons and alpha particles."""
+    q, m = np.array([[1.6e-19, 1.67e-27], [1.6e-19, 3.34e-27], [3.2e-19, 6.64e-27]]).T
+    species = rng.integers(0, 3, size=(n, 1))
+    return q[species], m[species]
+
+
+@pytest.mark.parametrize("use_numba", kernel_cases)
+@pytest.mark.parametrize("per_particle_species", [False, True])
+@pytest.mark.parametrize("per_particle_dt", [False, True])
+@pytest.mark.parametrize(
+    ("integrator", "reference", "loop", "loop_args"), integrator_cases
+)
+def test_push_inplace(
+    monkeypatch: pytest.MonkeyPatch,
+    integrator: type[AbstractIntegrator],
+    reference: Callable[..., tuple[Array, Array]],
+    loop: Callable[..., None],
+    loop_args: tuple[float, ...],
+    per_particle_dt: bool,
+    per_particle_species: bool,
+    use_numba: bool,
+) -> None:
+    if not use_numba:
+        monkeypatch.setattr(particle_integrators, "_boris_kernel", None)
+        monkeypatch.setattr(particle_integrators, "_relativistic_boris_kernel", None)
+
+    x, v, B, E = random_ensemble()
+    q, m = random_species() if per_particle_species else (1.6e-19, 1.67e-27)
+    dt = rng.uniform(1e-12, 1e-11, size=(x.shape[0], 1)) if per_particle_dt else 1e-11
+
+    expected_x, expected_v = reference(x, v, B, E, q, m, dt)
+
+    pushed_x, pushed_v = integrator.push(x, v, B, E, q, m, dt)
+    assert np.allclose(pushed_x, expected_x)
+    assert np.allclose(pushed_v, expected_v)
+
+    workspace = IntegratorWorkspace()
+    for _ in range(2):
+        inplace_x, inplace_v = x.copy(), v.copy()
+        integrator.push_inplace(inplace_x, inplace_v, B, E, q, m, dt, workspace)
+        assert np.allclose(inplace_x, expected_x)
+        assert np.allclose(inplace_v, expected_v)
+
+    # The fused kernel used when numba is installed
+    loop_x, loop_v = x.copy(), v.copy()
+    loop(
+        loop_x,
+        loop_v,
+        B,
+        E,
+        particle_integrators._per_particle(q, x.shape[0]),
+        particle_integrators._per_particle(m, x.shape[0]),
+        particle_integrators._per_particle(dt, x.shape[0]),
+        *loop_args,
+    )
+    assert np.allclose(loop_x, expected_x)
+    assert np.allclose(loop_v, expected_v)
+
+
+@pytest.mark.parametrize("integrator", [VayIntegrator, HigueraCaryIntegrator])
+@pytest.mark.parametrize("per_particle_species", [False, True])
+@pytest.mark.parametrize("per_particle_dt", [False, True])
+def test_implicit_rotation_pushers(
+    integrator: type[AbstractIntegrator],
+    per_particle_dt: bool,
+    per_particle_species: bool,
+) -> None:
+    x, v, B, E = random_ensemble()
+    q, m = random_species() if per_particle_species else (1.6e-19, 1.67e-27)
+
+    # The pushers agree with the Boris pusher for small time steps
+    dt = np.full((x.shape[0], 1), 1e-13) if per_particle_dt else 1e-13
+    expected_x, expected_v = reference_relativistic_boris_push(x, v, B, E, q, m, dt)
+    pushed_x, pushed_v = integrator.push(x, v, B, E, q, m, dt)
+    assert np.allclose(pushed_x, expected_x, rtol=1e-6)
+    assert np.allclose(pushed_v, expected_v, rtol=1e-6)
+
+    # A pure magnetic field does not change the speed
+    E = np.zeros_like(E)
+    _, pushed_v = integrator.push(x, v, B, E, q, m, 1e-8)
+    assert np.allclose(np.linalg.norm(pushed_v, axis=1), np.linalg.norm(v, axis=1))
+
+
+@pytest.mark.parametrize(
+    ("integrator", "preserves_drift"),
+    [
+        (RelativisticBorisIntegrator, False),
+        (VayIntegrator, True),
+        (HigueraCaryIntegrator, True),
+    ],
+)
+def test_relativistic_drift(
+    integrator: type[AbstractIntegrator], preserves_drift: bool
+) -> None:
+    """
+    A particle moving at the E × B drift velocity feels no force, which
+    should be preserved for any time step.
+    """
+    B = np.array([[0.0, 0.0, 1.0]])
+    E = np.array([[0.0, 0.99 * c, 0.0]])
+    x = np.zeros((1, 3))
+    v = np.array([[0.99 * c, 0.0, 0.0]])
+
+    for _ in range(10):
+        x, v = integrator.push(x, v, B, E, q=1.0, m=1.0, dt=1.0)
+
+    assert np.allclose(v / c, [[0.99, 0, 0]]) == preserves_drift
+
+
+def test_integrator_workspace() -> None:
+    workspace = IntegratorWorkspace()
+    buffer = workspace.array("a", (10, 3))
+
+    # Smaller requests reuse the existing buffer
+    assert np.shares_memory(workspace.array("a", (4, 3)), buffer)
+    assert workspace.array("a", (4, 3)).shape == (4, 3)
+
+    # Larger requests or different trailing shapes reallocate
+    assert not np.shares_memory(workspace.array("a", (20, 3)), buffer)
+    assert workspace.array("a", (5,)).shape == (5,)
@@ -2,22 +2,38 @@
 Tests for particle_tracker.py
 """
 
+import pickle
 import re
+import warnings
 
 import astropy.constants as const
 import astropy.units as u
+import h5py
 import numpy as np
 import pytest
 from hypothesis import given, settings
 from hypothesis import strategies as st
 from scipy.optimize import fsolve
 
+from plasmapy.formulary.collisions.misc import Bethe_stopping_lite
 from plasmapy.formulary.frequencies import gyrofrequency
 from plasmapy.formulary.lengths import gyroradius
 from plasmapy.particles.particle_class import CustomParticle, Particle
+from plasmapy.particles.particle_collections import ParticleList
 from plasmapy.plasma import Plasma
+from plasmapy.plasma.cylindrical_equilibria import ForceFreeFluxRope
 from plasmapy.plasma.grids import CartesianGrid
-from plasmapy.simulation.particle_integrators import BorisIntegrator
+from plasmapy.simulation.particle_integrators import (
+    BorisIntegrator,
+    HigueraCaryIntegrator,
+    RelativisticBorisIntegrator,
+    VayIntegrator,
+)
+from plasmapy.simulation.particle_tracker import particle_tracker
+from plasmapy.simulation.particle_tracker.field_sources import (
+    AbstractFieldSource,
+    ForceFreeFluxRopeFieldSource,
+)
 from plasmapy.simulation.particle_tracker.particle_tracker import ParticleTracker
 from plasmapy.simulation.particle_tracker.save_routines import IntervalSaveRoutine
 from plasmapy.simulation.particle_tracker.termination_conditions import (
@@ -75,6 +91,16 @@ def grid_with_inf_entry():
         ),
         # Unrecognized grid type
         (42, "time_elapsed_termination_condition_instantiated", None, {}, TypeError),
+        # No grids or field sources
+        ([], "time_elapsed_termination_condition_instantiated", None, {}, ValueError),
+        # Adaptive time step without grids
+        (
+            ForceFreeFluxRopeFieldSource(ForceFreeFluxRope(1 * u.T, 1 / u.m)),
+            "time_elapsed_termination_condition_instantiated",
+            None,
+            {},
+            ValueError,
+        ),
         # Unrecognized termination condition
         (CartesianGrid(-1 * u.m, 1 * u.m), ("lorem ipsum",), None, {}, TypeError),
         (
@@ -167,6 +193,50 @@ def test_particle_tracker_load_particles_shape_error(
             [[0, 0, 0]] * u.m, [[0, 0, 0], [0, 0, 0]] * u.m / u.s, Particle("p+")
         )
 
+    # The number of species does not match the number of particles
+    with pytest.raises(ValueError, match="number of particle species"):
+        simulation.load_particles(
+            [[0, 0, 0]] * u.m, [[0, 0, 0]] * u.m / u.s, ["p+", "alpha"]
+        )
+
+
+@pytest.mark.parametrize("stopping", [False, True])
+def test_particle_tracker_multiple_species(stopping) -> None:
+    """
+    Test that each species in a multi-species ensemble follows the same
+    trajectories as in a simulation of that species alone.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 1e4) * u.V / u.m,
+        B_z=np.full(grid.shape, 0.1) * u.T,
+        n_e=np.full(grid.shape, 1e26) * u.m**-3,
+    )
+
+    species = ParticleList(["p+", "alpha", "D+", "p+", "alpha", "D+"])
+    x = rng.uniform(-0.1, 0.1, size=(len(species), 3)) * u.m
+    v = rng.uniform(1e6, 1e7, size=(len(species), 3)) * u.m / u.s
+
+    def run(particles, particle):
+        simulation = ParticleTracker(
+            grid, TimeElapsedTerminationCondition(1 * u.ns), dt=1e-11 * u.s
+        )
+        simulation.load_particles(x[particles], v[particles], particle)
+        if stopping:
+            simulation.add_stopping(method="Bethe", I=[166] * u.eV)
+        simulation.run()
+        return simulation
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=PhysicsWarning)
+        ensemble = run(slice(None), species)
+        for particle in ("p+", "alpha", "D+"):
+            particles = np.array(species.symbols) == Particle(particle).symbol
+            single_species = run(particles, particle)
+
+            assert np.allclose(ensemble.x[particles], single_species.x)
+            assert np.allclose(ensemble.v[particles], single_species.v)
+
 
 class TestParticleTrackerGyroradius:
     v_x = rng.integers(1, 10, size=100) * u.m / u.s
@@ -221,6 +291,45 @@ def test_kinetic_energy(self) -> None:
         assert np.isclose(initial_kinetic_energies, simulation_kinetic_energies).all()
 
 
+@pytest.mark.parametrize(
+    ("integrator", "preserves_drift"),
+    [
+        (RelativisticBorisIntegrator, False),
+        (VayIntegrator, True),
+        (HigueraCaryIntegrator, True),
+    ],
+)
+def test_particle_tracker_relativistic_drift(integrator, preserves_drift) -> None:
+    """
+    Particles moving at a relativistic E × B drift velocity should keep
+    drifting even if the time step is much longer than the gyroperiod.
+    """
+    grid = CartesianGrid(-1 * u.km, 1 * u.km, num=2)
+    drift_speed = 0.99 * const.c
+    grid.add_quantities(
+        E_y=np.full(grid.shape, drift_speed.si.value) * u.V / u.m,
+        B_z=np.ones(grid.shape) * u.T,
+    )
+
+    termination_time = 1 * u.us
+    simulation = ParticleTracker(
+        grid,
+        TimeElapsedTerminationCondition(termination_time),
+        dt=0.1 * u.us,
+        particle_integrator=integrator,
+    )
+    simulation.load_particles(
+        np.zeros((1, 3)) * u.m,
+        [[drift_speed.si.value, 0, 0]] * u.m / u.s,
+        # The time step is several gyroperiods
+        CustomParticle(1e-7 * u.kg, 1 * u.C),
+    )
+    simulation.run()
+
+    expected_x = drift_speed.si.value * simulation.time
+    assert np.isclose(simulation.x[0, 0], expected_x) == preserves_drift
+
+
 @pytest.mark.slow
 @given(st.integers(1, 10), st.integers(1, 10), st.integers(1, 10), st.integers(1, 10))
 @settings(deadline=2e4, max_examples=10)
@@ -315,6 +424,28 @@ def test_asynchronous_time_step(no_particles_on_grids_instantiated) -> None:
         simulation.load_particles(x, v, point_particle)
 
 
+def test_adaptive_time_step_local_resolution(
+    no_particles_on_grids_instantiated,
+) -> None:
+    coarse_grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    fine_grid = CartesianGrid([2, -1, -1] * u.m, [4, 1, 1] * u.m, num=21)
+
+    simulation = ParticleTracker(
+        [coarse_grid, fine_grid], no_particles_on_grids_instantiated
+    )
+    simulation.load_particles(
+        [[0, 0, 0], [3, 0, 0], [10, 0, 0]] * u.m,
+        [[1, 0, 0], [0, 1, 0], [0, 0, 2]] * u.m / u.s,
+        CustomParticle(1 * u.kg, 1 * u.C),
+    )
+
+    # Each particle is limited by the resolution of the grid it is on, and
+    # particles on no grid use the largest step of the fastest particle
+    zeros = np.zeros(3)
+    dt = simulation._adaptive_dt(zeros, zeros, zeros, zeros, zeros, zeros)
+    assert np.allclose(dt, [0.5, 0.05, 0.25])
+
+
 def test_asynchronous_time_step_error(
     memory_interval_save_routine_instantiated, no_particles_on_grids_instantiated
 ) -> None:
@@ -369,6 +500,34 @@ def test_nearest_neighbor_interpolation(
     simulation.run()
 
 
+def test_interpolate_grid_si_values(
+    time_elapsed_termination_condition_instantiated,
+) -> None:
+    """The push loop works with plain arrays in SI units."""
+    grid = CartesianGrid(-100 * u.cm, 100 * u.cm, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 2.0) * u.V / u.cm,
+        B_z=np.full(grid.shape, 5.0) * u.G,
+    )
+
+    simulation = ParticleTracker(
+        grid, time_elapsed_termination_condition_instantiated, dt=1e-3 * u.s
+    )
+    simulation.load_particles(
+        [[0, 0, 0], [0.1, 0.2, 0]] * u.m,
+        np.zeros((2, 3)) * u.m / u.s,
+        CustomParticle(1 * u.kg, 1e-6 * u.C),
+    )
+    simulation.run()
+
+    values = simulation._interpolate_grid()
+
+    assert not isinstance(values["E_x"], u.Quantity)
+    assert np.allclose(values["E_x"], 200)
+    assert np.allclose(values["B_z"], 5e-4)
+    assert np.allclose(values["E_y"], 0)
+
+
 def test_setup_adaptive_time_step(
     time_elapsed_termination_condition_instantiated,
 ) -> None:
@@ -453,6 +612,498 @@ def test_particle_tracker_stop_particles(request) -> None:
     assert np.isnan(simulation.x[0, :]).all()
 
 
+def test_particle_tracker_state_cache(
+    time_elapsed_termination_condition_instantiated,
+) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    simulation = ParticleTracker(
+        grid, time_elapsed_termination_condition_instantiated, dt=1e-2 * u.s
+    )
+    simulation.load_particles(
+        [[0, 0, 0], [0.5, 0, 0], [2, 0, 0]] * u.m,
+        [[1, 0, 0], [0, 2, 0], [0, 0, 3]] * u.m / u.s,
+        CustomParticle(1 * u.kg, 1 * u.C),
+    )
+
+    # The state is computed once and reused while the push loop is running
+    simulation._state_cache = {}
+    mask = simulation._tracked_particle_mask
+    assert simulation._tracked_particle_mask is mask
+    assert not mask.flags.writeable
+    assert simulation.nparticles_tracked == 3
+    assert simulation.vmax == 3
+    assert np.array_equal(simulation.on_any_grid, [True, True, False])
+
+    # Stopping particles invalidates the cached state
+    simulation._stop_particles([False, False, True])
+    assert simulation.nparticles_tracked == 2
+    assert simulation.vmax == 2
+
+    # Moving particles invalidates the state that depends on their positions
+    simulation.v[:2] *= 2
+    simulation.x[1] = [5, 0, 0]
+    simulation._invalidate_motion_state()
+    assert simulation.vmax == 4
+    assert np.array_equal(simulation.on_any_grid, [True, False, False])
+
+    # Outside of the push loop, the state is always recomputed
+    simulation._state_cache = None
+    assert simulation._tracked_particle_mask is not simulation._tracked_particle_mask
+
+
+@pytest.mark.parametrize("compaction", [False, True])
+def test_particle_tracker_fast_forward(compaction) -> None:
+    """
+    Test that fast-forwarded particles are saved and finish at the same
+    positions as if they had been pushed.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(B_z=np.full(grid.shape, 0.1) * u.T)
+
+    # Particles crossing the grid, and particles moving away from it
+    x = [[-2, 0, 0], [0, 0, 0], [2, 0, 0], [0, -2, 0]] * u.m
+    v = [[1, 0, 0], [0, 1, 0], [1, 1, 0], [0, -1, 0]] * u.m / u.s
+
+    results = []
+    for fast_forward in (False, True):
+        save_routine = IntervalSaveRoutine(0.5 * u.s)
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(5 * u.s),
+            save_routine,
+            dt=1e-2 * u.s,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        if fast_forward:
+            simulation.setup_fast_forward()
+        if compaction:
+            simulation.setup_compaction(interval=1)
+        simulation.run()
+        results.append((simulation, save_routine.results))
+
+    (reference, reference_results), (simulation, simulation_results) = results
+    assert np.isclose(simulation.time, reference.time)
+    assert np.allclose(simulation.x, reference.x)
+    assert np.allclose(simulation.v, reference.v)
+    assert simulation.nparticles_tracked == reference.nparticles_tracked
+    for key in ("time", "x", "v"):
+        assert u.allclose(simulation_results[key], reference_results[key])
+
+
+def test_particle_tracker_fast_forward_all_particles() -> None:
+    """
+    Test that the simulation ends early if every particle is fast-forwarded,
+    with the particles advanced to the termination time.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+
+    x = [[2, 0, 0], [0, 0, 3]] * u.m
+    v = [[1, 0, 0], [0, 0, 0]] * u.m / u.s
+
+    simulation = ParticleTracker(
+        grid, TimeElapsedTerminationCondition(5 * u.s), dt=1e-2 * u.s
+    )
+    simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+    simulation.setup_fast_forward()
+    simulation.run()
+
+    assert simulation.iteration_number == 1
+    assert simulation.time == 5
+    assert np.allclose(simulation.x, [[7, 0, 0], [0, 0, 3]])
+    assert simulation.nparticles_tracked == 2
+
+
+def test_particle_tracker_fast_forward_errors() -> None:
+    simulation = ParticleTracker(
+        ForceFreeFluxRopeFieldSource(ForceFreeFluxRope(1 * u.T, 1 / u.m)),
+        TimeElapsedTerminationCondition(5 * u.s),
+        dt=1e-2 * u.s,
+    )
+    with pytest.raises(ValueError, match="field sources"):
+        simulation.setup_fast_forward()
+
+    simulation = ParticleTracker(
+        CartesianGrid(-1 * u.m, 1 * u.m), TimeElapsedTerminationCondition(5 * u.s)
+    )
+    with pytest.raises(ValueError, match="positive integer"):
+        simulation.setup_fast_forward(interval=0)
+
+
+@pytest.mark.parametrize("field_weighting", ["trilinear", "tricubic"])
+def test_particle_tracker_polynomial_field_weighting(field_weighting) -> None:
+    """
+    Test that the polynomial field weightings push particles through
+    fields that vary linearly the same as volume averaged weighting.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=11)
+    x_grid = grid.grids[0].to_value(u.m)
+    grid.add_quantities(
+        B_z=(0.2 + 0.1 * x_grid) * u.T, E_y=(0.05 - 0.02 * x_grid) * u.V / u.m
+    )
+
+    x = rng.uniform(-0.3, 0.3, size=(5, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(5, 3)) * u.m / u.s
+
+    simulations = []
+    for weighting in ("volume averaged", field_weighting):
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(2 * u.s),
+            dt=1e-2 * u.s,
+            field_weighting=weighting,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation.run()
+        simulations.append(simulation)
+
+    reference, simulation = simulations
+    assert simulation.field_weighting == field_weighting
+    assert np.allclose(simulation.x, reference.x)
+    assert np.allclose(simulation.v, reference.v)
+
+
+def test_particle_tracker_compaction() -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 0.1) * u.V / u.m, B_z=np.full(grid.shape, 0.2) * u.T
+    )
+
+    nparticles = 20
+    x = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m / u.s
+    stopped = np.zeros(nparticles, dtype=bool)
+    stopped[::3] = True
+
+    results = []
+    for compaction in (False, True):
+        save_routine = IntervalSaveRoutine(0.1 * u.s)
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(0.5 * u.s),
+            save_routine,
+            dt=1e-2 * u.s,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation._stop_particles(stopped)
+        if compaction:
+            simulation.setup_compaction(interval=1)
+        simulation.run()
+        results.append((simulation, save_routine.results))
+
+    (reference, reference_results), (compacted, compacted_results) = results
+    assert compacted._particle_order is None
+    assert np.array_equal(compacted.x, reference.x)
+    assert np.array_equal(compacted.v, reference.v, equal_nan=True)
+    assert np.array_equal(compacted.entered_grid, reference.entered_grid)
+    for key in ("x", "v"):
+        assert u.allclose(
+            compacted_results[key], reference_results[key], equal_nan=True
+        )
+
+
+@pytest.mark.parametrize("with_grid", [False, True])
+def test_particle_tracker_field_sources(with_grid) -> None:
+    """
+    Test that field sources, alone or alongside grids, give the same
+    trajectories as an equivalent grid.
+    """
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(B_z=np.full(grid.shape, 0.2) * u.T)
+
+    # A flux rope with alpha = 0 has a uniform axial field
+    uniform_B = ForceFreeFluxRopeFieldSource(ForceFreeFluxRope(0.2 * u.T, 0 / u.m))
+    fields: AbstractFieldSource | list[CartesianGrid | AbstractFieldSource] = uniform_B
+
+    if with_grid:
+        E_x = np.full(grid.shape, 0.1) * u.V / u.m
+        grid.add_quantities(E_x=E_x)
+
+        E_grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+        E_grid.add_quantities(E_x=E_x)
+        fields = [E_grid, uniform_B]
+
+    x = rng.uniform(-0.1, 0.1, size=(5, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(5, 3)) * u.m / u.s
+
+    simulations = []
+    for grids in (grid, fields):
+        simulation = ParticleTracker(
+            grids, TimeElapsedTerminationCondition(0.5 * u.s), dt=1e-2 * u.s
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation.run()
+        simulations.append(simulation)
+
+    reference, simulation = simulations
+    assert simulation.num_grids == int(with_grid)
+    assert len(simulation.field_sources) == 1
+    assert np.allclose(simulation.x, reference.x)
+    assert np.allclose(simulation.v, reference.v)
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_particle_tracker_sharded_run(tmp_path, on_disk) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 0.1) * u.V / u.m, B_z=np.full(grid.shape, 0.2) * u.T
+    )
+
+    nparticles = 9
+    x = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m / u.s
+
+    results = []
+    for n_processes in (1, 2):
+        output_directory = None
+        if on_disk:
+            output_directory = tmp_path / str(n_processes)
+            output_directory.mkdir()
+
+        save_routine = IntervalSaveRoutine(0.1 * u.s, output_directory=output_directory)
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(0.5 * u.s),
+            save_routine,
+            dt=1e-2 * u.s,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation.run(n_processes=n_processes)
+        results.append((simulation, save_routine.results))
+
+    (reference, reference_results), (sharded, sharded_results) = results
+    assert sharded.iteration_number == reference.iteration_number
+    assert np.isclose(sharded.time, reference.time)
+    assert np.allclose(sharded.x, reference.x)
+    assert np.allclose(sharded.v, reference.v)
+    assert np.array_equal(sharded.entered_grid, reference.entered_grid)
+    for key in ("time", "x", "v"):
+        assert u.allclose(sharded_results[key], reference_results[key])
+
+    # The shards write the same files as a run in a single process
+    if on_disk:
+        reference_files = sorted(path.name for path in (tmp_path / "1").iterdir())
+        assert len(reference_files) > 1
+        assert sorted(path.name for path in (tmp_path / "2").iterdir()) == (
+            reference_files
+        )
+        for name in reference_files:
+            with (
+                h5py.File(tmp_path / "1" / name) as reference_file,
+                h5py.File(tmp_path / "2" / name) as sharded_file,
+            ):
+                for key in ("time", "x", "v"):
+                    assert np.allclose(sharded_file[key], reference_file[key])
+
+    # The grid quantities are only shared while the shards are running
+    assert grid._shared_memory is None
+
+    with pytest.raises(ValueError, match="at least one"):
+        sharded.run(n_processes=0)
+
+    # Each shard chooses its own adaptive time step, so would save at
+    # different times
+    adaptive = ParticleTracker(
+        grid, TimeElapsedTerminationCondition(0.5 * u.s), IntervalSaveRoutine(0.1 * u.s)
+    )
+    adaptive.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+    with pytest.raises(ValueError, match="adaptive time step"):
+        adaptive.run(n_processes=2)
+
+    shard_states = [{"nparticles": 2}, {"nparticles": 2}]
+    with pytest.raises(RuntimeError, match="different values of time"):
+        particle_tracker._merge_shard_entries("time", (0.1, 0.2), shard_states)
+
+
+@pytest.mark.parametrize("compaction", [False, True])
+def test_particle_tracker_checkpoint_resume(tmp_path, monkeypatch, compaction) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 0.1) * u.V / u.m, B_z=np.full(grid.shape, 0.2) * u.T
+    )
+
+    nparticles = 10
+    x = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(nparticles, 3)) * u.m / u.s
+    stopped = np.zeros(nparticles, dtype=bool)
+    stopped[::3] = True
+
+    def make_simulation():
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(0.5 * u.s),
+            IntervalSaveRoutine(0.1 * u.s),
+            dt=1e-2 * u.s,
+            verbose=False,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation._stop_particles(stopped)
+        if compaction:
+            simulation.setup_compaction(interval=1)
+        return simulation
+
+    reference = make_simulation()
+    reference.run()
+
+    # Interrupt a simulation which saves a checkpoint after every push
+    path = tmp_path / "checkpoint.pkl"
+    interrupted = make_simulation()
+    interrupted.setup_checkpoints(path, 1 * u.ns)
+
+    original_push = ParticleTracker._push
+
+    def interrupted_push(self) -> None:
+        if self.iteration_number == 20:
+            raise KeyboardInterrupt
+        original_push(self)
+
+    monkeypatch.setattr(ParticleTracker, "_push", interrupted_push)
+    with pytest.raises(KeyboardInterrupt):
+        interrupted.run()
+    monkeypatch.undo()
+
+    resumed = ParticleTracker.resume(path, grid)
+    assert resumed.iteration_number == 20
+    assert resumed.termination_condition is not None
+    assert resumed.termination_condition.tracker is resumed
+    assert resumed.save_routine.tracker is resumed
+    resumed.run()
+
+    assert resumed.iteration_number == reference.iteration_number
+    assert np.isclose(resumed.time, reference.time)
+    assert np.allclose(resumed.x, reference.x, equal_nan=True)
+    assert np.allclose(resumed.v, reference.v, equal_nan=True)
+    assert np.array_equal(resumed.entered_grid, reference.entered_grid)
+    for key in ("time", "x", "v"):
+        assert u.allclose(
+            resumed.save_routine.results[key],
+            reference.save_routine.results[key],
+            equal_nan=True,
+        )
+
+
+def test_particle_tracker_checkpoint_errors(tmp_path) -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    simulation = ParticleTracker(
+        grid, TimeElapsedTerminationCondition(1 * u.s), dt=1e-2 * u.s
+    )
+
+    with pytest.raises(ValueError, match="must be positive"):
+        simulation.setup_checkpoints(tmp_path / "checkpoint.pkl", 0 * u.s)
+
+    # A checkpoint of a simulation that has not started is resumed from the start
+    path = tmp_path / "checkpoint.pkl"
+    simulation.checkpoint(path)
+    resumed = ParticleTracker.resume(path, grid)
+    assert not resumed._resume_pending
+
+    class OtherTracker(ParticleTracker):
+        pass
+
+    with pytest.raises(TypeError, match="not a OtherTracker"):
+        OtherTracker.resume(path, grid)
+
+
+@pytest.mark.parametrize("track_memory", [False, True])
+def test_particle_tracker_profiling(track_memory) -> None:
+    grids = [
+        CartesianGrid(-1 * u.m, 1 * u.m, num=3),
+        CartesianGrid(0.5 * u.m, 1.5 * u.m, num=3),
+    ]
+    for grid in grids:
+        grid.add_quantities(B_z=np.full(grid.shape, 0.2) * u.T)
+
+    simulation = ParticleTracker(
+        grids,
+        TimeElapsedTerminationCondition(0.1 * u.s),
+        IntervalSaveRoutine(0.05 * u.s),
+        dt=1e-2 * u.s,
+        verbose=False,
+    )
+    simulation.load_particles(
+        [[0, 0, 0], [0.8, 0.8, 0.8]] * u.m,
+        [[0.1, 0, 0], [0, 0.1, 0]] * u.m / u.s,
+        CustomParticle(1 * u.kg, 1 * u.C),
+    )
+
+    with pytest.raises(RuntimeError, match="Profiling is not enabled"):
+        _ = simulation.profiling_report
+
+    steps = []
+    simulation.setup_profiling(
+        callback=lambda iteration, times: steps.append((iteration, times)),
+        track_memory=track_memory,
+    )
+    simulation.run()
+
+    report = simulation.profiling_report
+    phases = {
+        "grid lookup",
+        "interpolation (grid 0)",
+        "interpolation (grid 1)",
+        "time step",
+        "integrator",
+        "save",
+        "termination",
+    }
+    assert set(report) == phases
+    assert report["integrator"]["calls"] == simulation.iteration_number
+    assert np.isclose(sum(phase["fraction"] for phase in report.values()), 1)
+    assert report["integrator"]["time"].unit == u.s
+    assert ("peak_memory" in report["integrator"]) == track_memory
+
+    assert [iteration for iteration, _ in steps] == list(
+        range(1, simulation.iteration_number + 1)
+    )
+    assert set(steps[0][1]) == phases
+    assert np.isclose(
+        sum(times["integrator"] for _, times in steps),
+        report["integrator"]["time"].value,
+    )
+
+
+def test_particle_tracker_compact_particles() -> None:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    simulation = ParticleTracker(
+        grid, TimeElapsedTerminationCondition(1 * u.s), dt=1e-2 * u.s
+    )
+    x = np.arange(18.0).reshape(6, 3) * u.m
+    simulation.load_particles(x, np.ones((6, 3)) * u.m / u.s, "p+")
+    simulation.entered_grid = np.zeros(6, dtype=bool)
+
+    with pytest.raises(ValueError, match="positive integer"):
+        simulation.setup_compaction(interval=0)
+    simulation.setup_compaction(min_inactive_fraction=0.3)
+
+    simulation._stop_particles([True, False, False, False, False, False])
+
+    # Not enough particles have stopped to compact the arrays
+    simulation._compact_particles()
+    assert simulation._particle_order is None
+
+    simulation._stop_particles([False, False, True, False, True, False])
+    simulation._compact_particles()
+    assert simulation._n_active == 3
+    assert simulation._tracked_particle_index == slice(0, 3)
+    assert simulation.nparticles_tracked == 3
+    assert np.array_equal(simulation.x[:3, 0], [3, 9, 15])
+    assert u.allclose(simulation._in_original_order(simulation.x) * u.m, x)
+
+    # Particles after the active rows are never tracked
+    simulation._stop_particles([False, True, False, False, False, False])
+    assert np.array_equal(
+        simulation._tracked_particle_mask, [True, False, True, False, False, False]
+    )
+    simulation._compact_particles()
+    assert simulation._n_active == 2
+    assert np.array_equal(simulation.x[:2, 0], [3, 15])
+
+    simulation._restore_particle_order()
+    assert u.allclose(simulation.x * u.m, x)
+    assert np.array_equal(
+        simulation._tracked_particle_mask, [False, True, False, False, False, True]
+    )
+
+
 @pytest.mark.parametrize(
     ("kwargs", "expected_error", "match_string"),
     [
@@ -562,6 +1213,33 @@ def test_particle_tracker_Bethe_warning(
         simulation.run()
 
 
+def test_Bethe_stopping_power_table() -> None:
+    """
+    Test that the tabulated Bethe stopping power matches the summed
+    stopping powers of the grids, and that the table can be pickled.
+    """
+    I = [166, 300] * u.eV  # noqa: E741
+    table = particle_tracker._Bethe_stopping_power_table(I)
+
+    c = const.c.si.value
+    speeds = np.geomspace(1e7, 0.999 * c, 100)
+    proper_speeds = speeds / np.sqrt(1 - (speeds / c) ** 2)
+    expected = np.sum(
+        [
+            Bethe_stopping_lite(I_grid, np.array(1), speeds, 1)
+            for I_grid in I.to_value(u.J)
+        ],
+        axis=0,
+    )
+
+    unpickled_table = pickle.loads(pickle.dumps(table))  # noqa: S301
+    assert np.allclose(unpickled_table(proper_speeds), expected, rtol=1e-4)
+
+    # Arguments outside of the table are clamped to its ends
+    assert np.allclose(table(np.array([0, np.inf])), table._values[[0, -1]])
+    assert np.isnan(table(np.array([np.nan])))
+
+
 class TestParticleTrajectory:
     @staticmethod
     def laboratory_time_case_one(𝜏, vd, γd, ν):
@@ -3,13 +3,17 @@
 """
 
 import astropy.units as u
+import h5py
 import numpy as np
 import pytest
 
 from plasmapy.particles import CustomParticle
 from plasmapy.plasma.grids import CartesianGrid
 from plasmapy.simulation.particle_tracker.particle_tracker import ParticleTracker
-from plasmapy.simulation.particle_tracker.save_routines import IntervalSaveRoutine
+from plasmapy.simulation.particle_tracker.save_routines import (
+    HDF5StreamingSaveRoutine,
+    IntervalSaveRoutine,
+)
 from plasmapy.simulation.particle_tracker.termination_conditions import (
     NoParticlesOnGridsTerminationCondition,
     TimeElapsedTerminationCondition,
@@ -77,3 +81,168 @@ def test_interval_save_routine(request, stop_condition, save_routine) -> None:
     simulation.load_particles(x, v, point_particle)
 
     simulation.run()
+
+
+@pytest.mark.parametrize("n_processes", [1, 2])
+@pytest.mark.parametrize(
+    ("particles", "dtype", "compression"),
+    [
+        (None, np.float64, None),
+        (slice(None, None, 2), np.float32, "gzip"),
+        ([0, 3, 4], np.float64, "lzf"),
+    ],
+)
+def test_hdf5_streaming_save_routine(
+    tmp_path, particles, dtype, compression, n_processes
+) -> None:
+    rng = np.random.default_rng(seed=1)
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=3)
+    grid.add_quantities(
+        E_x=np.full(grid.shape, 0.1) * u.V / u.m, B_z=np.full(grid.shape, 0.2) * u.T
+    )
+    x = rng.uniform(-0.1, 0.1, size=(6, 3)) * u.m
+    v = rng.uniform(-0.1, 0.1, size=(6, 3)) * u.m / u.s
+
+    save_routines = [
+        IntervalSaveRoutine(0.1 * u.s),
+        HDF5StreamingSaveRoutine(
+            tmp_path / "results.h5",
+            0.1 * u.s,
+            particles=particles,
+            dtype=dtype,
+            compression=compression,
+        ),
+    ]
+    for save_routine in save_routines:
+        simulation = ParticleTracker(
+            grid,
+            TimeElapsedTerminationCondition(0.5 * u.s),
+            save_routine,
+            dt=1e-2 * u.s,
+            verbose=False,
+        )
+        simulation.load_particles(x, v, CustomParticle(1 * u.kg, 1 * u.C))
+        simulation.run(n_processes=n_processes)
+
+    reference, streamed = (save_routine.results for save_routine in save_routines)
+    selection = slice(None) if particles is None else particles
+    rtol = 1e-6 if dtype == np.float32 else 1e-12
+
+    assert u.allclose(streamed["time"], reference["time"])
+    for key in ("x", "v"):
+        assert streamed[key].dtype == dtype
+        assert u.allclose(streamed[key], reference[key][:, selection], rtol=rtol)
+
+    with h5py.File(tmp_path / "results.h5", "r") as output_file:
+        dataset = output_file["x"]
+        assert dataset.maxshape[0] is None
+        assert dataset.chunks is not None
+        assert dataset.compression == compression
+        assert dataset.attrs["unit"] == "m"
+
+
+def run_simulation(save_routine) -> ParticleTracker:
+    grid = CartesianGrid(-1 * u.m, 1 * u.m, num=2)
+    grid.add_quantities(E_x=np.full(grid.shape, 1) * u.V / u.m)
+
+    simulation = ParticleTracker(
+        grid,
+        TimeElapsedTerminationCondition(1 * u.s),
+        save_routine,
+        dt=1e-2 * u.s,
+        verbose=False,
+    )
+    simulation.load_particles(
+        [[0, 0, 0], [0, 0.1, 0]] * u.m,
+        [[0, 1, 0], [1, 0, 0]] * u.m / u.s,
+        CustomParticle(1 * u.kg, 1 * u.C),
+    )
+    simulation.run()
+    return simulation
+
+
+def test_asynchronous_save_routine(tmp_path) -> None:
+    directories = [tmp_path / "synchronous", tmp_path / "asynchronous"]
+    for directory, is_asynchronous in zip(directories, [False, True], strict=True):
+        directory.mkdir()
+        save_routine = IntervalSaveRoutine(
+            0.1 * u.s,
+            output_directory=directory,
+            asynchronous=is_asynchronous,
+            max_pending_writes=1,
+        )
+        run_simulation(save_routine)
+        assert save_routine._writer is None
+
+    synchronous, asynchronous = (
+        sorted(directory.iterdir()) for directory in directories
+    )
+    assert [path.name for path in synchronous] == [path.name for path in asynchronous]
+    for synchronous_path, asynchronous_path in zip(
+        synchronous, asynchronous, strict=True
+    ):
+        with (
+            h5py.File(synchronous_path) as synchronous_file,
+            h5py.File(asynchronous_path) as asynchronous_file,
+        ):
+            for key in ("time", "x", "v"):
+                assert np.array_equal(synchronous_file[key], asynchronous_file[key])
+
+
+def test_asynchronous_streaming_save_routine(tmp_path) -> None:
+    reference = IntervalSaveRoutine(0.1 * u.s)
+    run_simulation(reference)
+
+    save_routine = HDF5StreamingSaveRoutine(
+        tmp_path / "results.h5", 0.1 * u.s, asynchronous=True
+    )
+    run_simulation(save_routine)
+
+    for key in ("time", "x", "v"):
+        assert u.allclose(save_routine.results[key], reference.results[key])
+
+
+def test_asynchronous_save_routine_errors(tmp_path) -> None:
+    with pytest.raises(ValueError, match="at least one"):
+        IntervalSaveRoutine(0.1 * u.s, asynchronous=True, max_pending_writes=0)
+
+    # Errors raised while writing in the background are raised by the run
+    save_routine = IntervalSaveRoutine(
+        0.1 * u.s, output_directory=tmp_path / "missing", asynchronous=True
+    )
+    with pytest.raises(RuntimeError, match="Writing the output"):
+        run_simulation(save_routine)
+
+
+def test_asynchronous_save_routine_interrupted(tmp_path, monkeypatch) -> None:
+    """Saves queued before the simulation fails are still written."""
+    save_routine = IntervalSaveRoutine(
+        0.1 * u.s, output_directory=tmp_path, asynchronous=True
+    )
+    simulation = ParticleTracker(
+        CartesianGrid(-1 * u.m, 1 * u.m),
+        TimeElapsedTerminationCondition(1 * u.s),
+        save_routine,
+        dt=1e-2 * u.s,
+        verbose=False,
+    )
+    simulation.load_particles(
+        [[0, 0, 0]] * u.m, [[0, 1, 0]] * u.m / u.s, CustomParticle(1 * u.kg, 1 * u.C)
+    )
+
+    push = simulation._push
+
+    def interrupted_push() -> None:
+        if simulation.iteration_number == 50:
+            raise KeyboardInterrupt
+        push()
+
+    monkeypatch.setattr(simulation, "_push", interrupted_push)
+    with pytest.raises(KeyboardInterrupt):
+        simulation.run()
+
+    assert save_routine._writer is None
+    paths = sorted(tmp_path.iterdir())
+    assert len(paths) == 4
+    with h5py.File(paths[-1]) as output_file:
+        assert output_file["x"].shape == (4, 1, 3)